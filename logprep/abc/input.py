@@ -9,7 +9,7 @@ import zlib
 from abc import abstractmethod
 from functools import partial
 from hmac import HMAC
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 from attrs import define, field, validators
 
@@ -299,6 +299,16 @@ class Input(Connector):
     def batch_finished_callback(self):
         """Can be called by output connectors after processing a batch of one or more records."""
 
+    def get_checkpoint(self) -> Any:
+        """Returns the position of the records that have been handed out so far.
+        Output connectors that write asynchronously pass it to :code:`acknowledge` as soon as
+        everything they have received up to this position has been written."""
+        return None
+
+    def acknowledge(self, checkpoint: Any) -> None:
+        """Can be called by output connectors if all records up to a checkpoint that has been
+        returned by :code:`get_checkpoint` have been written."""
+
     def _add_env_enrichment_to_event(self, event: dict):
         """Add the env enrichment information to the event"""
         enrichments = self._config.preprocessing.get("enrich_by_env_variables")
@@ -3,7 +3,7 @@ New output endpoint types are created by implementing it.
 """
 
 from abc import abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from attrs import define, field, validators
 
@@ -90,6 +90,23 @@ class Output(Connector):
     def store_custom(self, document: dict, target: str):
         """Store additional data in a custom location inside the output destination."""
 
+    def store_custom_batch(self, documents: List[dict], target: str):
+        """Store multiple documents of additional data in the same custom location inside the
+        output destination.
+
+        Outputs that can write multiple documents at once should override this method.
+        By default, every document is stored via :code:`store_custom`.
+
+        Parameters
+        ----------
+        documents : List[dict]
+            Documents to store.
+        target : str
+            Custom location to store the documents in.
+        """
+        for document in documents:
+            self.store_custom(document, target)
+
     @abstractmethod
     def store_failed(self, error_message: str, document_received: dict, document_processed: dict):
         """Store an event when an error occurred during the processing."""
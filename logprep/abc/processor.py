@@ -280,6 +280,26 @@ class Processor(Component):
 
         """
 
+    def flush_extra_data(self, final: bool = False) -> list:
+        """Returns and removes extra data that the processor has held back independently of the
+        processed events, e.g. summaries of closed time windows. The pipeline stores it before
+        each event and before it shuts down.
+
+        Optional: Has to be implemented by processors that hold extra data back.
+
+        Parameters
+        ----------
+        final : bool
+            If True, the pipeline shuts down and all extra data that has been held back has to be
+            returned.
+
+        Returns
+        -------
+        list
+            Extra data in the format of :code:`ProcessorResult.data`.
+        """
+        return []
+
     @staticmethod
     def resolve_directories(rule_sources: list) -> list:
         """resolves directories to a list of files or rule definitions
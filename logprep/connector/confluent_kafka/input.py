@@ -29,6 +29,8 @@ Example
 """
 # pylint: enable=line-too-long
 import logging
+import time
+from collections import deque
 from functools import cached_property, partial
 from socket import getfqdn
 from types import MappingProxyType
@@ -237,13 +239,82 @@ class ConfluentKafkaInput(Input):
 
         """
 
+        consume_batch_size: int = field(
+            validator=[validators.instance_of(int), validators.ge(1)], default=1
+        )
+        """Maximum number of messages that are fetched from Kafka at once. If it is greater than
+        :code:`1`, messages are fetched in batches via :code:`Consumer.consume` and are handed out
+        one by one from a local buffer. The :code:`current_offsets` metric is then updated once
+        per batch and partition. Messages of revoked or lost partitions are removed from the
+        buffer. Defaults to :code:`1`, which fetches every message via :code:`Consumer.poll`.
+        """
+
+        offset_store_count: int = field(
+            validator=[validators.instance_of(int), validators.ge(1)], default=1
+        )
+        """Number of messages that have to be acknowledged by the output since the offsets were
+        stored last, before the offsets are stored again, and committed if
+        :code:`enable.auto.commit` is :code:`false`. Defaults to :code:`1`, which stores the
+        offsets on every acknowledgement. Has no effect if :code:`enable.auto.offset.store` is
+        :code:`true`.
+        """
+
+        offset_store_interval: Optional[float] = field(
+            validator=validators.optional([validators.instance_of((int, float)), validators.gt(0)]),
+            default=None,
+        )
+        """(Optional) Maximum number of seconds that acknowledged offsets are kept before they are
+        stored, even if less than :code:`offset_store_count` messages have been acknowledged.
+        Is also checked if no message has been received.
+
+        Outputs that write asynchronously, like the :code:`confluentkafka_output`, acknowledge
+        the messages as soon as they are written. So the offsets of messages are only stored
+        after their events have been written, which keeps the at-least-once semantics while
+        storing the offsets in batches.
+        """
+
     _last_valid_records: dict
+    """Last message per partition that has been handed out, but has not been acknowledged yet"""
+
+    _position: int
+    """Number of messages that have been handed out"""
 
-    __slots__ = ["_last_valid_records"]
+    _acknowledged_records: dict
+    """Last message per partition that has been acknowledged, but whose offset is not stored yet"""
+
+    _acknowledged_position: int
+
+    _stored_position: int
+
+    _last_offset_store: float
+
+    _messages: deque
+    """Messages that have been fetched from Kafka, but have not been handed out yet"""
+
+    _offset_labels: dict
+    """Metric labels of the current offsets per partition"""
+
+    __slots__ = [
+        "_last_valid_records",
+        "_position",
+        "_acknowledged_records",
+        "_acknowledged_position",
+        "_stored_position",
+        "_last_offset_store",
+        "_messages",
+        "_offset_labels",
+    ]
 
     def __init__(self, name: str, configuration: "Connector.Config") -> None:
         super().__init__(name, configuration)
         self._last_valid_records = {}
+        self._position = 0
+        self._acknowledged_records = {}
+        self._acknowledged_position = 0
+        self._stored_position = 0
+        self._last_offset_store = time.monotonic()
+        self._messages = deque()
+        self._offset_labels = {}
 
     @property
     def _kafka_config(self) -> dict:
@@ -389,10 +460,12 @@ class ConfluentKafkaInput(Input):
             Raises if an input is invalid or if it causes an error.
         """
         try:
-            message = self._consumer.poll(timeout=timeout)
+            message = self._get_next_message(timeout)
         except RuntimeError as error:
             raise FatalInputError(self, str(error)) from error
         if message is None:
+            if self._acknowledged_records and self._offsets_are_due():
+                self._store_offsets()
             return None
         kafka_error = message.error()
         if kafka_error:
@@ -400,10 +473,41 @@ class ConfluentKafkaInput(Input):
                 self, "A confluent-kafka record contains an error code", str(kafka_error)
             )
         self._last_valid_records[message.partition()] = message
-        labels = {"description": f"topic: {self._config.topic} - partition: {message.partition()}"}
-        self.metrics.current_offsets.add_with_labels(message.offset() + 1, labels)
+        self._position += 1
+        if self._config.consume_batch_size == 1:
+            self._set_current_offset(message.partition(), message.offset() + 1)
         return message.value()
 
+    def _get_next_message(self, timeout: float):
+        """Returns the next message from the local buffer or from Kafka. The buffer is only
+        refilled if it is empty, so messages are handed out in the order they were fetched."""
+        if self._config.consume_batch_size == 1:
+            return self._consumer.poll(timeout=timeout)
+        if not self._messages:
+            messages = self._consumer.consume(
+                num_messages=self._config.consume_batch_size, timeout=timeout
+            )
+            self._messages.extend(messages)
+            self._set_current_offsets(messages)
+        if not self._messages:
+            return None
+        return self._messages.popleft()
+
+    def _set_current_offsets(self, messages: list) -> None:
+        next_offsets = {}
+        for message in messages:
+            if message.error() is None:
+                next_offsets[message.partition()] = message.offset() + 1
+        for partition, offset in next_offsets.items():
+            self._set_current_offset(partition, offset)
+
+    def _set_current_offset(self, partition: int, offset: int) -> None:
+        labels = self._offset_labels.get(partition)
+        if labels is None:
+            labels = {"description": f"topic: {self._config.topic} - partition: {partition}"}
+            self._offset_labels[partition] = labels
+        self.metrics.current_offsets.add_with_labels(offset, labels)
+
     def _get_event(self, timeout: float) -> Union[Tuple[None, None], Tuple[dict, dict]]:
         """Parse the raw document from Kafka into a json.
 
@@ -428,17 +532,31 @@ class ConfluentKafkaInput(Input):
         if raw_event is None:
             return None, None
         try:
-            event_dict = self._decoder.decode(raw_event.decode("utf-8"))
+            event_dict = self._decoder.decode(raw_event)
         except UnicodeDecodeError as error:
             raise CriticalInputParsingError(
                 self, "Input record value is not 'utf-8' encoded", str(raw_event)
             ) from error
         except msgspec.DecodeError as error:
+            if not self._is_utf8(raw_event):
+                raise CriticalInputParsingError(
+                    self, "Input record value is not 'utf-8' encoded", str(raw_event)
+                ) from error
             raise CriticalInputParsingError(
                 self, "Input record value is not a valid json string", raw_event
             ) from error
         return event_dict, raw_event
 
+    @staticmethod
+    def _is_utf8(raw_event: bytes) -> bool:
+        """msgspec validates UTF-8 only inside of strings, so invalid bytes outside of strings
+        are reported as invalid json."""
+        try:
+            raw_event.decode("utf-8")
+        except UnicodeDecodeError:
+            return False
+        return True
+
     @property
     def _enable_auto_offset_store(self) -> bool:
         return self._config.kafka_config.get("enable.auto.offset.store") == "true"
@@ -448,19 +566,58 @@ class ConfluentKafkaInput(Input):
         return self._config.kafka_config.get("enable.auto.commit") == "true"
 
     def batch_finished_callback(self) -> None:
-        """Store offsets for each kafka partition in `self._last_valid_records`
-        and if configured commit them. Should be called by output connectors if
+        """Acknowledge all messages that have been handed out. Their offsets are stored and if
+        configured committed as soon as :code:`offset_store_count` or
+        :code:`offset_store_interval` is reached. Should be called by output connectors if
         they are finished processing a batch of records.
         """
         if self._enable_auto_offset_store:
             return
+        self.acknowledge(self.get_checkpoint())
+        self._last_valid_records.clear()
+
+    def get_checkpoint(self) -> Tuple[int, dict]:
+        """Returns the number of messages that have been handed out and the last of these
+        messages per partition, whose offsets have not been acknowledged yet."""
+        return self._position, dict(self._last_valid_records)
+
+    def acknowledge(self, checkpoint: Optional[Tuple[int, dict]]) -> None:
+        """Marks the messages up to the checkpoint as written. Their offsets are stored and if
+        configured committed as soon as :code:`offset_store_count` or
+        :code:`offset_store_interval` is reached.
+
+        Parameters
+        ----------
+        checkpoint : Optional[Tuple[int, dict]]
+            A checkpoint that has been returned by :code:`get_checkpoint`.
+        """
+        if self._enable_auto_offset_store or checkpoint is None:
+            return
+        position, records = checkpoint
+        self._acknowledged_records.update(records)
+        self._acknowledged_position = max(self._acknowledged_position, position)
+        if self._offsets_are_due():
+            self._store_offsets()
+
+    def _offsets_are_due(self) -> bool:
+        if self._acknowledged_position - self._stored_position >= self._config.offset_store_count:
+            return True
+        interval = self._config.offset_store_interval
+        return interval is not None and time.monotonic() - self._last_offset_store >= interval
+
+    def _store_offsets(self) -> None:
+        """Store the offsets of all acknowledged messages and if configured commit them."""
+        if not self._acknowledged_records:
+            return
         self._handle_offsets(self._consumer.store_offsets)
         if not self._enable_auto_commit:
             self._handle_offsets(self._consumer.commit)
-        self._last_valid_records.clear()
+        self._acknowledged_records.clear()
+        self._stored_position = self._acknowledged_position
+        self._last_offset_store = time.monotonic()
 
     def _handle_offsets(self, offset_handler: Callable) -> None:
-        for message in self._last_valid_records.values():
+        for message in self._acknowledged_records.values():
             try:
                 offset_handler(message=message)
             except KafkaException as error:
@@ -482,7 +639,14 @@ class ConfluentKafkaInput(Input):
             self.metrics.committed_offsets.add_with_labels(offset, labels)
             self.metrics.current_offsets.add_with_labels(offset, labels)
 
+    def _remove_buffered_messages(self, topic_partitions: list[TopicPartition]) -> None:
+        partitions = {topic_partition.partition for topic_partition in topic_partitions}
+        self._messages = deque(
+            message for message in self._messages if message.partition() not in partitions
+        )
+
     def _revoke_callback(self, consumer, topic_partitions):
+        self._remove_buffered_messages(topic_partitions)
         for topic_partition in topic_partitions:
             self.metrics.number_of_warnings += 1
             logger.warning(
@@ -491,10 +655,18 @@ class ConfluentKafkaInput(Input):
                 topic_partition.topic,
                 topic_partition.partition,
             )
-        self.output_connector._write_backlog()
-        self.batch_finished_callback()
+        try:
+            self.output_connector._write_backlog()
+        finally:
+            # only events acknowledged by the output are stored, the messages of all other
+            # handed out events are consumed again by the new owner of the partitions
+            self._store_offsets()
 
     def _lost_callback(self, consumer, topic_partitions):
+        self._remove_buffered_messages(topic_partitions)
+        for topic_partition in topic_partitions:
+            self._last_valid_records.pop(topic_partition.partition, None)
+            self._acknowledged_records.pop(topic_partition.partition, None)
         for topic_partition in topic_partitions:
             self.metrics.number_of_warnings += 1
             logger.warning(
@@ -505,9 +677,16 @@ class ConfluentKafkaInput(Input):
             )
 
     def shut_down(self) -> None:
-        """Close consumer, which also commits kafka offsets."""
-        self._consumer.close()
-        super().shut_down()
+        """Write the backlog of the output, store the offsets of the acknowledged messages and
+        close the consumer, which also commits kafka offsets. The offsets of the acknowledged
+        messages are stored even if the backlog of the output could not be written."""
+        try:
+            if getattr(self, "output_connector", None) is not None:
+                self.output_connector._write_backlog()
+        finally:
+            self._store_offsets()
+            self._consumer.close()
+            super().shut_down()
 
     def health(self) -> bool:
         """Check the health of the component.
@@ -17,6 +17,8 @@ Example
         error_topic: my_error_topic
         flush_timeout: 0.2
         send_timeout: 0
+        messages_per_poll: 100
+        max_buffer_retries: 3
         kafka_config:
             bootstrap.servers: "127.0.0.1:9200,127.0.0.1:9200"
             compression.type: gzip
@@ -26,17 +28,18 @@ Example
 
 import json
 import logging
+from collections import deque
 from datetime import datetime
 from functools import cached_property, partial
 from socket import getfqdn
 from types import MappingProxyType
-from typing import Optional
+from typing import Any, List, Optional
 
 from attrs import define, field, validators
 from confluent_kafka import KafkaException, Producer
 
 from logprep.abc.output import CriticalOutputError, FatalOutputError, Output
-from logprep.metrics.metrics import GaugeMetric, Metric
+from logprep.metrics.metrics import CounterMetric, GaugeMetric, Metric
 from logprep.util.validators import keys_in_validator
 
 DEFAULTS = {
@@ -53,6 +56,24 @@ DEFAULT_RETURN = 0
 logger = logging.getLogger("KafkaOutput")
 
 
+class _PendingEvent:
+    """Messages of a stored event that have not been delivered yet, the checkpoint of the
+    input connector after the event has been stored and the error of a failed delivery."""
+
+    __slots__ = ("deliveries", "checkpoint", "error")
+
+    deliveries: int
+
+    checkpoint: Any
+
+    error: Optional[KafkaException]
+
+    def __init__(self):
+        self.deliveries = 0
+        self.checkpoint = None
+        self.error = None
+
+
 class ConfluentKafkaOutput(Output):
     """A kafka connector that serves as output connector."""
 
@@ -141,6 +162,27 @@ class ConfluentKafkaOutput(Output):
         )
         """Total number of message bytes (including framing, such as per-Message framing and
         MessageSet/batch framing) transmitted to Kafka brokers"""
+        delivery_success: CounterMetric = field(
+            factory=lambda: CounterMetric(
+                description="count of successfully delivered messages.",
+                name="confluent_kafka_output_delivery_success",
+            )
+        )
+        """count of successfully delivered messages. Is filled by `_delivery_callback`"""
+        delivery_failures: CounterMetric = field(
+            factory=lambda: CounterMetric(
+                description="count of messages that could not be delivered.",
+                name="confluent_kafka_output_delivery_failures",
+            )
+        )
+        """count of messages that could not be delivered. Is filled by `_delivery_callback`"""
+        buffer_retries: CounterMetric = field(
+            factory=lambda: CounterMetric(
+                description="count of retried messages because the producer queue was full.",
+                name="confluent_kafka_output_buffer_retries",
+            )
+        )
+        """count of retried messages because the producer queue was full."""
 
     @define(kw_only=True, slots=False)
     class Config(Output.Config):
@@ -152,6 +194,23 @@ class ConfluentKafkaOutput(Output):
         """The topic into which events should be written that couldn't be processed successfully."""
         flush_timeout: float
         send_timeout: int = field(validator=validators.instance_of(int), default=0)
+        messages_per_poll: int = field(
+            validator=[validators.instance_of(int), validators.ge(1)], default=1
+        )
+        """Number of produced messages after which the delivery reports are served via
+        :code:`Producer.poll` with the :code:`send_timeout`. Messages are produced asynchronously
+        and their delivery reports update the delivery metrics and acknowledge the events to the
+        input connector, so polling less often only delays these reports. Delivery reports are
+        also served every :code:`flush_timeout` seconds, so the last events are acknowledged if
+        no further events are stored. Defaults to :code:`1`, which polls after every message."""
+        max_buffer_retries: int = field(
+            validator=[validators.instance_of(int), validators.ge(0)], default=3
+        )
+        """Number of retries to produce a message if the producer queue is full. Before every
+        retry, delivery reports are served for at most :code:`flush_timeout` seconds to free the
+        queue. If the queue is still full, a :code:`FatalOutputError` is raised, which stops the
+        pipeline without acknowledging the document to the input connector.
+        Defaults to :code:`3`."""
         kafka_config: Optional[MappingProxyType] = field(
             validator=[
                 validators.instance_of(MappingProxyType),
@@ -177,6 +236,20 @@ class ConfluentKafkaOutput(Output):
 
         """
 
+    _pending_events: deque
+    """Events whose messages have not all been delivered yet. The last one is the event that is
+    currently stored."""
+
+    _unpolled_messages: int
+    """Number of messages that have been produced since the last poll"""
+
+    __slots__ = ["_pending_events", "_unpolled_messages"]
+
+    def __init__(self, name: str, configuration: "Output.Config") -> None:
+        super().__init__(name, configuration)
+        self._pending_events = deque([_PendingEvent()])
+        self._unpolled_messages = 0
+
     @property
     def _kafka_config(self) -> dict:
         """Get the kafka configuration.
@@ -250,20 +323,100 @@ class ConfluentKafkaOutput(Output):
 
     def store(self, document: dict) -> Optional[bool]:
         """Store a document in the producer topic.
+        The event is acknowledged to the input connector as soon as its messages and the messages
+        of all previous events have been delivered.
+
+        Raises
+        ------
+        FatalOutputError
+            If a message of a previous event could not be delivered.
 
         Parameters
         ----------
         document : dict
            Document to store.
-
-        Returns
-        -------
-        Returns True to inform the pipeline to call the batch_finished_callback method in the
-        configured input
         """
         self.store_custom(document, self._config.topic)
+        self._finish_event()
+
+    def _produce(self, target: str, value: bytes) -> None:
+        """Produce a message asynchronously. If the producer queue is full, delivery reports are
+        served to free the queue and producing is retried up to :code:`max_buffer_retries` times.
+
+        Raises
+        ------
+        BufferError
+            If the producer queue is still full after all retries.
+        """
+        event = self._pending_events[-1]
+        on_delivery = partial(self._delivery_callback, event)
+        retries = 0
+        while True:
+            try:
+                self._producer.produce(target, value=value, on_delivery=on_delivery)
+                break
+            except BufferError:
+                if retries == self._config.max_buffer_retries:
+                    raise
+                retries += 1
+                self.metrics.buffer_retries += 1
+                self._producer.poll(self._config.flush_timeout)
+                self._unpolled_messages = 0
+        event.deliveries += 1
+
+    def _poll(self, produced_messages: int = 1) -> None:
+        """Serve delivery reports once :code:`messages_per_poll` messages have been produced."""
+        self._unpolled_messages += produced_messages
+        if self._unpolled_messages >= self._config.messages_per_poll:
+            self._producer.poll(self._config.send_timeout)
+            self._unpolled_messages = 0
+
+    def _delivery_callback(self, event: _PendingEvent, error: Optional[KafkaException], message):
+        """Callback for delivery reports of produced messages. This callback is served upon
+        calling producer.poll() or producer.flush(). A failed delivery keeps the event and all
+        following events from being acknowledged."""
+        event.deliveries -= 1
+        if error is None:
+            self.metrics.delivery_success += 1
+            return
+        if event.error is None:
+            event.error = error
+        self.metrics.delivery_failures += 1
+        self.metrics.number_of_errors += 1
+        logger.error(
+            "%s: Could not deliver message to topic %s: %s", self.describe(), message.topic(), error
+        )
+
+    def _finish_event(self) -> None:
+        """Remember the checkpoint of the input connector after the current event has been
+        stored and start the next event."""
         if self.input_connector:
-            self.input_connector.batch_finished_callback()
+            self._pending_events[-1].checkpoint = self.input_connector.get_checkpoint()
+        self._pending_events.append(_PendingEvent())
+        self._acknowledge_delivered_events()
+
+    def _acknowledge_delivered_events(self) -> None:
+        """Acknowledge the checkpoint of the last event of which all messages and all messages
+        of previous events have been delivered.
+
+        Raises
+        ------
+        FatalOutputError
+            If a message of the oldest unacknowledged event could not be delivered. Its checkpoint
+            and the checkpoints of all following events are never acknowledged.
+        """
+        pending_events = self._pending_events
+        checkpoint, delivered = None, False
+        while (
+            len(pending_events) > 1
+            and not pending_events[0].deliveries
+            and pending_events[0].error is None
+        ):
+            checkpoint, delivered = pending_events.popleft().checkpoint, True
+        if delivered and self.input_connector:
+            self.input_connector.acknowledge(checkpoint)
+        if pending_events[0].error is not None:
+            raise FatalOutputError(self, f"Could not deliver message -> {pending_events[0].error}")
 
     @Metric.measure_time()
     def store_custom(self, document: dict, target: str) -> None:
@@ -278,21 +431,57 @@ class ConfluentKafkaOutput(Output):
         Raises
         ------
         CriticalOutputError
-            Raises if any error except a BufferError occurs while writing into Kafka.
+            Raises if any error occurs while writing into Kafka.
+        FatalOutputError
+            Raises if the producer queue is still full after :code:`max_buffer_retries` retries.
 
         """
         try:
-            self._producer.produce(target, value=self._encoder.encode(document))
-            self._producer.poll(self._config.send_timeout)
+            self._produce(target, self._encoder.encode(document))
+            self._poll()
             self.metrics.number_of_processed_events += 1
-        except BufferError:
-            # block program until buffer is empty
-            self._producer.flush(timeout=self._config.flush_timeout)
+        except BufferError as error:
+            raise FatalOutputError(
+                self, f"Producer queue is full, could not store output document: {document}"
+            ) from error
         except BaseException as error:
             raise CriticalOutputError(
                 self, f"Error storing output document -> {error}", document
             ) from error
 
+    @Metric.measure_time()
+    def store_custom_batch(self, documents: List[dict], target: str) -> None:
+        """Write documents to Kafka into target topic and count them for the next poll at once
+        instead of per document.
+
+        Parameters
+        ----------
+        documents : List[dict]
+            Documents to be stored in target topic.
+        target : str
+            Topic to store documents in.
+        Raises
+        ------
+        CriticalOutputError
+            Raises if any error occurs while writing into Kafka.
+        FatalOutputError
+            Raises if the producer queue is still full after :code:`max_buffer_retries` retries.
+
+        """
+        for document in documents:
+            try:
+                self._produce(target, self._encoder.encode(document))
+                self.metrics.number_of_processed_events += 1
+            except BufferError as error:
+                raise FatalOutputError(
+                    self, f"Producer queue is full, could not store output document: {document}"
+                ) from error
+            except BaseException as error:
+                raise CriticalOutputError(
+                    self, f"Error storing output document -> {error}", document
+                ) from error
+        self._poll(len(documents))
+
     @Metric.measure_time()
     def store_failed(
         self, error_message: str, document_received: dict, document_processed: dict
@@ -308,6 +497,11 @@ class ConfluentKafkaOutput(Output):
         document_processed : dict
             Document after processing until an error occurred.
 
+        Raises
+        ------
+        FatalOutputError
+            Raises if the producer queue is still full after :code:`max_buffer_retries` retries.
+
         """
         self.metrics.number_of_failed_events += 1
         value = {
@@ -317,14 +511,27 @@ class ConfluentKafkaOutput(Output):
             "timestamp": str(datetime.now()),
         }
         try:
-            self._producer.produce(
+            self._produce(
                 self._config.error_topic,
-                value=json.dumps(value, separators=(",", ":")).encode("utf-8"),
+                json.dumps(value, separators=(",", ":")).encode("utf-8"),
             )
-            self._producer.poll(self._config.send_timeout)
-        except BufferError:
-            # block program until buffer is empty
-            self._producer.flush(timeout=self._config.flush_timeout)
+            self._poll()
+        except BufferError as error:
+            raise FatalOutputError(
+                self, f"Producer queue is full, could not store failed event: {value}"
+            ) from error
+
+    def _serve_delivery_reports(self) -> None:
+        """Serve the available delivery reports and acknowledge the delivered events, so events
+        are acknowledged even if no further events are stored."""
+        self._producer.poll(0)
+        self._unpolled_messages = 0
+        self._acknowledge_delivered_events()
+
+    def _write_backlog(self) -> None:
+        """Wait for the delivery of all produced messages and acknowledge the delivered events."""
+        self._producer.flush(self._config.flush_timeout)
+        self._acknowledge_delivered_events()
 
     def shut_down(self) -> None:
         """ensures that all messages are flushed"""
@@ -347,3 +554,4 @@ class ConfluentKafkaOutput(Output):
             super().setup()
         except KafkaException as error:
             raise FatalOutputError(self, f"Could not setup kafka producer: {error}") from error
+        self._schedule_task(task=self._serve_delivery_reports, seconds=self._config.flush_timeout)
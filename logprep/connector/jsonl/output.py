@@ -20,6 +20,7 @@ Example
 
 import json
 from logging import Logger
+from typing import List
 
 from attrs import define, field, validators
 
@@ -76,6 +77,12 @@ class JsonlOutput(Output):
         with open(filepath, "a+", encoding="utf8") as file:
             file.write(f"{json.dumps(line)}\n")
 
+    @staticmethod
+    def _write_json_lines(filepath: str, lines: List[dict]):
+        """writes processed documents to configured file"""
+        with open(filepath, "a+", encoding="utf8") as file:
+            file.writelines(f"{json.dumps(line)}\n" for line in lines)
+
     def store(self, document: dict):
         self.events.append(document)
         JsonlOutput._write_json(self._config.output_file, document)
@@ -91,6 +98,14 @@ class JsonlOutput(Output):
             JsonlOutput._write_json(self._config.output_file_custom, document)
         self.metrics.number_of_processed_events += 1
 
+    def store_custom_batch(self, documents: List[dict], target: str):
+        documents = [{target: document} for document in documents]
+        self.events.extend(documents)
+
+        if self._config.output_file_custom:
+            JsonlOutput._write_json_lines(self._config.output_file_custom, documents)
+        self.metrics.number_of_processed_events += len(documents)
+
     def store_failed(self, error_message: str, document_received: dict, document_processed: dict):
         self.metrics.number_of_failed_events += 1
         self.failed_events.append((error_message, document_received, document_processed))
@@ -10,6 +10,9 @@ The documents desired index is the field :code:`_index` in the document. It is d
 If you want to send documents to data streams, you have to set the field :code:`_op_type: create` in
 the document.
 
+Documents are serialized into the action and source lines of the bulk request as soon as they are
+stored. The action line is serialized only once per operation type and index.
+
 Example
 ^^^^^^^
 ..  code-block:: yaml
@@ -23,6 +26,8 @@ Example
         default_index: default_index
         error_index: error_index
         message_backlog_size: 10000
+        message_backlog_size_mb: 50
+        compress_requests: true
         timeout: 10000
         max_retries:
         user:
@@ -35,9 +40,12 @@ import logging
 import random
 import re
 import ssl
+import threading
 import time
-from functools import cached_property
-from typing import List, Optional, Tuple, Union
+from collections import deque
+from functools import cached_property, lru_cache
+from queue import SimpleQueue
+from typing import Any, List, Optional, Tuple, Union
 
 import opensearchpy as search
 from attrs import define, field, validators
@@ -51,6 +59,69 @@ from logprep.util.time import TimeParser
 
 logger = logging.getLogger("OpenSearchOutput")
 
+_BULK_META_FIELDS = frozenset(
+    (
+        "_id",
+        "_source",
+        "_if_seq_no",
+        "_if_primary_term",
+        "_parent",
+        "_percolate",
+        "_retry_on_conflict",
+        "_routing",
+        "_timestamp",
+        "_version",
+        "_version_type",
+        "if_seq_no",
+        "if_primary_term",
+        "parent",
+        "pipeline",
+        "retry_on_conflict",
+        "routing",
+        "version",
+        "version_type",
+    )
+)
+"""Fields besides :code:`_index` and :code:`_op_type` that are moved into the action line by
+:code:`opensearchpy.helpers.expand_action`"""
+
+
+@lru_cache(maxsize=1024)
+def _get_action_line(op_type: str, index: str) -> Tuple[str, int]:
+    """Returns the serialized bulk action for the operation type and index and its size in
+    bytes."""
+    action = json.dumps({op_type: {"_index": index}}, separators=(",", ":"))
+    return action, len(action.encode("utf-8"))
+
+
+def _expand_action(action: Union[dict, Tuple[str, Optional[str]]]) -> Tuple:
+    """Passes serialized documents of the backlog as they are to the bulk helpers of opensearchpy
+    and expands unserialized documents like error documents."""
+    if isinstance(action, tuple):
+        return action
+    return helpers.expand_action(action)
+
+
+class _PendingBulk:
+    """A backlog that is written by a background bulk writer and the checkpoint of the input
+    connector at the time the backlog has been handed over."""
+
+    __slots__ = ("messages", "checkpoint", "done", "error")
+
+    messages: List[dict]
+
+    checkpoint: Any
+
+    done: threading.Event
+
+    error: Optional[Exception]
+
+    def __init__(self, messages: List[dict], checkpoint: Any):
+        self.messages = messages
+        self.checkpoint = checkpoint
+        self.done = threading.Event()
+        self.error = None
+
 
 class MSGPECSerializer(JSONSerializer):
     """A MSGPEC serializer"""
@@ -105,6 +176,17 @@ class OpensearchOutput(Output):
         """Index to write documents to that could not be processed."""
         message_backlog_size: int = field(validator=validators.instance_of(int))
         """Amount of documents to store before sending them."""
+        message_backlog_size_mb: Optional[Union[float, int]] = field(
+            validator=validators.optional(validators.instance_of((float, int))),
+            converter=(lambda x: x * 10**6 if x else None),
+            default=None,
+        )
+        """(Optional) Size of the serialized documents in MB to store before sending them,
+        even if :code:`message_backlog_size` is not reached. The size is the exact size of the
+        documents in the bulk request."""
+        compress_requests: bool = field(default=False, validator=validators.instance_of(bool))
+        """(Optional) Compress the bulk requests with gzip. Requires that http compression is
+        enabled in Opensearch, which is the default. (Default: :code:`False`)"""
         maximum_message_size_mb: Optional[Union[float, int]] = field(
             validator=validators.optional(validators.instance_of((float, int))),
             converter=(lambda x: x * 10**6 if x else None),
@@ -148,13 +230,56 @@ class OpensearchOutput(Output):
             default=["green"], validator=validators.instance_of(list)
         )
         """Desired cluster status for health check as list of strings. Default is ["green"]"""
-
-    __slots__ = ["_message_backlog", "_size_error_pattern"]
+        bulk_writer_threads: int = field(
+            default=0, validator=[validators.instance_of(int), validators.ge(0)]
+        )
+        """(Optional) Number of background threads that write the message backlog to Opensearch.
+        If it is greater than :code:`0`, a full or flushed backlog is handed over to these threads
+        and the pipeline continues to process events while the bulk requests are sent. The input
+        connector is informed about the written events only after their bulk request has been
+        completed. Errors of a bulk request are raised on the next store or flush. After a bulk
+        request has failed, the events of later bulk requests are not acknowledged either and the
+        error is raised again on every following store or flush.
+        Defaults to :code:`0`, which writes the backlog synchronously."""
+        max_pending_bulks: int = field(
+            default=2, validator=[validators.instance_of(int), validators.ge(1)]
+        )
+        """(Optional) Maximum number of backlogs that have been handed over to the background
+        bulk writers, but have not been written yet. If it is reached, handing over the next
+        backlog blocks until the oldest backlog has been written. Only used if
+        :code:`bulk_writer_threads` is greater than :code:`0`. Defaults to :code:`2`."""
+
+    __slots__ = [
+        "_message_backlog",
+        "_message_backlog_bytes",
+        "_size_error_pattern",
+        "_pending_bulks",
+        "_bulk_queue",
+        "_bulk_writers",
+        "_bulk_error",
+    ]
 
     _message_backlog: List
+    """Serialized action and source lines of the stored documents. Unserialized documents are
+    written as well."""
+
+    _message_backlog_bytes: int
+    """Size of the serialized documents in the backlog in bytes"""
 
     _size_error_pattern: re.Pattern[str]
 
+    _pending_bulks: deque
+    """Backlogs that have been handed over to the bulk writers in the order they were handed over,
+    until they have been acknowledged to the input connector"""
+
+    _bulk_queue: SimpleQueue
+
+    _bulk_writers: List[threading.Thread]
+
+    _bulk_error: Optional[Exception]
+    """Error of the first failed bulk request of the bulk writers. Once it is set, no further
+    checkpoint is acknowledged to the input connector."""
+
     @cached_property
     def ssl_context(self) -> ssl.SSLContext:
         """Returns the ssl context
@@ -205,6 +330,7 @@ class OpensearchOutput(Output):
             ssl_context=self.ssl_context,
             timeout=self._config.timeout,
             serializer=MSGPECSerializer(self),
+            http_compress=self._config.compress_requests,
         )
 
     @cached_property
@@ -214,16 +340,46 @@ class OpensearchOutput(Output):
     def __init__(self, name: str, configuration: "OpensearchOutput.Config"):
         super().__init__(name, configuration)
         self._message_backlog = []
+        self._message_backlog_bytes = 0
         self._size_error_pattern = re.compile(
             r".*coordinating_operation_bytes=(?P<size>\d+), "
             r"max_coordinating_and_primary_bytes=(?P<max_size>\d+).*"
         )
+        self._pending_bulks = deque()
+        self._bulk_queue = SimpleQueue()
+        self._bulk_writers = []
+        self._bulk_error = None
 
     def setup(self):
         super().setup()
         flush_timeout = self._config.flush_timeout
+        if self._config.bulk_writer_threads:
+            self._start_bulk_writers()
+            self._schedule_task(task=self._hand_over_backlog, seconds=flush_timeout)
+            return
         self._schedule_task(task=self._write_backlog, seconds=flush_timeout)
 
+    def _start_bulk_writers(self):
+        for index in range(self._config.bulk_writer_threads):
+            bulk_writer = threading.Thread(
+                target=self._run_bulk_writer, name=f"{self.name}-bulk-writer-{index}", daemon=True
+            )
+            bulk_writer.start()
+            self._bulk_writers.append(bulk_writer)
+
+    def shut_down(self):
+        """Wait for the backlogs that have been handed over to the bulk writers and stop them."""
+        try:
+            if self._bulk_writers:
+                self._wait_for_pending_bulks()
+        finally:
+            for _ in self._bulk_writers:
+                self._bulk_queue.put(None)
+            for bulk_writer in self._bulk_writers:
+                bulk_writer.join()
+            self._bulk_writers.clear()
+            super().shut_down()
+
     def describe(self) -> str:
         """Get name of Opensearch endpoint with the host.
 
@@ -254,7 +410,7 @@ class OpensearchOutput(Output):
 
         self._add_dates(document)
         self.metrics.number_of_processed_events += 1
-        self._message_backlog.append(document)
+        self._add_to_backlog(document)
         self._write_to_search_context()
 
     def store_custom(self, document: dict, target: str):
@@ -280,7 +436,23 @@ class OpensearchOutput(Output):
         document["_index"] = target
         self._add_dates(document)
         self.metrics.number_of_processed_events += 1
-        self._message_backlog.append(document)
+        self._add_to_backlog(document)
+
+    def store_custom_batch(self, documents: List[dict], target: str):
+        """Store documents into backlog to be written into Opensearch with the target index.
+
+        Parameters
+        ----------
+        documents : List[dict]
+            Documents to be stored into the target index.
+        target : str
+            Index to store the documents in.
+        """
+        for document in documents:
+            document["_index"] = target
+            self._add_dates(document)
+            self._add_to_backlog(document)
+        self.metrics.number_of_processed_events += len(documents)
 
     def store_failed(self, error_message: str, document_received: dict, document_processed: dict):
         """Write errors into error topic for documents that failed processing.
@@ -304,15 +476,58 @@ class OpensearchOutput(Output):
             "_index": self._config.error_index,
         }
         self._add_dates(error_document)
-        self._message_backlog.append(error_document)
+        self._add_to_backlog(error_document)
         self._write_to_search_context()
 
-    def _build_failed_index_document(self, message_document: dict, reason: str):
+    def _add_to_backlog(self, document: dict) -> None:
+        """Serialize the document into the action and source line of the bulk request and add
+        them to the message backlog.
+
+        Raises
+        ------
+        FatalOutputError
+            If the document can not be serialized.
+        """
+        try:
+            action, source, size = self._serialize(document)
+        except (ValueError, TypeError) as error:
+            raise FatalOutputError(self, f"{error} in document {document}") from error
+        self._message_backlog.append((action, source))
+        self._message_backlog_bytes += size
+
+    def _serialize(self, document: dict) -> Tuple[str, Optional[str], int]:
+        """Returns the action and source line of the document and their size in bytes including
+        the line breaks. Documents with an index and an optional :code:`_op_type` of
+        :code:`index` or :code:`create` get a cached action line, and the meta fields are
+        removed from the document only while the source is encoded."""
+        op_type = document.get("_op_type", "index")
+        if op_type in ("index", "create") and _BULK_META_FIELDS.isdisjoint(document):
+            action, action_size = _get_action_line(op_type, document["_index"])
+            index = document.pop("_index")
+            has_op_type = document.pop("_op_type", None) is not None
+            try:
+                source = self._encoder.encode(document)
+            finally:
+                document["_index"] = index
+                if has_op_type:
+                    document["_op_type"] = op_type
+            return action, source.decode("utf-8"), action_size + len(source) + 2
+        action, data = helpers.expand_action(document)
+        action = self._encoder.encode(action)
+        if data is None:
+            return action.decode("utf-8"), None, len(action) + 1
+        source = self._encoder.encode(data)
+        return action.decode("utf-8"), source.decode("utf-8"), len(action) + len(source) + 2
+
+    def _build_failed_index_document(self, message_document: Union[dict, str], reason: str):
         document = {
             "reason": reason,
             "@timestamp": TimeParser.now().isoformat(),
             "_index": self._config.default_index,
         }
+        if isinstance(message_document, str):
+            document["message"] = message_document
+            return document
         try:
             document["message"] = json.dumps(message_document)
         except TypeError:
@@ -340,11 +555,23 @@ class OpensearchOutput(Output):
         Returns True to inform the pipeline to call the batch_finished_callback method in the
         configured input
         """
-        if len(self._message_backlog) >= self._config.message_backlog_size:
-            self._write_backlog()
+        if self._bulk_writers:
+            self._acknowledge_written_bulks()
+        if len(self._message_backlog) >= self._config.message_backlog_size or (
+            self._config.message_backlog_size_mb
+            and self._message_backlog_bytes >= self._config.message_backlog_size_mb
+        ):
+            if self._bulk_writers:
+                self._hand_over_backlog()
+            else:
+                self._write_backlog()
 
     @Metric.measure_time()
     def _write_backlog(self):
+        if self._bulk_writers:
+            self._hand_over_backlog()
+            self._wait_for_pending_bulks()
+            return
         if not self._message_backlog:
             return
 
@@ -357,13 +584,73 @@ class OpensearchOutput(Output):
         if self.input_connector and hasattr(self.input_connector, "batch_finished_callback"):
             self.input_connector.batch_finished_callback()
         self._message_backlog.clear()
+        self._message_backlog_bytes = 0
+
+    def _hand_over_backlog(self):
+        """Hand the message backlog over to the bulk writers together with the checkpoint of the
+        input connector and start a new backlog. Blocks while :code:`max_pending_bulks` backlogs
+        have not been written yet."""
+        self._acknowledge_written_bulks()
+        if not self._message_backlog:
+            return
+        while len(self._pending_bulks) >= self._config.max_pending_bulks:
+            self._pending_bulks[0].done.wait()
+            self._acknowledge_written_bulks()
+        checkpoint = self.input_connector.get_checkpoint() if self.input_connector else None
+        bulk = _PendingBulk(self._message_backlog, checkpoint)
+        self._message_backlog = []
+        self._message_backlog_bytes = 0
+        self._pending_bulks.append(bulk)
+        self._bulk_queue.put(bulk)
+
+    def _wait_for_pending_bulks(self):
+        while self._pending_bulks:
+            self._pending_bulks[0].done.wait()
+            self._acknowledge_written_bulks()
+
+    def _acknowledge_written_bulks(self):
+        """Acknowledge the checkpoint of the last written backlog whose previous backlogs have
+        been written as well and raise the error of the first failed backlog.
+
+        A failed backlog stops the acknowledgement for good, because the checkpoints of later
+        backlogs include the events of the failed backlog. Its error is raised on every call."""
+        if self._bulk_error is not None:
+            raise self._bulk_error
+        pending_bulks = self._pending_bulks
+        checkpoint, written = None, False
+        while pending_bulks and pending_bulks[0].done.is_set():
+            bulk = pending_bulks.popleft()
+            if bulk.error is not None:
+                self._bulk_error = bulk.error
+                break
+            checkpoint, written = bulk.checkpoint, True
+        if written and self.input_connector:
+            self.input_connector.acknowledge(checkpoint)
+        if self._bulk_error is not None:
+            raise self._bulk_error
+
+    def _run_bulk_writer(self):
+        while True:
+            bulk = self._bulk_queue.get()
+            if bulk is None:
+                return
+            try:
+                self._bulk(
+                    self._search_context,
+                    bulk.messages,
+                    max_retries=self._config.max_retries,
+                    chunk_size=len(bulk.messages),
+                )
+            except Exception as error:  # pylint: disable=broad-except
+                bulk.error = error
+            bulk.done.set()
 
     def _bulk(self, client, actions, *args, **kwargs):
         try:
             if self._config.parallel_bulk:
                 self._parallel_bulk(client, actions, *args, **kwargs)
                 return
-            helpers.bulk(client, actions, *args, **kwargs)
+            helpers.bulk(client, actions, *args, expand_action_callback=_expand_action, **kwargs)
         except search.SerializationError as error:
             self._handle_serialization_error(error)
         except search.ConnectionError as error:
@@ -371,7 +658,7 @@ class OpensearchOutput(Output):
         except helpers.BulkIndexError as error:
             self._handle_bulk_index_error(error)
         except search.exceptions.TransportError as error:
-            self._handle_transport_error(error)
+            self._handle_transport_error(error, actions)
 
     def _parallel_bulk(self, client, actions, *args, **kwargs):
         bulk_delays = 1
@@ -382,6 +669,7 @@ class OpensearchOutput(Output):
                     actions=actions,
                     chunk_size=self._config.chunk_size,
                     queue_size=self._config.queue_size,
+                    expand_action_callback=_expand_action,
                     raise_on_error=True,
                     raise_on_exception=True,
                 ):
@@ -467,7 +755,9 @@ class OpensearchOutput(Output):
             error_documents.append(error_document)
         self._bulk(self._search_context, error_documents)
 
-    def _handle_transport_error(self, error: search.exceptions.TransportError):
+    def _handle_transport_error(
+        self, error: search.exceptions.TransportError, messages: Optional[List[dict]] = None
+    ):
         """Handle transport error for opensearch bulk indexing.
 
         Discard messages that exceed the maximum size if they caused an error.
@@ -476,16 +766,21 @@ class OpensearchOutput(Output):
         ----------
         error : TransportError
            TransportError for the error message.
+        messages : Optional[List[dict]]
+            The messages of the failed bulk request, which are replaced by the messages that are
+            written instead. Defaults to the message backlog.
 
         """
         if self._config.maximum_message_size_mb is None:
             raise FatalOutputError(self, error.error)
 
+        if messages is None:
+            messages = self._message_backlog
         if self._message_exceeds_max_size_error(error):
             (
                 messages_under_size_limit,
                 messages_over_size_limit,
-            ) = self._split_message_backlog_by_size_limit()
+            ) = self._split_message_backlog_by_size_limit(messages)
 
             if len(messages_over_size_limit) == 0:
                 raise FatalOutputError(self, error.error)
@@ -493,8 +788,8 @@ class OpensearchOutput(Output):
             error_documents = self._build_messages_for_large_error_documents(
                 messages_over_size_limit
             )
-            self._message_backlog = error_documents + messages_under_size_limit
-            self._bulk(self._search_context, self._message_backlog)
+            messages[:] = error_documents + messages_under_size_limit
+            self._bulk(self._search_context, messages)
         else:
             raise FatalOutputError(self, error.error)
 
@@ -511,7 +806,7 @@ class OpensearchOutput(Output):
         return False
 
     def _build_messages_for_large_error_documents(
-        self, messages_over_size_limit: List[Tuple[dict, int]]
+        self, messages_over_size_limit: List[Tuple[Union[dict, tuple], int]]
     ) -> List[dict]:
         """Build error message for messages that were larger than the allowed size limit.
 
@@ -520,12 +815,16 @@ class OpensearchOutput(Output):
 
         Parameters
         ----------
-        messages_over_size_limit : List[Tuple[dict, int]]
+        messages_over_size_limit : List[Tuple[Union[dict, tuple], int]]
            Messages that were too large with their corresponding sizes in byte.
 
         """
         error_documents = []
         for message, size in messages_over_size_limit:
+            if isinstance(message, tuple):
+                snipped = message[1][:1000]
+            else:
+                snipped = self._encoder.encode(message).decode("utf-8")[:1000]
             error_message = (
                 f"Discarded message that is larger than the allowed size limit "
                 f"({size / 10 ** 6} MB/{self._config.maximum_message_size_mb} MB)"
@@ -533,7 +832,7 @@ class OpensearchOutput(Output):
             logger.warning(error_message)
 
             error_document = {
-                "processed_snipped": f'{self._encoder.encode(message).decode("utf-8")[:1000]} ...',
+                "processed_snipped": f"{snipped} ...",
                 "error": error_message,
                 "@timestamp": TimeParser.now().isoformat(),
                 "_index": self._config.error_index,
@@ -542,12 +841,17 @@ class OpensearchOutput(Output):
             error_documents.append(error_document)
         return error_documents
 
-    def _split_message_backlog_by_size_limit(self):
+    def _split_message_backlog_by_size_limit(self, messages: Optional[List] = None):
+        if messages is None:
+            messages = self._message_backlog
         messages_under_size_limit = []
         messages_over_size_limit = []
         total_size = 0
-        for message in self._message_backlog:
-            message_size = get_dict_size_in_byte(message)
+        for message in messages:
+            if isinstance(message, tuple):
+                message_size = len(message[1].encode("utf-8")) if message[1] else 0
+            else:
+                message_size = get_dict_size_in_byte(message)
             if message_size < self._config.maximum_message_size_mb:
                 messages_under_size_limit.append(message)
                 total_size += message_size
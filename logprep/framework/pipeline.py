@@ -253,6 +253,7 @@ class Pipeline:
     def process_pipeline(self) -> PipelineResult:
         """Retrieve next event, process event with full pipeline and store or return results"""
         Component.run_pending_tasks()
+        self._store_flushed_extra_data()
 
         event = self._get_event()
         result = None
@@ -311,13 +312,26 @@ class Pipeline:
 
     def _store_extra_data(self, result_data: List | itertools.chain) -> None:
         self.logger.debug("Storing extra data")
+        batches = {}
         for document, outputs in result_data:
             for output in outputs:
                 for output_name, target in output.items():
-                    self._output[output_name].store_custom(document, target)
+                    batches.setdefault((output_name, target), []).append(document)
+        for (output_name, target), documents in batches.items():
+            self._output[output_name].store_custom_batch(documents, target)
+
+    def _store_flushed_extra_data(self, final: bool = False) -> None:
+        if not self._output or not self._pipeline:
+            return
+        result_data = [
+            data for processor in self._pipeline if (data := processor.flush_extra_data(final))
+        ]
+        if result_data:
+            self._store_extra_data(itertools.chain(*result_data))
 
     def _shut_down(self) -> None:
         try:
+            self._store_flushed_extra_data(final=True)
             self._input.shut_down()
             self._drain_input_queues()
             for _, output in self._output.items():
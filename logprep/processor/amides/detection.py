@@ -1,8 +1,11 @@
 """This module contains classes for misuse detection and rule attribution
 as used by AMIDES."""
 
-from typing import Dict, List, Tuple
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+from scipy.sparse import issparse
 from sklearn.base import BaseEstimator
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.preprocessing import MinMaxScaler
@@ -98,6 +101,125 @@ class MisuseDetector(DetectionModel):
         return False, round(confidence_value, 3)
 
 
+class StackedRuleModels:
+    """StackedRuleModels combines the linear classifiers of TF-IDF based rule models into one
+    weight matrix over the union of all rule model vocabularies. The confidence values of all
+    rule models are then calculated with one matrix multiplication instead of one vectorizer
+    transformation and one classifier call per rule model.
+
+    With term counts c, the decision value of rule model r is
+    (c * idf_r) @ w_r / ||c * idf_r|| + b_r, where only terms of the vocabulary of r are
+    considered. The numerator is linear in c and the squared norm is linear in c**2,
+    so both can be stacked for all rule models.
+    """
+
+    __slots__ = (
+        "_analyzer",
+        "_binary",
+        "_vocabulary",
+        "_weights",
+        "_squared_idfs",
+        "_intercepts",
+        "_scales",
+        "_offsets",
+    )
+
+    _analyzer_params = (
+        "analyzer",
+        "binary",
+        "decode_error",
+        "encoding",
+        "input",
+        "lowercase",
+        "ngram_range",
+        "preprocessor",
+        "stop_words",
+        "strip_accents",
+        "token_pattern",
+    )
+
+    def __init__(self, models: List[dict]):
+        vectorizers = [model["vectorizer"] for model in models]
+        self._analyzer = vectorizers[0].build_analyzer()
+        self._binary = vectorizers[0].binary
+        self._vocabulary = {}
+        for vectorizer in vectorizers:
+            for term in vectorizer.vocabulary_:
+                self._vocabulary.setdefault(term, len(self._vocabulary))
+        self._weights = np.zeros((len(self._vocabulary), len(models)))
+        self._squared_idfs = np.zeros((len(self._vocabulary), len(models)))
+        self._intercepts = np.empty(len(models))
+        self._scales = np.empty(len(models))
+        self._offsets = np.empty(len(models))
+        for index, model in enumerate(models):
+            self._stack_model(index, model)
+
+    def _stack_model(self, index: int, model: dict):
+        vectorizer, clf, scaler = model["vectorizer"], model["clf"], model["scaler"]
+        coefficients = clf.coef_.toarray() if issparse(clf.coef_) else np.asarray(clf.coef_)
+        coefficients = coefficients.ravel()
+        idfs = vectorizer.idf_ if vectorizer.use_idf else np.ones(len(vectorizer.vocabulary_))
+        for term, column in vectorizer.vocabulary_.items():
+            row = self._vocabulary[term]
+            self._weights[row, index] = idfs[column] * coefficients[column]
+            self._squared_idfs[row, index] = idfs[column] ** 2
+        self._intercepts[index] = np.asarray(clf.intercept_).ravel()[0]
+        self._scales[index] = np.ravel(scaler.scale_)[0]
+        self._offsets[index] = np.ravel(scaler.min_)[0]
+
+    @classmethod
+    def from_models(cls, models: List[dict]) -> Optional["StackedRuleModels"]:
+        """Returns the stacked rule models or None if the models can not be stacked, e.g. because
+        they do not use linear classifiers or their vectorizers tokenize differently."""
+        if not models or not all(cls._is_stackable(model) for model in models):
+            return None
+        vectorizers = [model["vectorizer"] for model in models]
+        first_params = vectorizers[0].get_params()
+        for vectorizer in vectorizers[1:]:
+            params = vectorizer.get_params()
+            if any(params[name] != first_params[name] for name in cls._analyzer_params):
+                return None
+            if type(vectorizer.tokenizer) is not type(vectorizers[0].tokenizer):
+                return None
+        return cls(models)
+
+    @staticmethod
+    def _is_stackable(model: dict) -> bool:
+        vectorizer, clf, scaler = model["vectorizer"], model["clf"], model["scaler"]
+        if not isinstance(vectorizer, TfidfVectorizer) or not isinstance(scaler, MinMaxScaler):
+            return False
+        if vectorizer.norm != "l2" or vectorizer.sublinear_tf or scaler.clip:
+            return False
+        try:
+            coefficients, intercept = clf.coef_, clf.intercept_
+        except AttributeError:
+            return False
+        return (
+            hasattr(vectorizer, "vocabulary_")
+            and (not vectorizer.use_idf or hasattr(vectorizer, "idf_"))
+            and coefficients.shape == (1, len(vectorizer.vocabulary_))
+            and np.size(intercept) == 1
+            and np.size(scaler.scale_) == 1
+        )
+
+    def confidence_values(self, sample: str) -> np.ndarray:
+        """Returns the scaled confidence values of all stacked rule models for the sample."""
+        counts = Counter(
+            self._vocabulary[term] for term in self._analyzer(sample) if term in self._vocabulary
+        )
+        decision_values = self._intercepts
+        if counts:
+            rows = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+            term_counts = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+            if self._binary:
+                term_counts = np.ones_like(term_counts)
+            numerators = term_counts @ self._weights[rows]
+            norms = np.sqrt((term_counts**2) @ self._squared_idfs[rows])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                decision_values = np.where(norms > 0, numerators / norms, 0.0) + self._intercepts
+        return decision_values * self._scales + self._offsets
+
+
 class RuleAttributorError(BaseException):
     """Base class for all RuleAttributor-related Errors."""
 
@@ -105,9 +227,15 @@ class RuleAttributorError(BaseException):
 class RuleAttributor:
     """RuleAttributor attributes malicious samples to misuse detection rules."""
 
-    __slots__ = ("_rule_models", "_num_rule_attributions", "_attribution_threshold")
+    __slots__ = (
+        "_rule_models",
+        "_stacked_rule_models",
+        "_num_rule_attributions",
+        "_attribution_threshold",
+    )
 
     _rule_models: Dict[str, DetectionModel]
+    _stacked_rule_models: Optional[StackedRuleModels]
     _num_rule_attributions: int
 
     def __init__(
@@ -127,6 +255,7 @@ class RuleAttributor:
                 self._rule_models[rule_name] = rule_model
             except DetectionModelError as err:
                 raise RuleAttributorError from err
+        self._stacked_rule_models = StackedRuleModels.from_models(list(models.values()))
 
     def attribute(self, sample: str) -> List[dict]:
         """Attribute given sample to rules of which the attributor holds rule models.
@@ -146,6 +275,12 @@ class RuleAttributor:
         return self._get_rules_with_highest_confidence_values(conf_values)
 
     def _calculate_rule_confidence_values(self, cmdline: str) -> List[dict]:
+        if self._stacked_rule_models is not None:
+            stacked_values = self._stacked_rule_models.confidence_values(cmdline).tolist()
+            return [
+                {"rule": name, "confidence": round(value, 3)}
+                for name, value in zip(self._rule_models, stacked_values)
+            ]
         conf_values = []
 
         for name, rule_model in self._rule_models.items():
@@ -86,10 +86,7 @@ cache-related metrics like the number of hits and misses and the current cache l
 
 import logging
 from functools import cached_property, lru_cache
-from multiprocessing import current_process
-from pathlib import Path
 from typing import List, Tuple
-from zipfile import ZipFile
 
 import joblib
 from attr import define, field, validators
@@ -100,7 +97,7 @@ from logprep.processor.amides.detection import MisuseDetector, RuleAttributor
 from logprep.processor.amides.normalize import CommandLineNormalizer
 from logprep.processor.amides.rule import AmidesRule
 from logprep.processor.field_manager.processor import FieldManager
-from logprep.util.getter import GetterFactory
+from logprep.util.artifacts import get_artifact_member
 from logprep.util.helper import get_dotted_field_value
 
 logger = logging.getLogger("Amides")
@@ -123,7 +120,8 @@ class Amides(FieldManager):
         models_path: str = field(validator=validators.instance_of(str))
         """
         Path or URI of the archive (.zip) containing the models used by the misuse detector
-        and the rule attributor.
+        and the rule attributor. Remote archives are downloaded and unpacked once per node
+        and shared read-only between all processes.
 
         .. security-best-practice::
            :title: Processor - Amides Model
@@ -215,20 +213,8 @@ class Amides(FieldManager):
         )
 
     def _load_and_unpack_models(self):
-        models_path = self._config.models_path
-        if not Path(models_path).exists():
-            logger.debug("Getting AMIDES models archive...")
-            models_archive = Path(f"{current_process().name}-{self.name}.zip")
-            models_archive.touch()
-            models_archive.write_bytes(GetterFactory.from_string(models_path).get_raw())
-            logger.debug("Finished getting AMIDES models archive...")
-            models_path = str(models_archive.absolute())
-
-        with ZipFile(models_path, mode="r") as zip_file:
-            with zip_file.open("model", mode="r") as models_file:
-                models = joblib.load(models_file)
-
-        return models
+        models_file = get_artifact_member(self._config.models_path, "model")
+        return joblib.load(models_file)
 
     def _apply_rules(self, event: dict, rule: AmidesRule):
         cmdline = get_dotted_field_value(event, rule.source_fields[0])
@@ -0,0 +1,143 @@
+"""Calculation expressions that are parsed once per rule and evaluated per event.
+
+The field references of a calculation expression are replaced by slot identifiers and the
+expression is parsed once into the postfix stack of the :code:`BNF` grammar. For each event only
+the field values are inserted into the slots of a copy of this stack, so the expression does not
+have to be templated and parsed again.
+
+Field values are only inserted if they are parsed into exactly one token when templated into the
+expression, i.e. numbers, hex values, identifiers and the constants :code:`PI` and :code:`E`
+with optional signs. For all other values, like values containing operators, :code:`bind`
+returns :code:`None` and the expression has to be templated and parsed as before.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from pyparsing import ParseException
+
+from logprep.processor.calculator.fourFn import BNF
+from logprep.processor.field_manager.rule import FIELD_PATTERN
+
+SLOT_PREFIX = "logprepcalculatorslot"
+
+NUMBER_PATTERN = re.compile(r"[a-zA-Z0-9]+(?:\.\d*)?(?:[eE][+-]?\d+)?")
+
+VALUE_PATTERN = re.compile(r"\s*(?P<signs>[+\-\s]*)(?P<token>\S.*?)\s*")
+
+OPERAND_SEPARATORS = ("(", ",", "*", "/", "^")
+
+CONSTANTS = {"PI": "PI", "E": "E"}
+
+
+def _count_unary_minus(signs: str) -> int:
+    """Returns the number of unary minus operators the grammar pushes for the signs of an atom.
+    Only leading minus signs are taken into account, the grammar stops at the first plus sign."""
+    return len(signs) - len(signs.lstrip("-"))
+
+
+class CompiledExpression:
+    """A calculation expression parsed into a postfix stack with slots for field values."""
+
+    __slots__ = ("_stack", "_slots")
+
+    _stack: List
+
+    _slots: Dict[int, Tuple[str, str]]
+    """Maps stack positions to the source field and the signs preceding it in the expression"""
+
+    def __init__(self, stack: List, slots: Dict[int, Tuple[str, str]]):
+        self._stack = stack
+        self._slots = slots
+
+    @classmethod
+    def compile(cls, calc: str) -> Optional["CompiledExpression"]:
+        """Parses a calculation expression with field references once.
+
+        Parameters
+        ----------
+        calc : str
+            The calculation expression with field references like :code:`${dotted.field}`.
+
+        Returns
+        -------
+        Optional[CompiledExpression]
+            The compiled expression or None if the expression can not be parsed on its own or
+            if a field reference can not be separated from the surrounding expression.
+        """
+        if SLOT_PREFIX in calc:
+            return None
+        slot_fields = {}
+        slot_signs = {}
+
+        def replace(match: re.Match) -> str:
+            slot = f"{SLOT_PREFIX}{len(slot_fields)}"
+            slot_fields[slot] = match.group(1)
+            slot_signs[slot] = cls._get_atom_signs(calc[: match.start()])
+            return slot
+
+        expression = re.sub(FIELD_PATTERN, replace, calc)
+        bnf = BNF()
+        bnf.exprStack.clear()
+        try:
+            bnf.parseString(expression, parseAll=True)
+        except ParseException:
+            return None
+        finally:
+            stack = list(bnf.exprStack)
+            bnf.exprStack.clear()
+        slots = {
+            position: (slot_fields[token], slot_signs[token])
+            for position, token in enumerate(stack)
+            if isinstance(token, str) and token in slot_fields
+        }
+        if len(slots) != len(slot_fields):
+            return None
+        return cls(stack, slots)
+
+    @staticmethod
+    def _get_atom_signs(preceding: str) -> str:
+        """Returns the signs in front of a field reference that belong to its atom.
+        A sign directly following an operand is a binary operator and not part of the atom."""
+        signs_match = re.search(r"[+\-\s]*$", preceding)
+        signs = re.sub(r"\s", "", signs_match.group(0))
+        before_signs = preceding[: signs_match.start()].rstrip()
+        if signs and before_signs and before_signs[-1] not in OPERAND_SEPARATORS:
+            signs = signs[1:]
+        return signs
+
+    def bind(self, source: dict) -> Optional[List]:
+        """Returns the postfix stack with the field values inserted into the slots.
+
+        Parameters
+        ----------
+        source : dict
+            The values of the source fields by dotted field name.
+
+        Returns
+        -------
+        Optional[List]
+            The stack that can be evaluated with :code:`evaluate_stack` or None if a value
+            can not be inserted as a single token.
+        """
+        stack = []
+        position = 0
+        for slot_position, (source_field, template_signs) in self._slots.items():
+            stack.extend(self._stack[position:slot_position])
+            value_match = VALUE_PATTERN.fullmatch(str(source[source_field]))
+            if value_match is None:
+                return None
+            token = value_match.group("token")
+            constant = CONSTANTS.get(token.upper())
+            if constant is None:
+                number_match = NUMBER_PATTERN.match(token)
+                if number_match is None or number_match.end() != len(token):
+                    return None
+            value_signs = re.sub(r"\s", "", value_match.group("signs"))
+            unary_minus_count = _count_unary_minus(template_signs + value_signs)
+            unary_minus_count -= _count_unary_minus(template_signs)
+            stack.append(constant or token)
+            stack.extend(["unary -"] * unary_minus_count)
+            position = slot_position + 1
+        stack.extend(self._stack[position:])
+        return stack
@@ -57,6 +57,37 @@ fn = {
 }
 
 
+def evaluate_stack(stack: list):
+    op, num_args = stack.pop(), 0
+    if isinstance(op, tuple):
+        op, num_args = op
+    if op == "unary -":
+        return -evaluate_stack(stack)
+    if op in "+-*/^":
+        # note: operands are pushed onto the stack in reverse order
+        op2 = evaluate_stack(stack)
+        op1 = evaluate_stack(stack)
+        return opn[op](op1, op2)
+    if op == "PI":
+        return math.pi  # 3.1415926535
+    if op == "E":
+        return math.e  # 2.718281828
+    if op in fn:
+        # note: args are pushed onto the stack in reverse order
+        args = reversed([evaluate_stack(stack) for _ in range(num_args)])
+        return fn[op](*args)
+    if op[0].isalpha():
+        raise Exception(f"invalid identifier '{op}'")  # pylint: disable=broad-exception-raised
+    # try to evaluate as int first, then as float if int fails
+    try:
+        return int(op)
+    except ValueError:
+        try:
+            return float(op)
+        except ValueError:
+            return op
+
+
 class BNF(Forward):
     """
     expop   :: '^'
@@ -101,34 +132,7 @@ class BNF(Forward):
                 break
 
     def evaluate_stack(self):
-        op, num_args = self.exprStack.pop(), 0
-        if isinstance(op, tuple):
-            op, num_args = op
-        if op == "unary -":
-            return -self.evaluate_stack()
-        if op in "+-*/^":
-            # note: operands are pushed onto the stack in reverse order
-            op2 = self.evaluate_stack()
-            op1 = self.evaluate_stack()
-            return opn[op](op1, op2)
-        if op == "PI":
-            return math.pi  # 3.1415926535
-        if op == "E":
-            return math.e  # 2.718281828
-        if op in fn:
-            # note: args are pushed onto the stack in reverse order
-            args = reversed([self.evaluate_stack() for _ in range(num_args)])
-            return fn[op](*args)
-        if op[0].isalpha():
-            raise Exception(f"invalid identifier '{op}'")  # pylint: disable=broad-exception-raised
-        # try to evaluate as int first, then as float if int fails
-        try:
-            return int(op)
-        except ValueError:
-            try:
-                return float(op)
-            except ValueError:
-                return op
+        return evaluate_stack(self.exprStack)
 
     def __new__(cls):
         if not hasattr(cls, "instance"):
@@ -30,7 +30,7 @@ from functools import cached_property
 
 from pyparsing import ParseException
 
-from logprep.processor.calculator.fourFn import BNF
+from logprep.processor.calculator.fourFn import BNF, evaluate_stack
 from logprep.processor.calculator.rule import CalculatorRule
 from logprep.processor.field_manager.processor import FieldManager
 from logprep.util.decorators import timeout
@@ -49,9 +49,8 @@ class Calculator(FieldManager):
         if self._has_missing_values(event, rule, source_field_dict):
             return
 
-        expression = self._template(rule.calc, source_field_dict)
         try:
-            result = self._calculate(event, rule, expression)
+            result = self._calculate(event, rule, source_field_dict)
             if result is not None:
                 self._write_target_field(event, rule, result)
         except TimeoutError as error:
@@ -76,16 +75,23 @@ class Calculator(FieldManager):
             string = re.sub(pattern, str(value), string)
         return string
 
-    def _calculate(self, event, rule, expression):
+    def _calculate(self, event, rule, source):
         @timeout(seconds=rule.timeout)
-        def calculate(event, rule, expression):
+        def calculate(event, rule, source):
+            stack = rule.expression.bind(source) if rule.expression is not None else None
+            expression = None
             try:
+                if stack is not None:
+                    return evaluate_stack(stack)
+                expression = self._template(rule.calc, source)
                 _ = self.bnf.parseString(expression, parseAll=True)
                 return self.bnf.evaluate_stack()
             except ParseException as error:
                 error.msg = f"({self.name}): expression '{error.line}' could not be parsed"
                 self._handle_warning_error(event, rule, error)
             except ArithmeticError as error:
+                if expression is None:
+                    expression = self._template(rule.calc, source)
                 error.args = [
                     f"({self.name}): expression '{rule.calc}' => '{expression}' results in "
                     + f"{error.args[0]}"
@@ -93,4 +99,4 @@ class Calculator(FieldManager):
                 self._handle_warning_error(event, rule, error)
             return None
 
-        return calculate(event, rule, expression)
+        return calculate(event, rule, source)
@@ -88,9 +88,12 @@ The calc expression is not whitespace sensitive.
 """
 
 import re
+from typing import Optional
 
 from attrs import define, field, validators
 
+from logprep.filter.expression.filter_expression import FilterExpression
+from logprep.processor.calculator.expression import CompiledExpression
 from logprep.processor.field_manager.rule import FIELD_PATTERN, FieldManagerRule
 
 
@@ -123,6 +126,15 @@ class CalculatorRule(FieldManagerRule):
             self.source_fields = re.findall(FIELD_PATTERN, self.calc)
             super().__attrs_post_init__()
 
+    expression: Optional[CompiledExpression]
+    """The calculation expression parsed once or None if it can not be compiled"""
+
+    def __init__(
+        self, filter_rule: FilterExpression, config: "CalculatorRule.Config", processor_name: str
+    ):
+        super().__init__(filter_rule, config, processor_name)
+        self.expression = CompiledExpression.compile(self.calc)
+
     @property
     def calc(self):
         """Returns the calculation expression"""
@@ -30,6 +30,7 @@ Processor Configuration
         generic_rules:
             - tests/testdata/rules/generic/
         output_field_name: target_field
+        max_cached_signatures: 10000
 
 .. autoclass:: logprep.processor.clusterer.processor.Clusterer.Config
    :members:
@@ -48,7 +49,6 @@ from attrs import define, field, validators
 from logprep.abc.processor import Processor
 from logprep.processor.clusterer.rule import ClustererRule
 from logprep.processor.clusterer.signature_calculation.signature_phase import (
-    LogRecord,
     SignatureEngine,
     SignaturePhaseStreaming,
 )
@@ -65,6 +65,11 @@ class Clusterer(FieldManager):
 
         output_field_name: str = field(validator=validators.instance_of(str))
         """defines in which field results of the clustering should be stored."""
+        max_cached_signatures: int = field(
+            default=10000, validator=[validators.instance_of(int), validators.ge(0)]
+        )
+        """Maximum number of signatures that are cached by the applied clusterer rule and the
+        text to cluster. Setting it to :code:`0` disables the cache. Defaults to :code:`10000`."""
 
     __slots__ = ["sps"]
 
@@ -74,7 +79,7 @@ class Clusterer(FieldManager):
 
     def __init__(self, name: str, configuration: Processor.Config):
         super().__init__(name=name, configuration=configuration)
-        self.sps = SignaturePhaseStreaming()
+        self.sps = SignaturePhaseStreaming(self._config.max_cached_signatures)
         self.has_custom_tests = True
 
         self._last_rule_id = math.inf
@@ -122,13 +127,9 @@ class Clusterer(FieldManager):
         if raw_text is None:
             return
 
-        record = (
-            LogRecord(raw_text=raw_text, sig_text=sig_text)
-            if sig_text
-            else LogRecord(raw_text=raw_text)
+        cluster_signature_based_on_message, sig_text = self.sps.run_chain(
+            raw_text, (rule,), is_raw_text=not sig_text
         )
-
-        cluster_signature_based_on_message, sig_text = self.sps.run(record, rule)
         if self._syslog_has_pri(event):
             cluster_signature = " , ".join(
                 [
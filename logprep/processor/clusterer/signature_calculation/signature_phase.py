@@ -1,9 +1,9 @@
 """Module for Signature-Phase of the Log-Clustering."""
 
 import re
-from typing import Tuple, List, Dict
-
 from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
 from types import SimpleNamespace
 
 from logprep.processor.clusterer.configuration import SignatureProgramTags
@@ -27,17 +27,71 @@ class LogRecord(SimpleNamespace):
 
 
 class SignaturePhaseStreaming:
-    """Responsible for clustering a log by calculating the cluster signature."""
+    """Responsible for clustering a log by calculating the cluster signature.
 
-    def __init__(self):
+    If :code:`max_cached_signatures` is set, results are memoized by the applied clusterer rules
+    and the input text, since (syslog) messages repeat heavily.
+    """
+
+    def __init__(self, max_cached_signatures: Optional[int] = None):
         self._se = SignatureEngine()
+        self._calculate_signature_cached = None
+        if max_cached_signatures:
+            self._calculate_signature_cached = lru_cache(maxsize=max_cached_signatures)(
+                self._calculate_signature
+            )
 
     def run(self, record: LogRecord, rule: ClustererRule) -> Tuple[str, str]:
         """Process a log event by calculating the cluster signature."""
-        record = self._se.run(record, rule)
-        record.sig_str_no_tags = self._remove_tags(record.sig_str)
+        to_cluster = record.sig_text if record.sig_text else record.raw_text
+        record.sig_str_no_tags, record.sig_text = self.run_chain(
+            to_cluster, (rule,), is_raw_text=not record.sig_text
+        )
         return record.sig_str_no_tags, record.sig_text
 
+    def run_chain(
+        self, text: str, rules: Sequence[ClustererRule], is_raw_text: bool = True
+    ) -> Tuple[str, str]:
+        """Calculate the cluster signature for an ordered sequence of clusterer rules at once.
+
+        The substitutions of all rules are applied one after another and the signature is only
+        calculated for the final text.
+
+        Parameters
+        ----------
+        text: str
+            Raw text or the not extracted signature text of a previous clusterer rule.
+        rules: Sequence[ClustererRule]
+            Clusterer rules in the order they have to be applied.
+        is_raw_text: bool
+            Whether the text is a raw text that must not contain signature tags.
+
+        Returns
+        -------
+        Tuple[str, str]
+            The signature without tags and the not extracted signature text.
+        """
+        substitutions = tuple((rule.pattern, rule.repl) for rule in rules)
+        if self._calculate_signature_cached is None:
+            return self._calculate_signature(text, substitutions, is_raw_text)
+        return self._calculate_signature_cached(text, substitutions, is_raw_text)
+
+    def cache_info(self):
+        """Returns the cache info of the signature cache or None if caching is disabled."""
+        if self._calculate_signature_cached is None:
+            return None
+        return self._calculate_signature_cached.cache_info()
+
+    def _calculate_signature(
+        self, text: str, substitutions: Tuple[Tuple[Pattern, str], ...], is_raw_text: bool
+    ) -> Tuple[str, str]:
+        if is_raw_text:
+            self._se.check_no_start_and_end_tag_in_raw_text(text)
+        for pattern, repl in substitutions:
+            text = SignatureEngine.apply_substitution(text, pattern, repl)
+        sig_str = " ".join(self._se.calculate_signature(text))
+        return self._remove_tags(sig_str), text
+
     @staticmethod
     def _remove_tags(sig_str: str) -> str:
         """Remove the tag respectively markup signs."""
@@ -56,6 +110,14 @@ class SignatureEngine:
     def __init__(self):
         self._sp = SignatureTagParser()
 
+    def check_no_start_and_end_tag_in_raw_text(self, raw_text: str):
+        """Check if the start and end tags are in the raw text."""
+        self._sp.check_no_start_and_end_tag_in_raw_text(raw_text)
+
+    def calculate_signature(self, sig_text: str) -> List[str]:
+        """Calculate the cluster signature."""
+        return self._sp.calculate_signature(sig_text)
+
     def run(self, record: LogRecord, rule: ClustererRule) -> LogRecord:
         """Run the signature engine."""
         if not record.sig_text:
@@ -93,12 +155,17 @@ class SignatureEngine:
             This doesn't have to be a final signature, but can be an intermediate result.
 
         """
-        sig_text, num_of_subs = rule.pattern.subn(rule.repl, sig_text)
+        return SignatureEngine.apply_substitution(sig_text, rule.pattern, rule.repl)
+
+    @staticmethod
+    def apply_substitution(sig_text: str, pattern: Pattern, repl: str) -> str:
+        """Apply a substitution repeatedly as described in :code:`apply_signature_rule`."""
+        sig_text, num_of_subs = pattern.subn(repl, sig_text)
         # last_num_of_subs is set greater than num_of_subs so that it is possible to enter the loop
         last_num_of_subs = num_of_subs + 1
         while 0 < num_of_subs < last_num_of_subs:
             last_num_of_subs = num_of_subs
-            sig_text, num_of_subs = rule.pattern.subn(rule.repl, sig_text)
+            sig_text, num_of_subs = pattern.subn(repl, sig_text)
         sig_text = SignatureEngine._merge_repeating_tags(sig_text)
         return sig_text
 
@@ -28,9 +28,13 @@ Processor Configuration
 .. automodule:: logprep.processor.dissector.rule
 """
 
-from typing import Callable, List, Tuple
+from typing import List, Optional, Tuple
 
-from logprep.processor.dissector.rule import DissectorRule
+from logprep.processor.dissector.rule import (
+    INDIRECT_TARGET,
+    INDIRECT_TARGET_NAME,
+    DissectorRule,
+)
 from logprep.processor.field_manager.processor import FieldManager
 from logprep.util.helper import add_field_to, get_dotted_field_value
 
@@ -41,55 +45,65 @@ class Dissector(FieldManager):
     rule_class = DissectorRule
 
     def _apply_rules(self, event, rule):
-        self._apply_mapping(event, rule)
-        self._apply_convert_datatype(event, rule)
+        conversion_results = self._apply_mapping(event, rule)
+        self._apply_convert_datatype(event, rule, conversion_results)
 
-    def _apply_mapping(self, event, rule):
-        action_mappings_sorted_by_position = sorted(
-            self._get_mappings(event, rule), key=lambda x: x[5]
-        )
-        for action, *args, _ in action_mappings_sorted_by_position:
-            action(*args)
+    def _apply_mapping(self, event, rule) -> dict:
+        extracted = self._extract(event, rule)
+        conversion_results = {}
+        for index in rule.write_order:
+            extracted_action = extracted[index]
+            if extracted_action is None:
+                continue
+            target_field, content = extracted_action
+            action, separator, converter = rule.write_program[index]
+            if converter is not None:
+                try:
+                    content = converter(content)
+                    conversion_results[target_field] = None
+                except ValueError as error:
+                    conversion_results[target_field] = error
+            action(event, target_field, content, separator)
+        return conversion_results
 
-    def _get_mappings(self, event, rule) -> List[Tuple[Callable, dict, str, str, str, int]]:
-        current_field = None
+    def _extract(self, event, rule) -> List[Optional[Tuple[str, str]]]:
+        extracted = [None] * len(rule.actions)
         target_field_mapping = {}
-        for rule_action in rule.actions:
-            (
-                source_field,
-                delimiter,
-                target_field,
-                rule_action,
-                separator,
-                strip_char,
-                position,
-            ) = rule_action
-            if current_field != source_field:
-                current_field = source_field
-                loop_content = get_dotted_field_value(event, current_field)
-                if loop_content is None:
-                    if rule.ignore_missing_fields:
-                        continue
+        for source_field, steps in rule.extraction_program:
+            loop_content = get_dotted_field_value(event, source_field)
+            if loop_content is None:
+                if rule.ignore_missing_fields:
+                    steps = steps[1:]
+                else:
                     error = BaseException(
                         f"dissector: mapping field '{source_field}' does not exist"
                     )
                     self._handle_warning_error(event, rule, error)
-            if delimiter is not None and loop_content is not None:
-                content, _, loop_content = loop_content.partition(delimiter)
-            else:
-                content = loop_content
-            if target_field.startswith("?"):
-                target_field_mapping[target_field.lstrip("?")] = content
-                target_field = content
-                content = ""
-            if target_field.startswith("&"):
-                target_field = target_field_mapping.get(target_field.lstrip("&"))
-            if strip_char:
-                content = content.strip(strip_char)
-            yield rule_action, event, target_field, content, separator, position
+            for index, delimiter, target_field, strip_char, target_kind in steps:
+                if delimiter is not None and loop_content is not None:
+                    content, _, loop_content = loop_content.partition(delimiter)
+                else:
+                    content = loop_content
+                if target_kind == INDIRECT_TARGET_NAME:
+                    target_field_mapping[target_field] = content
+                    target_field = content
+                    content = ""
+                    if target_field.startswith("&"):
+                        target_field = target_field_mapping.get(target_field.lstrip("&"))
+                elif target_kind == INDIRECT_TARGET:
+                    target_field = target_field_mapping.get(target_field)
+                if strip_char:
+                    content = content.strip(strip_char)
+                extracted[index] = (target_field, content)
+        return extracted
 
-    def _apply_convert_datatype(self, event, rule):
+    def _apply_convert_datatype(self, event, rule, conversion_results):
         for target_field, converter in rule.convert_actions:
+            if target_field in conversion_results:
+                error = conversion_results[target_field]
+                if error is not None:
+                    self._handle_warning_error(event, rule, error)
+                continue
             try:
                 target_value = converter(get_dotted_field_value(event, target_field))
                 add_field_to(event, target_field, target_value, overwrite_output_field=True)
@@ -90,7 +90,7 @@ Examples for dissection and datatype conversion:
 """
 
 import re
-from typing import Callable, List, Tuple
+from typing import Callable, FrozenSet, List, Optional, Tuple
 
 from attrs import define, field, validators
 
@@ -121,6 +121,11 @@ SECTION_MATCH = rf"{START}{ACTION}{SEPERATOR}{TARGET_FIELD}{STRIP_CHAR}{POSITION
 MAPPING_VALIDATION_REGEX = re.compile(rf"^({DELIMITER})?({DISSECT}({DELIMITER})?)+({DISSECT})?$")
 
 
+TARGET = 0
+INDIRECT_TARGET_NAME = 1
+INDIRECT_TARGET = 2
+
+
 def _do_nothing(*_):
     return
 
@@ -193,6 +198,20 @@ class DissectorRule(FieldManagerRule):
     convert_actions: List[Tuple[str, Callable]]
     """list tuple format <target_field>, <converter callable>"""
 
+    extraction_program: List[Tuple[str, Tuple[Tuple[int, str, str, str, int], ...]]]
+    """the actions grouped by consecutive source fields, list tuple format (source_field, steps)
+    with steps in the format (action_index, delimiter, target_field, strip_char, target_kind)"""
+
+    write_program: List[Tuple[Callable, str, Optional[Callable]]]
+    """list tuple format (action, separator, converter) with the same order as :code:`actions`,
+    the converter is only set if the datatype conversion is fused into the write"""
+
+    write_order: Tuple[int, ...]
+    """the indices of :code:`actions` sorted by position"""
+
+    fused_convert_targets: FrozenSet[str]
+    """the target fields whose datatype conversion is fused into the write"""
+
     @property
     def failure_tags(self):
         """Returns the failure tags"""
@@ -204,6 +223,7 @@ class DissectorRule(FieldManagerRule):
         super().__init__(filter_rule, config, processor_name)
         self._set_mapping_actions()
         self._set_convert_actions()
+        self._set_program()
 
     def _set_mapping_actions(self):
         self.actions = []
@@ -238,3 +258,70 @@ class DissectorRule(FieldManagerRule):
             self.convert_actions.append(
                 (target_field, self._converter_mapping.get(converter_string))
             )
+
+    def _set_program(self):
+        self.extraction_program = []
+        for index, (source_field, delimiter, target_field, *_, strip_char, _) in enumerate(
+            self.actions
+        ):
+            if target_field.startswith("?"):
+                step = (
+                    index,
+                    delimiter,
+                    target_field.lstrip("?"),
+                    strip_char,
+                    INDIRECT_TARGET_NAME,
+                )
+            elif target_field.startswith("&"):
+                step = (index, delimiter, target_field.lstrip("&"), strip_char, INDIRECT_TARGET)
+            else:
+                step = (index, delimiter, target_field, strip_char, TARGET)
+            if self.extraction_program and self.extraction_program[-1][0] == source_field:
+                self.extraction_program[-1][1].append(step)
+            else:
+                self.extraction_program.append((source_field, [step]))
+        self.extraction_program = [
+            (source_field, tuple(steps)) for source_field, steps in self.extraction_program
+        ]
+        self.write_order = tuple(
+            sorted(range(len(self.actions)), key=lambda index: self.actions[index][6])
+        )
+        self.fused_convert_targets = self._get_fused_convert_targets()
+        converters = dict(self.convert_actions)
+        self.write_program = [
+            (
+                action,
+                separator,
+                converters[target_field] if target_field in self.fused_convert_targets else None,
+            )
+            for _, _, target_field, action, separator, *_ in self.actions
+        ]
+
+    def _get_fused_convert_targets(self) -> FrozenSet[str]:
+        """Returns the target fields whose conversion can be done while writing them.
+        This is the case if a field is written once by overwriting it and no other action or
+        conversion writes the same field, a parent or a child of it."""
+        target_fields = [target_field for _, _, target_field, *_ in self.actions]
+        if any(target_field.startswith(("?", "&")) for target_field in target_fields):
+            return frozenset()
+        written_fields = {
+            *target_fields,
+            *(target_field for target_field, _ in self.convert_actions),
+        }
+        fused_convert_targets = set()
+        for target_field, _ in self.convert_actions:
+            writing_actions = [
+                action
+                for _, _, other_field, action, *_ in self.actions
+                if other_field == target_field
+            ]
+            if writing_actions != [add_and_overwrite]:
+                continue
+            if any(
+                other_field.startswith(f"{target_field}.")
+                or target_field.startswith(f"{other_field}.")
+                for other_field in written_fields
+            ):
+                continue
+            fused_convert_targets.add(target_field)
+        return frozenset(fused_convert_targets)
@@ -36,21 +36,17 @@ Processor Configuration
 
 import ipaddress
 import logging
-import os
-import tempfile
 from functools import cached_property
-from pathlib import Path
 from typing import Optional
 
 from attr import define, field, validators
-from filelock import FileLock
-from tldextract import TLDExtract
 
 from logprep.processor.base.exceptions import FieldExistsWarning
 from logprep.processor.domain_label_extractor.rule import DomainLabelExtractorRule
 from logprep.processor.field_manager.processor import FieldManager
-from logprep.util.getter import GetterFactory
+from logprep.util.artifacts import get_artifact
 from logprep.util.helper import add_and_overwrite, add_field_to, get_dotted_field_value
+from logprep.util.tld import TLDExtractor, get_tld_extractor
 from logprep.util.validators import list_of_urls_validator
 
 logger = logging.getLogger("DomainLabelExtractor")
@@ -80,28 +76,17 @@ class DomainLabelExtractor(FieldManager):
     __slots__ = ["detection_results", "_pre_detector_topic", "_ids"]
 
     @cached_property
-    def _tld_extractor(self):
+    def _tld_extractor(self) -> TLDExtractor:
         if self._config.tld_lists is not None:
-            _tld_extractor = TLDExtract(suffix_list_urls=self._config.tld_lists)
-        else:
-            _tld_extractor = TLDExtract()
-        return _tld_extractor
+            tld_lists = [
+                f"file://{get_artifact(tld_list).absolute()}" for tld_list in self._config.tld_lists
+            ]
+            return get_tld_extractor(tld_lists)
+        return get_tld_extractor()
 
     def setup(self):
         super().setup()
-        if self._config.tld_lists:
-            downloaded_tld_lists_paths = []
-            logger.debug("start tldlists download...")
-            for index, tld_list in enumerate(self._config.tld_lists):
-                logprep_tmp_dir = Path(tempfile.gettempdir()) / "logprep"
-                os.makedirs(logprep_tmp_dir, exist_ok=True)
-                list_path = logprep_tmp_dir / f"{self.name}-tldlist-{index}.dat"
-                if not os.path.isfile(list_path):
-                    with FileLock(list_path):
-                        list_path.touch()
-                        list_path.write_bytes(GetterFactory.from_string(tld_list).get_raw())
-                downloaded_tld_lists_paths.append(f"file://{str(list_path.absolute())}")
-            logger.debug("finished tldlists download...")
+        _ = self._tld_extractor  # trigger download
 
     def _apply_rules(self, event, rule: DomainLabelExtractorRule):
         """
@@ -34,26 +34,22 @@ Processor Configuration
 
 import datetime
 import logging
-import os
 import socket
-import tempfile
 from functools import cached_property
 from multiprocessing import context
 from multiprocessing.pool import ThreadPool
-from pathlib import Path
 from typing import Optional
 
 from attr import define, field, validators
-from filelock import FileLock
-from tldextract import TLDExtract
 
 from logprep.abc.processor import Processor
 from logprep.metrics.metrics import CounterMetric
 from logprep.processor.domain_resolver.rule import DomainResolverRule
+from logprep.util.artifacts import get_artifact
 from logprep.util.cache import Cache
-from logprep.util.getter import GetterFactory
 from logprep.util.hasher import SHA256Hasher
 from logprep.util.helper import add_field_to, get_dotted_field_value
+from logprep.util.tld import TLDExtractor, get_tld_extractor
 from logprep.util.validators import list_of_urls_validator
 
 logger = logging.getLogger("DomainResolver")
@@ -159,26 +155,17 @@ class DomainResolver(Processor):
         return ThreadPool(processes=1)
 
     @cached_property
-    def _tld_extractor(self):
+    def _tld_extractor(self) -> TLDExtractor:
         if self._config.tld_lists is not None:
-            return TLDExtract(suffix_list_urls=self._config.tld_lists)
-        return TLDExtract()
+            tld_lists = [
+                f"file://{get_artifact(tld_list).absolute()}" for tld_list in self._config.tld_lists
+            ]
+            return get_tld_extractor(tld_lists)
+        return get_tld_extractor()
 
     def setup(self):
         super().setup()
-        if self._config.tld_lists:
-            downloaded_tld_lists_paths = []
-            logger.debug("start tldlists download...")
-            for index, tld_list in enumerate(self._config.tld_lists):
-                logprep_tmp_dir = Path(tempfile.gettempdir()) / "logprep"
-                os.makedirs(logprep_tmp_dir, exist_ok=True)
-                list_path = logprep_tmp_dir / f"{self.name}-tldlist-{index}.dat"
-                if not os.path.isfile(list_path):
-                    with FileLock(list_path):
-                        list_path.touch()
-                        list_path.write_bytes(GetterFactory.from_string(tld_list).get_raw())
-                downloaded_tld_lists_paths.append(f"file://{str(list_path.absolute())}")
-            logger.debug("finished tldlists download...")
+        _ = self._tld_extractor  # trigger download
 
     def _apply_rules(self, event, rule):
         source_field = rule.source_fields[0]
@@ -30,13 +30,11 @@ Processor Configuration
 """
 
 import itertools
-from collections import namedtuple
 
 from logprep.abc.processor import Processor
 from logprep.processor.base.exceptions import FieldExistsWarning
 from logprep.processor.field_manager.rule import FieldManagerRule
 from logprep.util.helper import (
-    add_and_overwrite,
     add_field_to,
     get_dotted_field_value,
     pop_dotted_field_value,
@@ -62,14 +60,13 @@ class FieldManager(Processor):
             self._apply_single_target_processing(event, rule, rule_args)
 
     def _apply_single_target_processing(self, event, rule, rule_args):
-        source_fields, target_field, _, extend_target_list, overwrite_target = rule_args
-        source_field_values = self._get_field_values(event, rule.source_fields)
+        source_fields, _, _, _, _ = rule_args
+        source_field_values = self._get_field_values(event, source_fields)
         self._handle_missing_fields(event, rule, source_fields, source_field_values)
-        source_field_values = list(filter(lambda x: x is not None, source_field_values))
+        source_field_values = [value for value in source_field_values if value is not None]
         if not source_field_values:
             return
-        args = (event, target_field, source_field_values)
-        self._write_to_single_target(args, extend_target_list, overwrite_target, rule)
+        rule.single_target_writer(event, rule, source_field_values)
 
     def _apply_mapping(self, event, rule, rule_args):
         source_fields, _, mapping, _, _ = rule_args
@@ -101,82 +98,6 @@ class FieldManager(Processor):
             ]
             raise FieldExistsWarning(rule, event, unsuccessful_targets)
 
-    def _write_to_single_target(self, args, extend_target_list, overwrite_target, rule):
-        event, target_field, source_fields_values = args
-        target_field_value = get_dotted_field_value(event, target_field)
-        State = namedtuple(
-            "State",
-            ["overwrite", "extend", "single_source_element", "target_is_list", "target_is_none"],
-        )
-        state = State(
-            overwrite=overwrite_target,
-            extend=extend_target_list,
-            single_source_element=len(source_fields_values) == 1,
-            target_is_list=isinstance(target_field_value, list),
-            target_is_none=target_field_value is None,
-        )
-        if state.single_source_element and not state.extend:
-            source_fields_values = source_fields_values.pop()
-
-        match state:
-            case State(
-                extend=True, overwrite=True, single_source_element=False, target_is_list=False
-            ):
-                add_and_overwrite(event, target_field, source_fields_values)
-                return
-
-            case State(
-                extend=True,
-                overwrite=False,
-                single_source_element=False,
-                target_is_list=False,
-                target_is_none=True,
-            ):
-                flattened_source_fields = self._overwrite_from_source_values(source_fields_values)
-                source_fields_values = [*flattened_source_fields]
-                add_and_overwrite(event, target_field, source_fields_values)
-                return
-
-            case State(extend=True, overwrite=False, target_is_list=False, target_is_none=True):
-                add_and_overwrite(event, target_field, source_fields_values)
-                return
-
-            case State(extend=True, overwrite=False, target_is_list=False):
-                source_fields_values = [target_field_value, *source_fields_values]
-                add_and_overwrite(event, target_field, source_fields_values)
-                return
-
-            case State(
-                extend=True, overwrite=False, single_source_element=False, target_is_list=True
-            ):
-                flattened_source_fields = self._overwrite_from_source_values(source_fields_values)
-                source_fields_values = [*target_field_value, *flattened_source_fields]
-                add_and_overwrite(event, target_field, source_fields_values)
-                return
-
-            case State(overwrite=True, extend=True):
-                flattened_source_fields = self._overwrite_from_source_values(source_fields_values)
-                source_fields_values = [*flattened_source_fields]
-                add_and_overwrite(event, target_field, source_fields_values)
-                return
-
-            case _:
-                success = add_field_to(
-                    event, target_field, source_fields_values, state.extend, state.overwrite
-                )
-                if not success:
-                    raise FieldExistsWarning(rule, event, [target_field])
-
-    def _overwrite_from_source_values(self, source_fields_values):
-        duplicates = []
-        ordered_flatten_list = []
-        flat_source_fields = self._get_flatten_source_fields(source_fields_values)
-        for field_value in flat_source_fields:
-            if field_value not in duplicates:
-                duplicates.append(field_value)
-                ordered_flatten_list.append(field_value)
-        return ordered_flatten_list
-
     def _handle_missing_fields(self, event, rule, source_fields, field_values):
         if rule.ignore_missing_fields:
             return False
@@ -200,16 +121,6 @@ class FieldManager(Processor):
         error = BaseException(f"{self.name}: missing source_fields: {missing_fields}")
         return error
 
-    @staticmethod
-    def _get_flatten_source_fields(source_fields_values):
-        flat_source_fields = []
-        for item in source_fields_values:
-            if isinstance(item, list):
-                flat_source_fields.extend(item)
-            else:
-                flat_source_fields.append(item)
-        return flat_source_fields
-
     @staticmethod
     def _filter_missing_fields(source_field_values, targets):
         if None in source_field_values:
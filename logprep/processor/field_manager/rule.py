@@ -76,9 +76,13 @@ Examples for field_manager:
 
 """
 
+from functools import cached_property
+from typing import Callable
+
 from attrs import define, field, validators
 
 from logprep.processor.base.rule import Rule
+from logprep.processor.field_manager.writers import get_single_target_writer
 from logprep.util.helper import get_dotted_field_value
 
 FIELD_PATTERN = r"\$\{([+&?]?[^${}]*)\}"
@@ -170,3 +174,9 @@ class FieldManagerRule(Rule):
         return self._config.ignore_missing_fields
 
     # pylint: enable=missing-function-docstring
+
+    @cached_property
+    def single_target_writer(self) -> Callable:
+        """The function that writes the source field values into the target field.
+        It is chosen once by :code:`extend_target_list` and :code:`overwrite_target`."""
+        return get_single_target_writer(self.extend_target_list, self.overwrite_target)
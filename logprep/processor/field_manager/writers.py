@@ -0,0 +1,86 @@
+"""Writers for the values of one or more source fields into the single target field of a rule.
+
+The writer of a rule is chosen once on rule creation by the static flags
+:code:`extend_target_list` and :code:`overwrite_target` of the rule, so only the checks that depend
+on the event, i.e. the number of source field values and the type of the existing target field
+value, are done per event.
+"""
+
+from typing import TYPE_CHECKING, Callable, List
+
+from logprep.processor.base.exceptions import FieldExistsWarning
+from logprep.util.helper import add_and_overwrite, add_field_to, get_dotted_field_value
+
+if TYPE_CHECKING:  # pragma: no cover
+    from logprep.processor.field_manager.rule import FieldManagerRule
+
+
+def get_flatten_source_fields(source_fields_values: list) -> list:
+    """Returns the source field values with list values flattened by one level."""
+    flat_source_fields = []
+    for item in source_fields_values:
+        if isinstance(item, list):
+            flat_source_fields.extend(item)
+        else:
+            flat_source_fields.append(item)
+    return flat_source_fields
+
+
+def get_unique_flatten_source_fields(source_fields_values: list) -> list:
+    """Returns the flattened source field values without duplicates in their original order."""
+    duplicates = []
+    ordered_flatten_list = []
+    for field_value in get_flatten_source_fields(source_fields_values):
+        if field_value not in duplicates:
+            duplicates.append(field_value)
+            ordered_flatten_list.append(field_value)
+    return ordered_flatten_list
+
+
+def write_without_extending(event: dict, rule: "FieldManagerRule", values: list) -> None:
+    """Writes a single value as it is and multiple values as list into the target field."""
+    content = values[0] if len(values) == 1 else values
+    if not add_field_to(event, rule.target_field, content, False, rule.overwrite_target):
+        raise FieldExistsWarning(rule, event, [rule.target_field])
+
+
+def write_extending_and_overwriting(event: dict, rule: "FieldManagerRule", values: list) -> None:
+    """Replaces the target field with a list of the values. The values are flattened and
+    deduplicated unless there are multiple values and the target field is not a list."""
+    target_field_value = get_dotted_field_value(event, rule.target_field)
+    if len(values) > 1 and not isinstance(target_field_value, list):
+        add_and_overwrite(event, rule.target_field, values)
+        return
+    add_and_overwrite(event, rule.target_field, get_unique_flatten_source_fields(values))
+
+
+def write_extending(event: dict, rule: "FieldManagerRule", values: list) -> None:
+    """Extends the target field with the values and converts an existing non-list target field
+    value into the first element of the resulting list."""
+    target_field = rule.target_field
+    target_field_value = get_dotted_field_value(event, target_field)
+    if not isinstance(target_field_value, list):
+        if target_field_value is not None:
+            add_and_overwrite(event, target_field, [target_field_value, *values])
+        elif len(values) > 1:
+            add_and_overwrite(event, target_field, get_unique_flatten_source_fields(values))
+        else:
+            add_and_overwrite(event, target_field, values)
+        return
+    if len(values) > 1:
+        flattened_values = get_unique_flatten_source_fields(values)
+        add_and_overwrite(event, target_field, [*target_field_value, *flattened_values])
+        return
+    if not add_field_to(event, target_field, values, True, False):
+        raise FieldExistsWarning(rule, event, [target_field])
+
+
+def get_single_target_writer(
+    extend_target_list: bool, overwrite_target: bool
+) -> Callable[[dict, "FieldManagerRule", List], None]:
+    """Returns the writer for the given rule flags."""
+    if not extend_target_list:
+        return write_without_extending
+    if overwrite_target:
+        return write_extending_and_overwriting
+    return write_extending
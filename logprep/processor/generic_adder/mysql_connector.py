@@ -2,7 +2,7 @@
 
 import logging
 import time
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 import mysql
 import mysql.connector as db
@@ -21,6 +21,10 @@ class MySQLConnector:
     _add_target_column: bool
     """Determines if the target column itself will be added to the event"""
 
+    update_column: Optional[str]
+    """The name of a column with monotonically increasing values on insert and update of a row,
+    e.g. an update timestamp, that is used to retrieve only changed rows"""
+
     table_name: str
     """The table name to use when connecting to the MySQL database"""
 
@@ -59,6 +63,7 @@ class MySQLConnector:
 
         self.target_column = sql_config["target_column"]
         self._add_target_column = sql_config.get("add_target_column", False)
+        self.update_column = sql_config.get("update_column")
 
         self.table_name = sql_config["table"]
 
@@ -133,6 +138,31 @@ class MySQLConnector:
         self.connection.commit()
         return checksum
 
+    def get_table_state(self) -> Tuple[Any, int, int]:
+        """Get the latest value of the update column, the number of rows and the number of
+        distinct upper case values of the target column of the SQL table.
+
+        Comparing this state with the state of the last update is much cheaper than calculating
+        the checksum of the whole table. The number of distinct keys decreases if rows are deleted
+        or their target column is changed, which can not be detected via the update column.
+
+        Returns
+        -------
+        Tuple[Any, int, int]
+            The maximum value of the update column, the number of rows and the number of keys.
+            Values of the update column that are neither numbers nor None are returned as string.
+
+        """
+        self.cursor.execute(
+            f"SELECT MAX({self.update_column}), COUNT(*), "  # nosemgrep
+            f"COUNT(DISTINCT CAST(UPPER({self.target_column}) AS BINARY)) FROM {self.table_name}"
+        )
+        last_update, row_count, key_count = next(self.cursor)
+        self.connection.commit()
+        if last_update is not None and not isinstance(last_update, (int, float)):
+            last_update = str(last_update)
+        return last_update, row_count, key_count
+
     def get_data(self) -> dict:
         """Get addition data from a configured SQL table.
 
@@ -147,40 +177,72 @@ class MySQLConnector:
 
         """
         self._last_table_checksum = self._get_checksum()
-
-        table = {}
-        target_col = 0
-
         try:
-            self.cursor.execute(f"desc {self.table_name}")  # nosemgrep
-            col_names = []
-            for idx, column_desc in enumerate(self.cursor):
-                col_names.append(column_desc[0])
-                if column_desc[0] == self.target_column:
-                    target_col = idx
-
-            self.cursor.execute(f"SELECT * FROM {self.table_name}")  # nosemgrep
-
-            for row_vals in self.cursor:
-                if self._add_target_column:
-                    column_dict = tuple(
-                        (
-                            [col_names[idx], col]
-                            for idx, col in enumerate(row_vals)
-                            if col_names[idx].upper() != "ID"
-                        )
-                    )
-                else:
-                    column_dict = tuple(
-                        (
-                            [col_names[idx], col]
-                            for idx, col in enumerate(row_vals)
-                            if idx != target_col and col_names[idx].upper() != "ID"
-                        )
-                    )
-                table[row_vals[target_col].upper()] = column_dict
-
-            return table
+            return self._get_rows(f"SELECT * FROM {self.table_name}")  # nosemgrep
         except db.Error as error:
             logger.warning(f"Error retrieving entry from database: {error}")
             return {}
+
+    def get_changed_data(self, since: Any = None) -> Optional[dict]:
+        """Get addition data of the rows that have been changed since the given value of the
+        update column.
+
+        Rows with an update column value equal to :code:`since` are retrieved again, since rows
+        with the same value could have been committed after the last retrieval.
+
+        Parameters
+        ----------
+        since : Any
+            The latest value of the update column that has already been retrieved.
+            All rows are retrieved if it is None.
+
+        Returns
+        -------
+        Optional[dict]
+            A dict like the one returned by :code:`get_data` that contains only the changed rows
+            or None if the rows could not be retrieved.
+
+        """
+        query = f"SELECT * FROM {self.table_name}"  # nosemgrep
+        try:
+            if since is None:
+                return self._get_rows(query)
+            return self._get_rows(f"{query} WHERE {self.update_column} >= %s", (since,))
+        except db.Error as error:
+            logger.warning(f"Error retrieving changed entries from database: {error}")
+            return None
+
+    def _get_rows(self, query: str, params: tuple = ()) -> dict:
+        table = {}
+        target_col = 0
+
+        self.cursor.execute(f"desc {self.table_name}")  # nosemgrep
+        col_names = []
+        for idx, column_desc in enumerate(self.cursor):
+            col_names.append(column_desc[0])
+            if column_desc[0] == self.target_column:
+                target_col = idx
+        excluded_columns = {
+            idx
+            for idx, col_name in enumerate(col_names)
+            if col_name.upper() == "ID" or col_name == self.update_column
+        }
+        if not self._add_target_column:
+            excluded_columns.add(target_col)
+
+        if params:
+            self.cursor.execute(query, params)
+        else:
+            self.cursor.execute(query)
+
+        for row_vals in self.cursor:
+            column_dict = tuple(
+                (
+                    [col_names[idx], col]
+                    for idx, col in enumerate(row_vals)
+                    if idx not in excluded_columns
+                )
+            )
+            table[row_vals[target_col].upper()] = column_dict
+
+        return table
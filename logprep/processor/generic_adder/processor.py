@@ -25,6 +25,7 @@ Processor Configuration
             target_column: example_column
             add_target_column: True
             timer: 0.1
+            update_column: updated_at
 
 .. autoclass:: logprep.processor.generic_adder.processor.GenericAdder.Config
    :members:
@@ -39,7 +40,7 @@ import json
 import os
 import re
 import time
-from typing import Optional
+from typing import Optional, Union
 
 from attr import define, field, validators
 from filelock import FileLock
@@ -49,6 +50,7 @@ from logprep.factory_error import InvalidConfigurationError
 from logprep.processor.base.exceptions import FieldExistsWarning
 from logprep.processor.generic_adder.mysql_connector import MySQLConnector
 from logprep.processor.generic_adder.rule import GenericAdderRule
+from logprep.processor.generic_adder.table_index import SharedTableIndex
 from logprep.util.helper import add_field_to, get_dotted_field_value
 
 
@@ -62,6 +64,12 @@ def sql_config_validator(_, attribute, value):
             raise InvalidConfigurationError(
                 "Table in 'sql_config' may only contain alphanumeric characters and underscores!"
             )
+        update_column = value.get("update_column")
+        if update_column is not None and not re.search(r"^[a-zA-Z0-9_]+$", str(update_column)):
+            raise InvalidConfigurationError(
+                "Update column in 'sql_config' may only contain alphanumeric characters and "
+                "underscores!"
+            )
 
 
 class GenericAdder(Processor):
@@ -102,6 +110,18 @@ class GenericAdder(Processor):
           (default: ./sql_update.lock).
         - `db_file_path` - Path to a file used to store the SQL table obtained by the generic adder
           (default: ./sql_db_table.json).
+        - `update_column` - (Optional) Name of a column whose value increases monotonically if a
+          row is inserted or updated, e.g. an update timestamp with an index. If it is set, only
+          the rows that have been changed since the last update are retrieved from the database.
+          They are written into a SQLite file at `db_index_path` that is shared by all processes
+          instead of storing the whole table in `db_file_path`, so processes look up rows in this
+          file instead of reloading the whole table on a change.
+          The table is only reloaded completely if rows have been deleted or the value of their
+          target column has been changed, which is detected by comparing the number of distinct
+          values of the target column with the number of rows in the SQLite file.
+          The update column itself is not added to the event.
+        - `db_index_path` - Path to the SQLite file that is used if `update_column` is set
+          (default: ./sql_db_table.sqlite).
 
           .. security-best-practice::
              :title: Processor - GenericAdder
@@ -120,8 +140,8 @@ class GenericAdder(Processor):
         "_file_check_interval",
     ]
 
-    _db_table: Optional[dict]
-    """Dict containing table from SQL database"""
+    _db_table: Optional[Union[dict, SharedTableIndex]]
+    """Dict or shared index containing table from SQL database"""
 
     _db_connector: MySQLConnector
     """Connector for MySQL database"""
@@ -159,10 +179,19 @@ class GenericAdder(Processor):
             self._file_lock_path = sql_config.get("file_lock_path", "sql_update.lock")
             self._db_file_path = sql_config.get("db_file_path", "sql_db_table.json")
             self._file_check_interval = sql_config.get("timer", 60 * 3)
+            if self._db_connector.update_column:
+                self._db_table = SharedTableIndex(
+                    sql_config.get("db_index_path", "sql_db_table.sqlite")
+                )
 
             self._check_connection()
             self._update_db_table()
 
+    def shut_down(self):
+        if isinstance(self._db_table, SharedTableIndex):
+            self._db_table.close()
+        super().shut_down()
+
     def _check_connection(self):
         """Check connections with lock to prevent a sudden spike of connections to the database.
 
@@ -176,7 +205,9 @@ class GenericAdder(Processor):
         if self._db_connector.time_to_check_for_change():
             with FileLock(self._file_lock_path):  # pylint: disable=abstract-class-instantiated
                 now = time.time()
-                if self._check_if_file_not_exists_or_stale(now):
+                if isinstance(self._db_table, SharedTableIndex):
+                    self._update_db_index(now)
+                elif self._check_if_file_not_exists_or_stale(now):
                     self._update_from_db_and_write_to_file()
                 else:
                     self._load_from_file()
@@ -195,6 +226,54 @@ class GenericAdder(Processor):
         finally:
             self._db_connector.disconnect()
 
+    def _update_db_index(self, now):
+        """Updates the shared index with the rows that have changed since the last update of any
+        process, if the last update is older than the check interval."""
+        state = self._db_table.get_state()
+        if now - state.get("updated_at", 0) > self._file_check_interval:
+            self._update_db_index_from_db(state, now)
+        self._db_table.refresh()
+
+    def _update_db_index_from_db(self, state, now):
+        self._db_connector.connect()
+        try:
+            last_update, row_count, key_count = self._db_connector.get_table_state()
+            new_state = {
+                "last_update": last_update,
+                "row_count": row_count,
+                "key_count": key_count,
+                "key_count_offset": state.get("key_count_offset"),
+                "updated_at": now,
+            }
+            if "key_count_offset" not in state or row_count < state["row_count"]:
+                self._replace_db_index(new_state)
+                return
+            if [last_update, row_count, key_count] == [
+                state["last_update"],
+                state["row_count"],
+                state["key_count"],
+            ]:
+                self._db_table.set_state(new_state)
+                return
+            table = self._db_connector.get_changed_data(since=state["last_update"])
+            if table is None:
+                return
+            self._db_table.update(table, new_state)
+            if len(self._db_table) - key_count != state["key_count_offset"]:
+                # the index still contains keys of deleted rows or of rows whose target column has
+                # been changed, since all other rows have been inserted or updated
+                self._replace_db_index(new_state)
+        finally:
+            self._db_connector.disconnect()
+
+    def _replace_db_index(self, state):
+        table = self._db_connector.get_changed_data()
+        if table is not None:
+            # keys that differ in the database, but not after converting them to upper case in
+            # python, would otherwise cause a full reload on every update
+            state["key_count_offset"] = len(table) - state["key_count"]
+            self._db_table.replace(table, state)
+
     def _check_if_file_not_exists_or_stale(self, now):
         if not os.path.isfile(self._db_file_path):
             return True
@@ -262,11 +341,9 @@ class GenericAdder(Processor):
             value_to_map = match_with_value_in_db.group(1).upper()
             add_from_db = self._db_table.get(value_to_map, [])
 
-            if rule.db_destination_prefix:
-                for idx, _ in enumerate(add_from_db):
-                    if not add_from_db[idx][0].startswith(rule.db_destination_prefix):
-                        add_from_db[idx][0] = f"{rule.db_destination_prefix}.{add_from_db[idx][0]}"
-
-            for item in add_from_db:
-                items_to_add.append(item)
+            prefix = rule.db_destination_prefix
+            for dotted_field, value in add_from_db:
+                if prefix and not dotted_field.startswith(prefix):
+                    dotted_field = f"{prefix}.{dotted_field}"
+                items_to_add.append((dotted_field, value))
         return items_to_add
@@ -0,0 +1,164 @@
+"""This module provides an index of a SQL table that is shared by all processes via a SQLite file.
+
+The rows are stored by the value of their target column in a SQLite database file that is
+memory-mapped by every process. Changed rows are written once into this file by the process that
+updates the table and are visible to all other processes without reloading the whole table.
+Rows are looked up per event instead of keeping the whole table in the memory of every process.
+Recently looked up rows are cached per process until the file is changed.
+The items of the rows are pickled, so their values keep the types returned by the database
+connector, e.g. :code:`Decimal` or :code:`datetime`, like in the table of the processes that
+retrieved the rows from the database.
+"""
+
+import json
+import pickle
+import sqlite3
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Optional
+
+MMAP_SIZE = 1 << 30
+"""Maximum number of bytes of the SQLite file that are memory-mapped"""
+
+CACHED_ROWS = 10000
+"""Maximum number of looked up rows that are cached per process"""
+
+
+class SharedTableIndex:
+    """Maps the values of the target column of a SQL table to the items of its row that can be
+    added by the generic adder."""
+
+    _path: str
+
+    _data_version: Optional[int]
+    """Version of the SQLite file on the last refresh, changes if another process writes to it"""
+
+    _is_empty: bool
+
+    def __init__(self, path: str):
+        self._path = path
+        self._data_version = None
+        self._is_empty = True
+
+    @cached_property
+    def _connection(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._path)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS table_rows (key TEXT PRIMARY KEY, items BLOB NOT NULL)"
+                " WITHOUT ROWID"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS table_state (name TEXT PRIMARY KEY, value TEXT)"
+            )
+        return connection
+
+    @cached_property
+    def _lookup(self) -> Callable:
+        return lru_cache(maxsize=CACHED_ROWS)(self._lookup_items)
+
+    def _lookup_items(self, key: str) -> Optional[tuple]:
+        row = self._connection.execute(
+            "SELECT items FROM table_rows WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return tuple(tuple(item) for item in pickle.loads(row[0]))  # nosemgrep
+
+    def __bool__(self) -> bool:
+        return not self._is_empty
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM table_rows").fetchone()[0]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the items of the row whose target column has the given value.
+
+        Parameters
+        ----------
+        key : str
+            The upper case value of the target column.
+        default : Any
+            The value to return if there is no such row.
+
+        Returns
+        -------
+        Any
+            A tuple of field name and value pairs or the default value.
+        """
+        items = self._lookup(key)
+        return default if items is None else items
+
+    def refresh(self) -> None:
+        """Clears the cached rows if the file has been changed by another process."""
+        data_version = self._connection.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._on_change()
+
+    def get_state(self) -> dict:
+        """Returns the state of the last update that has been stored by :code:`replace`,
+        :code:`update` or :code:`set_state`."""
+        rows = self._connection.execute("SELECT name, value FROM table_state").fetchall()
+        return {name: json.loads(value) for name, value in rows}
+
+    def set_state(self, state: dict) -> None:
+        """Stores the state of the last update for the next update in any process."""
+        with self._connection:
+            self._write_state(state)
+
+    def replace(self, table: dict, state: dict) -> None:
+        """Replaces all rows with the rows of the given table.
+
+        Parameters
+        ----------
+        table : dict
+            The rows as returned by :code:`MySQLConnector.get_data`.
+        state : dict
+            The state of the update.
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM table_rows")
+            self._write_rows(table)
+            self._write_state(state)
+        self._on_change()
+
+    def update(self, table: dict, state: dict) -> None:
+        """Inserts the rows of the given table or replaces existing rows with the same key.
+
+        Parameters
+        ----------
+        table : dict
+            The changed rows as returned by :code:`MySQLConnector.get_changed_data`.
+        state : dict
+            The state of the update.
+        """
+        with self._connection:
+            self._write_rows(table)
+            self._write_state(state)
+        self._on_change()
+
+    def close(self) -> None:
+        """Closes the connection to the SQLite file."""
+        if "_connection" in self.__dict__:
+            self._connection.close()
+            del self._connection
+
+    def _write_rows(self, table: dict) -> None:
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO table_rows (key, items) VALUES (?, ?)",
+            ((key, pickle.dumps(items)) for key, items in table.items()),
+        )
+
+    def _write_state(self, state: dict) -> None:
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO table_state (name, value) VALUES (?, ?)",
+            ((name, json.dumps(value, default=str)) for name, value in state.items()),
+        )
+
+    def _on_change(self) -> None:
+        self._lookup.cache_clear()
+        self._is_empty = (
+            self._connection.execute("SELECT 1 FROM table_rows LIMIT 1").fetchone() is None
+        )
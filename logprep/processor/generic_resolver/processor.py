@@ -25,7 +25,6 @@ Processor Configuration
 .. automodule:: logprep.processor.generic_resolver.rule
 """
 
-import re
 from typing import Union
 
 from logprep.processor.base.exceptions import (
@@ -72,9 +71,8 @@ class GenericResolver(FieldManager):
 
             # FILE
             if rule.resolve_from_file:
-                pattern = f'^{rule.resolve_from_file["pattern"]}$'
                 replacements = self._replacements_from_file[rule.resolve_from_file["path"]]
-                matches = re.match(pattern, source_value)
+                matches = rule.resolve_from_file_pattern.match(source_value)
                 if matches:
                     mapping = matches.group("mapping") if "mapping" in matches.groupdict() else None
                     if mapping is None:
@@ -91,18 +89,17 @@ class GenericResolver(FieldManager):
                             conflicting_fields.append(target_field)
 
             # LIST
-            for pattern, dest_val in rule.resolve_list.items():
-                if re.search(pattern, source_value):
-                    success = add_field_to(
-                        event,
-                        target_field,
-                        dest_val,
-                        extends_lists=rule.extend_target_list,
-                        overwrite_output_field=rule.overwrite_target,
-                    )
-                    if not success:
-                        conflicting_fields.append(target_field)
-                    break
+            matching_index = rule.resolve_list_matcher.search(source_value)
+            if matching_index is not None:
+                success = add_field_to(
+                    event,
+                    target_field,
+                    rule.resolve_list_matcher.values[matching_index],
+                    extends_lists=rule.extend_target_list,
+                    overwrite_output_field=rule.overwrite_target,
+                )
+                if not success:
+                    conflicting_fields.append(target_field)
         self._handle_missing_fields(event, rule, rule.field_mapping.keys(), source_values)
         if conflicting_fields:
             raise FieldExistsWarning(rule, event, conflicting_fields)
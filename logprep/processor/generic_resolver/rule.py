@@ -72,10 +72,103 @@ if the value in :code:`to_resolve` begins with number, ends with numbers and con
    :noindex:
 """
 
+import re
+from typing import List, Optional, Pattern, Tuple
+
 from attrs import define, field, validators
 
+from logprep.filter.expression.filter_expression import FilterExpression
+from logprep.processor.base.exceptions import InvalidRuleDefinitionError
 from logprep.processor.field_manager.rule import FieldManagerRule
 
+REGEX_META_CHARACTERS = frozenset(".^$*+?{}[]\\|()")
+BACKREFERENCE_PATTERN = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+class ResolveListMatcher:
+    """Ordered multi-pattern matcher for resolve lists.
+
+    Returns the index of the first pattern in the resolve list that would be found by
+    :code:`re.search`. Anchored literal patterns (e.g. :code:`^foo$`) are resolved with a
+    dictionary lookup, all other patterns are combined into one regex whose alternatives are
+    tried in resolve list order. If the patterns can not be combined (e.g. because they use
+    backreferences, conditional group references or global inline flags), they are searched
+    one after another.
+    """
+
+    __slots__ = ("values", "_exact_matches", "_patterns", "_combined", "_branch_indices")
+
+    values: List[str]
+
+    _exact_matches: dict
+
+    _patterns: List[Tuple[int, Pattern]]
+
+    _combined: Optional[Pattern]
+
+    _branch_indices: dict
+
+    def __init__(self, resolve_list: dict):
+        self.values = list(resolve_list.values())
+        self._exact_matches = {}
+        self._patterns = []
+        for index, pattern in enumerate(resolve_list):
+            literal = self._get_anchored_literal(pattern)
+            if literal is not None:
+                self._exact_matches.setdefault(literal, index)
+            else:
+                self._patterns.append((index, re.compile(pattern)))
+        self._combined, self._branch_indices = self._combine(self._patterns)
+
+    @staticmethod
+    def _get_anchored_literal(pattern: str) -> Optional[str]:
+        if len(pattern) < 3 or pattern[0] != "^" or pattern[-1] != "$":
+            return None
+        literal = pattern[1:-1]
+        if REGEX_META_CHARACTERS.intersection(literal):
+            return None
+        return literal
+
+    @staticmethod
+    def _combine(patterns: List[Tuple[int, Pattern]]) -> Tuple[Optional[Pattern], dict]:
+        """Combines the patterns to one regex of the form :code:`(?=.*?P0)()|(?=.*?P1)()|...`.
+        The alternatives are tried in order at the start of the value and every lookahead
+        behaves like :code:`re.search`. The empty group after each lookahead identifies the
+        matching alternative via :code:`lastindex`."""
+        if not patterns:
+            return None, {}
+        if any(BACKREFERENCE_PATTERN.search(pattern.pattern) for _, pattern in patterns):
+            return None, {}
+        branches = []
+        branch_indices = {}
+        group_number = 0
+        for index, pattern in patterns:
+            group_number += pattern.groups + 1
+            branch_indices[group_number] = index
+            branches.append(rf"(?=[\s\S]*?(?:{pattern.pattern}))()")
+        try:
+            return re.compile("|".join(branches)), branch_indices
+        except re.error:
+            return None, {}
+
+    def search(self, value: str) -> Optional[int]:
+        """Returns the index of the first matching pattern or None if no pattern matches."""
+        index = self._exact_matches.get(value)
+        if index is None and self._exact_matches and value.endswith("\n"):
+            index = self._exact_matches.get(value[:-1])
+        if self._combined is not None:
+            match = self._combined.match(value)
+            if match is not None:
+                regex_index = self._branch_indices[match.lastindex]
+                return regex_index if index is None else min(index, regex_index)
+            return index
+        for regex_index, pattern in self._patterns:
+            if index is not None and regex_index > index:
+                break
+            if pattern.search(value):
+                return regex_index
+        return index
+
 
 class GenericResolverRule(FieldManagerRule):
     """Check if documents match a filter."""
@@ -122,6 +215,29 @@ class GenericResolverRule(FieldManagerRule):
         The resolve list in the file at :code:`path` is then used in conjunction with
         the regex pattern in :code:`pattern`."""
 
+    resolve_list_matcher: Optional[ResolveListMatcher] = None
+    """precompiled matcher for :code:`resolve_list`"""
+
+    resolve_from_file_pattern: Optional[Pattern] = None
+    """precompiled and anchored :code:`resolve_from_file.pattern`"""
+
+    def __init__(
+        self,
+        filter_rule: FilterExpression,
+        config: "GenericResolverRule.Config",
+        processor_name: str,
+    ):
+        super().__init__(filter_rule, config, processor_name)
+        try:
+            self._compile_patterns()
+        except re.error as error:
+            raise InvalidRuleDefinitionError(f"invalid regex pattern: {error}") from error
+
+    def _compile_patterns(self):
+        self.resolve_list_matcher = ResolveListMatcher(self._config.resolve_list)
+        pattern = self._config.resolve_from_file.get("pattern")
+        self.resolve_from_file_pattern = re.compile(f"^{pattern}$") if pattern else None
+
     @property
     def field_mapping(self) -> dict:
         """Returns the field mapping"""
@@ -16,6 +16,12 @@ Processor Configuration
         generic_rules:
             - tests/testdata/geoip_enricher/rules/
         db_path: /path/to/GeoLite2-City.mmdb
+        max_cached_ips: 10000
+
+Lookup results are cached per IP in a LRU cache with a maximum size of
+:code:`max_cached_ips` entries. The cache is not shared between processes and not persisted.
+The metrics :code:`geoip_enricher_new_lookups`, :code:`geoip_enricher_cached_lookups` and
+:code:`geoip_enricher_num_cache_entries` show how effective the cache is.
 
 .. autoclass:: logprep.processor.geoip_enricher.processor.GeoipEnricher.Config
    :members:
@@ -27,21 +33,20 @@ Processor Configuration
 """
 
 import logging
-import os
-import tempfile
-from functools import cached_property
+from functools import cached_property, lru_cache
 from ipaddress import ip_address
-from pathlib import Path
 
 from attr import define, field, validators
-from filelock import FileLock
 from geoip2 import database
+from geoip2.database import MODE_MMAP
 from geoip2.errors import AddressNotFoundError
 
+from logprep.abc.processor import Processor
+from logprep.metrics.metrics import CounterMetric, GaugeMetric
 from logprep.processor.base.exceptions import FieldExistsWarning
 from logprep.processor.field_manager.processor import FieldManager
 from logprep.processor.geoip_enricher.rule import GEOIP_DATA_STUBS, GeoipEnricherRule
-from logprep.util.getter import GetterFactory
+from logprep.util.artifacts import get_artifact
 from logprep.util.helper import add_field_to, get_dotted_field_value
 
 logger = logging.getLogger("GeoipEnricher")
@@ -57,37 +62,95 @@ class GeoipEnricher(FieldManager):
         db_path: str = field(validator=validators.instance_of(str))
         """Path to a `Geo2Lite` city database by `Maxmind` in binary format.
             This must be provided separately.
-            The file will be downloaded or copied and cached.
+            Remote files will be downloaded once per node, cached and memory mapped
+            read-only by all processes.
             For valid URI formats see :ref:`getters`
             This product includes GeoLite2 data created by MaxMind, available from
             https://www.maxmind.com."""
 
-    __slots__ = []
+        max_cached_ips: int = field(
+            default=10000, validator=[validators.instance_of(int), validators.ge(0)]
+        )
+        """Maximum number of IPs whose lookup results are cached. Setting it to 0 disables
+        the cache."""
+
+    @define(kw_only=True)
+    class Metrics(Processor.Metrics):
+        """Tracks statistics about the GeoipEnricher"""
+
+        new_lookups: CounterMetric = field(
+            factory=lambda: CounterMetric(
+                description="Number of IPs that had to be looked up in the database",
+                name="geoip_enricher_new_lookups",
+            )
+        )
+        """Number of IPs that had to be looked up in the database"""
+        cached_lookups: CounterMetric = field(
+            factory=lambda: CounterMetric(
+                description="Number of IPs that were looked up from cache",
+                name="geoip_enricher_cached_lookups",
+            )
+        )
+        """Number of IPs that were looked up from cache"""
+        num_cache_entries: GaugeMetric = field(
+            factory=lambda: GaugeMetric(
+                description="Number of current cache entries",
+                name="geoip_enricher_num_cache_entries",
+            )
+        )
+        """Number of current cache entries"""
+
+    __slots__ = ["_cache_hits", "_cache_misses"]
+
+    _cache_hits: int
+
+    _cache_misses: int
 
     rule_class = GeoipEnricherRule
 
+    def __init__(self, name: str, configuration: Processor.Config):
+        super().__init__(name, configuration)
+        self._cache_hits = 0
+        self._cache_misses = 0
+
     @cached_property
     def _city_db(self):
-        db_path = Path(self._config.db_path)
-        if not db_path.exists():
-            logger.debug("start geoip database download...")
-            logprep_tmp_dir = Path(tempfile.gettempdir()) / "logprep"
-            os.makedirs(logprep_tmp_dir, exist_ok=True)
-            db_path_file = logprep_tmp_dir / f"{self.name}.mmdb"
-            if not os.path.isfile(db_path_file):
-                with FileLock(db_path_file):
-                    db_path_file.touch()
-                    db_path_file.write_bytes(
-                        GetterFactory.from_string(str(self._config.db_path)).get_raw()
-                    )
-            db_path = str(db_path_file.absolute())
-            logger.debug("finished geoip database download.")
-        return database.Reader(db_path)
+        db_path = get_artifact(self._config.db_path)
+        return database.Reader(str(db_path), mode=MODE_MMAP)
 
     def setup(self):
         super().setup()
         _ = self._city_db  # trigger download
 
+    @cached_property
+    def _get_geoip_data_cached(self):
+        return lru_cache(maxsize=self._config.max_cached_ips)(self._get_geoip_data)
+
+    def _lookup_geoip_data(self, ip_string) -> tuple:
+        if not self._config.max_cached_ips or not isinstance(ip_string, str):
+            self.metrics.new_lookups += 1
+            return self._get_geoip_data(ip_string)
+        geoip_data = self._get_geoip_data_cached(ip_string)
+        self._update_cache_metrics()
+        return geoip_data
+
+    def _update_cache_metrics(self):
+        cache_info = self._get_geoip_data_cached.cache_info()
+        self.metrics.new_lookups += cache_info.misses - self._cache_misses
+        self.metrics.cached_lookups += cache_info.hits - self._cache_hits
+        self.metrics.num_cache_entries += cache_info.currsize
+        self._cache_hits, self._cache_misses = cache_info.hits, cache_info.misses
+
+    def _get_geoip_data(self, ip_string) -> tuple:
+        """Returns the geoip data without empty values as hashable tuple of subfields and
+        values, so it can be cached and shared between events."""
+        geoip_data = self._try_getting_geoip_data(ip_string)
+        return tuple(
+            (target_subfield, tuple(value) if isinstance(value, list) else value)
+            for target_subfield, value in geoip_data.items()
+            if value is not None
+        )
+
     def _try_getting_geoip_data(self, ip_string):
         try:
             ip_addr = str(ip_address(ip_string))
@@ -126,12 +189,10 @@ class GeoipEnricher(FieldManager):
         ip_string = get_dotted_field_value(event, rule.source_fields[0])
         if self._handle_missing_fields(event, rule, rule.source_fields, [ip_string]):
             return
-        geoip_data = self._try_getting_geoip_data(ip_string)
-        if not geoip_data:
-            return
-        for target_subfield, value in geoip_data.items():
-            if value is None:
-                continue
+        geoip_data = self._lookup_geoip_data(ip_string)
+        for target_subfield, value in geoip_data:
+            if isinstance(value, tuple):
+                value = list(value)
             full_output_field = f"{rule.target_field}.{target_subfield}"
             if target_subfield in rule.customize_target_subfields:
                 full_output_field = rule.customize_target_subfields.get(target_subfield)
@@ -148,6 +148,9 @@ class GrokkerRule(DissectorRule):
     def _set_convert_actions(self):
         pass
 
+    def _set_program(self):
+        pass
+
     def set_mapping_actions(self, custom_patterns_dir: str = None) -> None:
         """sets the mapping actions"""
         custom_patterns_dir = "" if custom_patterns_dir is None else custom_patterns_dir
@@ -32,8 +32,8 @@ Processor Configuration
 """
 
 import errno
-from os import makedirs, path
-from typing import Any, Dict, Tuple, Union
+from os import getpid, makedirs, path, replace
+from typing import List, Optional, Union
 
 from attr import define, field
 
@@ -45,7 +45,16 @@ from logprep.util.validators import directory_validator
 
 # pylint: disable=no-name-in-module
 try:
-    from hyperscan import HS_FLAG_CASELESS, HS_FLAG_SINGLEMATCH, Database, dumpb, loadb
+    from hyperscan import (
+        HS_FLAG_CASELESS,
+        HS_FLAG_SINGLEMATCH,
+        HS_MODE_BLOCK,
+        Database,
+        Scratch,
+        dumpb,
+        error,
+        loadb,
+    )
 except ModuleNotFoundError as error:  # pragma: no cover
     raise SkipImportError("hyperscan_resolver") from error
 
@@ -77,7 +86,9 @@ class HyperscanResolver(FieldManager):
         The database will be stored in the directory of the `hyperscan_resolver` if no path has
         been specified within the pipeline config.
         To update and recompile a persistently stored databases simply delete the whole directory.
-        The databases will be compiled again during the next run."""
+        The databases will be compiled again during the next run.
+        Databases are identified by a hash of the patterns in the resolve list,
+        so changed resolve lists never reuse stale databases."""
 
     __slots__ = ["_hyperscan_database_path", "_hyperscan_databases", "_replacements_from_file"]
 
@@ -101,18 +112,24 @@ class HyperscanResolver(FieldManager):
 
         self._replacements_from_file = {}
 
+    def setup(self):
+        super().setup()
+        for rule in self.rules:
+            if rule.resolve_list:
+                self._get_hyperscan_database(rule)
+
     def _apply_rules(self, event: dict, rule: HyperscanResolverRule):
         """Apply the given rule to the current event"""
         conflicting_fields = []
-        hyperscan_db, pattern_id_to_dest_val_map = self._get_hyperscan_database(rule)
+        hyperscan_db = self._get_hyperscan_database(rule)
 
         source_values = []
         for resolve_source, resolve_target in rule.field_mapping.items():
             src_val = get_dotted_field_value(event, resolve_source)
             source_values.append(src_val)
-            matches = self._match_with_hyperscan(hyperscan_db, src_val)
-            if matches:
-                dest_val = pattern_id_to_dest_val_map[matches[matches.index(min(matches))]]
+            pattern_id = self._match_with_hyperscan(hyperscan_db, src_val)
+            if pattern_id is not None:
+                dest_val = rule.resolve_values[pattern_id]
                 if dest_val:
                     add_success = self._add_uniquely_to_list(event, rule, resolve_target, dest_val)
                     if not add_success:
@@ -149,66 +166,53 @@ class HyperscanResolver(FieldManager):
         return add_success
 
     @staticmethod
-    def _match_with_hyperscan(hyperscan_db: Database, src_val: str) -> list:
+    def _match_with_hyperscan(hyperscan_db: Database, src_val: str) -> Optional[int]:
+        """Returns the lowest matching pattern id, which is the first pattern in the
+        resolve list that matches"""
         if not src_val:
-            return []
-
-        def on_match(matching_pattern_id: int, _fr, _to, _flags, _context):
-            result.append(matching_pattern_id)
-
-        result = []
-
-        hyperscan_db.scan(src_val.encode("utf-8"), match_event_handler=on_match)
-        return result
-
-    def _get_hyperscan_database(self, rule: HyperscanResolverRule):
-        database_id = rule.file_name
-        resolve_list = rule.resolve_list
-
-        if database_id not in self._hyperscan_databases:
+            return None
+        matches = []
+        hyperscan_db.scan(src_val.encode("utf-8"), match_event_handler=_on_match, context=matches)
+        return min(matches) if matches else None
+
+    def _get_hyperscan_database(self, rule: HyperscanResolverRule) -> Database:
+        database_id = rule.resolve_list_hash
+        database = self._hyperscan_databases.get(database_id)
+        if database is None:
             try:
-                database, value_mapping = self._load_database(database_id, resolve_list)
-            except FileNotFoundError:
-                database, value_mapping = self._create_database(resolve_list)
-
+                database = self._load_database(database_id)
+            except (FileNotFoundError, error):
+                database = self._create_database(rule.resolve_list)
                 if rule.store_db_persistent:
                     self._save_database(database, database_id)
+            self._hyperscan_databases[database_id] = database
+        return database
 
-            self._hyperscan_databases[database_id] = {}
-            self._hyperscan_databases[database_id]["db"] = database
-            self._hyperscan_databases[database_id]["value_mapping"] = value_mapping
-
-        return (
-            self._hyperscan_databases[database_id]["db"],
-            self._hyperscan_databases[database_id]["value_mapping"],
-        )
+    def _get_database_file_path(self, database_id: str) -> str:
+        return path.join(self._hyperscan_database_path, f"{database_id}.db")
 
-    def _load_database(self, database_id: int, resolve_list: dict) -> Tuple[Any, Dict[int, Any]]:
-        value_mapping = {}
+    def _load_database(self, database_id: str) -> Database:
+        with open(self._get_database_file_path(database_id), "rb") as db_file:
+            database = loadb(db_file.read(), HS_MODE_BLOCK)
+        database.scratch = Scratch(database)
+        return database
 
-        with open(f"{self._hyperscan_database_path}/{database_id}.db", "rb") as db_file:
-            data = db_file.read()
-
-        for idx, pattern in enumerate(resolve_list.keys()):
-            value_mapping[idx] = resolve_list[pattern]
-
-        return loadb(data), value_mapping
-
-    def _save_database(self, database: Database, database_id: int):
+    def _save_database(self, database: Database, database_id: str):
+        """Writes the serialized database to a temporary file first and moves it into place
+        afterwards, so that other processes never load a partially written database."""
         _create_hyperscan_dbs_dir(self._hyperscan_database_path)
-        serialized_db = dumpb(database)
+        database_file_path = self._get_database_file_path(database_id)
+        temporary_file_path = f"{database_file_path}.{getpid()}.tmp"
+        with open(temporary_file_path, "wb") as db_file:
+            db_file.write(dumpb(database))
+        replace(temporary_file_path, database_file_path)
 
-        with open(f"{self._hyperscan_database_path}/{database_id}.db", "wb") as db_file:
-            db_file.write(serialized_db)
-
-    def _create_database(self, resolve_list: dict):
+    def _create_database(self, resolve_list: dict) -> Database:
         database = Database()
-        value_mapping = {}
         db_patterns = []
 
         for idx, pattern in enumerate(resolve_list.keys()):
             db_patterns += [(pattern.encode("utf-8"), idx, HS_FLAG_SINGLEMATCH | HS_FLAG_CASELESS)]
-            value_mapping[idx] = resolve_list[pattern]
 
         if not db_patterns:
             raise HyperscanResolverError(self.name, "No patter to compile for hyperscan database!")
@@ -216,7 +220,11 @@ class HyperscanResolver(FieldManager):
         expressions, ids, flags = zip(*db_patterns)
         database.compile(expressions=expressions, ids=ids, elements=len(db_patterns), flags=flags)
 
-        return database, value_mapping
+        return database
+
+
+def _on_match(pattern_id: int, _from: int, _to: int, _flags: int, matches: List[int]):
+    matches.append(pattern_id)
 
 
 def _create_hyperscan_dbs_dir(path_: str):
@@ -19,8 +19,11 @@ if a database compiled from a rule's :code:`resolve_list` should be stored persi
    :noindex:
 """
 
+import hashlib
+import json
 import re
-from typing import Tuple
+from functools import cached_property
+from typing import List, Tuple
 
 from attrs import define, field, validators
 
@@ -161,6 +164,21 @@ class HyperscanResolverRule(GenericResolverRule):
                     )
             return pattern, resolve_file_path
 
+    def _compile_patterns(self):
+        """Resolve lists are compiled into hyperscan databases by the processor."""
+
+    @cached_property
+    def resolve_list_hash(self) -> str:
+        """Returns a hash of the patterns in the resolve list that identifies the compiled
+        hyperscan database"""
+        patterns = json.dumps(list(self._config.resolve_list.keys()))
+        return hashlib.sha256(patterns.encode("utf-8")).hexdigest()
+
+    @cached_property
+    def resolve_values(self) -> List[str]:
+        """Returns the resolve values indexed by the hyperscan pattern ids"""
+        return list(self._config.resolve_list.values())
+
     # pylint: disable=C0111
     @property
     def field_mapping(self) -> dict:
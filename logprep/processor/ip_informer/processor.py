@@ -15,6 +15,10 @@ Processor Configuration
             - tests/testdata/rules/specific/
         generic_rules:
             - tests/testdata/rules/generic/
+        max_cached_ips: 10000
+
+The properties of an IP are cached per IP and configured properties in a LRU cache with a maximum
+size of :code:`max_cached_ips` entries. The cache is not shared between processes.
 
 .. autoclass:: logprep.processor.ip_informer.processor.IpInformer.Config
    :members:
@@ -26,19 +30,31 @@ Processor Configuration
 """
 
 import ipaddress
-from functools import partial
+from functools import cached_property, lru_cache, partial
 from itertools import chain
-from typing import Iterable
+from typing import Iterable, Optional, Tuple
+
+from attrs import define, field, validators
 
 from logprep.processor.base.exceptions import ProcessingWarning
 from logprep.processor.field_manager.processor import FieldManager
-from logprep.processor.ip_informer.rule import IpInformerRule, get_ip_property_names
+from logprep.processor.ip_informer.rule import DEFAULT_IP_PROPERTIES, IpInformerRule
 from logprep.util.helper import get_dotted_field_value
 
 
 class IpInformer(FieldManager):
     """A processor that enriches ip information"""
 
+    @define(kw_only=True)
+    class Config(FieldManager.Config):
+        """IpInformer config"""
+
+        max_cached_ips: int = field(
+            default=10000, validator=[validators.instance_of(int), validators.ge(0)]
+        )
+        """Maximum number of IPs whose properties are cached. Setting it to 0 disables
+        the cache."""
+
     __slots__ = ("_processing_warnings",)
 
     _processing_warnings: list[tuple[str, Exception]]
@@ -57,8 +73,12 @@ class IpInformer(FieldManager):
             raise ProcessingWarning(msg, rule, event) from error
 
     def _get_results(self, ip_address_list: Iterable, rule: IpInformerRule) -> dict:
-        results = [(ip, self._ip_properties(ip, rule)) for ip in ip_address_list]
-        return dict(filter(lambda x: bool(x[1]), results))
+        results = {}
+        for ip_address in ip_address_list:
+            properties = self._ip_properties(ip_address, rule)
+            if properties:
+                results[ip_address] = properties
+        return results
 
     def _get_flat_ip_address_list(self, event: dict, rule: IpInformerRule) -> Iterable:
         source_field_values = list(map(partial(get_dotted_field_value, event), rule.source_fields))
@@ -66,17 +86,30 @@ class IpInformer(FieldManager):
         str_elements = filter(lambda x: isinstance(x, str), source_field_values)
         return chain(*list_elements, str_elements)
 
+    @cached_property
+    def _get_ip_properties_cached(self):
+        return lru_cache(maxsize=self._config.max_cached_ips)(self._get_ip_properties)
+
+    @staticmethod
+    def _get_ip_properties(
+        ip_address: str, property_names: Optional[Tuple[str, ...]]
+    ) -> Tuple[Tuple[str, any], ...]:
+        ip_address = ipaddress.ip_address(ip_address)
+        if property_names is None:
+            property_names = DEFAULT_IP_PROPERTIES[ip_address.version]
+        return tuple(
+            (prop_name, getattr(ip_address, prop_name, False)) for prop_name in property_names
+        )
+
     def _ip_properties(self, ip_address: str, rule: IpInformerRule) -> dict[str, any]:
         try:
-            ip_address = ipaddress.ip_address(ip_address)
+            if isinstance(ip_address, (str, int)):
+                properties = self._get_ip_properties_cached(ip_address, rule.property_names)
+            else:
+                properties = self._get_ip_properties(ip_address, rule.property_names)
         except ValueError as error:
             self._processing_warnings.append(
                 (f"({self.name}): '{ip_address}' is not a valid IPAddress", error)
             )
-        properties = rule.properties
-        if "default" in properties:
-            return {
-                prop_name: getattr(ip_address, prop_name)
-                for prop_name in get_ip_property_names(ip_address.__class__)
-            }
-        return {prop_name: getattr(ip_address, prop_name, False) for prop_name in rule.properties}
+            return dict.fromkeys(rule.property_names or (), False)
+        return dict(properties)
@@ -58,7 +58,9 @@ Examples for ip_informer:
 
 """
 
+from functools import cached_property
 from ipaddress import IPv4Address, IPv6Address
+from typing import Optional, Tuple
 
 from attrs import define, field, validators
 
@@ -76,6 +78,12 @@ def get_ip_property_names(cls):
 
 IP_PROPERTIES = [*get_ip_property_names(IPv4Address), *get_ip_property_names(IPv6Address)]
 
+DEFAULT_IP_PROPERTIES = {
+    4: tuple(get_ip_property_names(IPv4Address)),
+    6: tuple(get_ip_property_names(IPv6Address)),
+}
+"""The properties that are extracted by default per IP version"""
+
 
 class IpInformerRule(FieldManagerRule):
     """IpInformerRule"""
@@ -114,3 +122,11 @@ class IpInformerRule(FieldManagerRule):
     def properties(self):
         """return the configured properties"""
         return self._config.properties
+
+    @cached_property
+    def property_names(self) -> Optional[Tuple[str, ...]]:
+        """return the configured properties as tuple or None if the default properties of the
+        respective IP version are extracted"""
+        if "default" in self._config.properties:
+            return None
+        return tuple(self._config.properties)
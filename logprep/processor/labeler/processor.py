@@ -31,6 +31,7 @@ from typing import Optional
 from attr import define, field, validators
 
 from logprep.abc.processor import Processor
+from logprep.framework.rule_tree.rule_tree import RuleTree
 from logprep.processor.labeler.labeling_schema import LabelingSchema
 from logprep.processor.labeler.rule import LabelerRule
 from logprep.util.helper import add_field_to, get_dotted_field_value, add_and_overwrite
@@ -71,37 +72,37 @@ class Labeler(Processor):
                 rule.add_parent_labels_from_schema(self._schema)
             rule.conforms_to_schema(self._schema)
 
-    def _apply_rules(self, event, rule):
-        """Applies the rule to the current event"""
-        self._add_label_fields(event, rule)
-        self._add_label_values(event, rule)
+    def _process_rule_tree(self, event: dict, tree: RuleTree):
+        super()._process_rule_tree(event, tree)
         self._convert_label_categories_to_sorted_list(event)
 
-    @staticmethod
-    def _add_label_fields(event: dict, rule: LabelerRule):
-        """Prepares the event by adding empty label fields"""
-        add_field_to(event, "label", {})
-        for key in rule.label:
-            add_field_to(event, f"label.{key}", set())
+    def _apply_rules(self, event, rule):
+        """Adds the labels of the rule to the label sets of the current event.
 
-    @staticmethod
-    def _add_label_values(event: dict, rule: LabelerRule):
-        """Adds the labels from the rule to the event"""
-        for key in rule.label:
-            label_key = f"label.{key}"
-            label = get_dotted_field_value(event, label_key)
-            if not isinstance(label, set):
+        The label sets are converted into sorted lists after each pass over a rule tree, so that
+        the rules of the next tree can match the labels. If rules are matched again after rules
+        have been applied within one pass, i.e. with :code:`apply_multiple_times` or if the rule
+        tree is bypassed, the label sets are converted after every rule.
+        """
+        for category, labels in rule.label_sets.items():
+            category_key = f"label.{category}"
+            label = get_dotted_field_value(event, category_key)
+            if label is None:
+                label = set()
+                add_field_to(event, category_key, label)
+            elif not isinstance(label, set):
                 label = set(label)
-                add_and_overwrite(event, label_key, label)
-            label.update(rule.label[key])
+                add_and_overwrite(event, category_key, label)
+            label.update(labels)
+        if self._config.apply_multiple_times or self._bypass_rule_tree:
+            self._convert_label_categories_to_sorted_list(event)
 
     @staticmethod
     def _convert_label_categories_to_sorted_list(event: dict):
-        label = get_dotted_field_value(event, "label")
-        if label is None:
+        label = event.get("label")
+        if not isinstance(label, dict):
             return
-        for category in label:
-            category_key = f"label.{category}"
-            category_value = get_dotted_field_value(event, category_key)
-            sorted_category = sorted(list(category_value))
-            add_and_overwrite(event, category_key, sorted_category)
+        if not any(isinstance(category_value, set) for category_value in label.values()):
+            return
+        for category, category_value in label.items():
+            label[category] = sorted(category_value)
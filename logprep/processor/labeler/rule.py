@@ -27,10 +27,11 @@ to the labels of the category :code:`action`:
    :noindex:
 """
 
-from typing import Iterable
+from typing import Dict, FrozenSet, Iterable
 
 from attrs import define, field, validators
 
+from logprep.filter.expression.filter_expression import FilterExpression
 from logprep.processor.field_manager.rule import FieldManagerRule
 from logprep.processor.labeler.labeling_schema import LabelingSchema
 
@@ -53,6 +54,15 @@ class LabelerRule(FieldManagerRule):
         )
         """Mapping of a category and a list of labels to add"""
 
+    label_sets: Dict[str, FrozenSet[str]]
+    """Labels per category as frozensets, including parent labels if they were added."""
+
+    def __init__(
+        self, filter_rule: FilterExpression, config: "LabelerRule.Config", processor_name: str
+    ):
+        super().__init__(filter_rule, config, processor_name)
+        self._set_label_sets()
+
     # pylint: disable=C0111
     @property
     def label(self) -> dict:
@@ -74,4 +84,10 @@ class LabelerRule(FieldManagerRule):
                 expanded_label[category].add(label)
                 for parent in schema.get_parent_labels(category, label):
                     expanded_label[category].add(parent)
-            self._config.label[category] = expanded_label[category]
+            self._config.label[category] = frozenset(expanded_label[category])
+        self._set_label_sets()
+
+    def _set_label_sets(self):
+        self.label_sets = {
+            category: frozenset(labels) for category, labels in self._config.label.items()
+        }
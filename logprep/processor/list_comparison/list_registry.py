@@ -0,0 +1,166 @@
+"""Process wide registry for the lists used by list comparison rules.
+
+Lists are loaded once per process setup and are identified by their resolved path.
+Lists with identical content share one frozenset, so rules referencing the same list
+do not hold their own copies of it. Local list files are only read again if their modification
+time or size changed.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from logprep.util.getter import FileGetter, GetterFactory
+
+logger = logging.getLogger("ListRegistry")
+
+
+class CompareList:
+    """Elements of a list file that are shared by all rules referencing it.
+
+    The elements are replaced in place if the list changes on refresh, so all rules holding
+    this object see the new elements immediately.
+    """
+
+    __slots__ = ("path", "checksum", "elements", "loaded_at", "file_state")
+
+    path: str
+    checksum: str
+    elements: FrozenSet[str]
+    loaded_at: float
+    """Monotonic time of the last load of the list"""
+    file_state: Optional[Tuple[int, int]]
+    """Modification time and size of a local list file on the last load or None for remote
+    lists"""
+
+    def __init__(
+        self,
+        path: str,
+        checksum: str,
+        elements: FrozenSet[str],
+        file_state: Optional[Tuple[int, int]] = None,
+    ):
+        self.path = path
+        self.checksum = checksum
+        self.elements = elements
+        self.loaded_at = time.monotonic()
+        self.file_state = file_state
+
+
+class ListRegistry:
+    """Loads, shares and refreshes the lists of all list comparison rules in a process."""
+
+    _lists: Dict[str, CompareList] = {}
+
+    _elements_by_checksum: Dict[str, FrozenSet[str]] = {}
+
+    @classmethod
+    def get(cls, path: str, loaded_after: Optional[float] = None) -> CompareList:
+        """Returns the shared list for the given resolved path and loads it if necessary.
+
+        Parameters
+        ----------
+        path : str
+            The resolved path of the list. For string format see :ref:`getters`.
+        loaded_after : Optional[float]
+            Monotonic time after which the list must have been loaded. A list that has been
+            loaded before is reloaded, e.g. if the rules of a processor are set up again.
+            If it is None, a loaded list is always returned as it is.
+
+        Returns
+        -------
+        CompareList
+            The shared list.
+        """
+        compare_list = cls._lists.get(path)
+        if compare_list is None:
+            file_state = cls._get_file_state(path)
+            checksum, elements = cls._load(path)
+            compare_list = CompareList(path, checksum, elements, file_state)
+            cls._lists[path] = compare_list
+        elif loaded_after is not None and compare_list.loaded_at < loaded_after:
+            if cls._reload(compare_list):
+                cls._remove_unused_elements()
+        return compare_list
+
+    @classmethod
+    def refresh(cls, paths: Iterable[str]) -> List[str]:
+        """Reloads the given lists and replaces the elements of changed lists.
+
+        Lists that can not be loaded keep their current elements.
+
+        Parameters
+        ----------
+        paths : Iterable[str]
+            The resolved paths of the lists to refresh.
+
+        Returns
+        -------
+        List[str]
+            The paths of the lists that changed.
+        """
+        changed_paths = []
+        for path in paths:
+            compare_list = cls._lists.get(path)
+            if compare_list is None:
+                continue
+            try:
+                changed = cls._reload(compare_list)
+            except Exception as error:  # pylint: disable=broad-except
+                logger.warning("Could not refresh list '%s': %s", path, error)
+                continue
+            if changed:
+                changed_paths.append(path)
+        if changed_paths:
+            cls._remove_unused_elements()
+        return changed_paths
+
+    @classmethod
+    def clear(cls):
+        """Removes all lists from the registry."""
+        cls._lists.clear()
+        cls._elements_by_checksum.clear()
+
+    @classmethod
+    def _load(cls, path: str):
+        content = GetterFactory.from_string(path).get()
+        checksum = hashlib.sha256(content.encode("utf8")).hexdigest()
+        elements = cls._elements_by_checksum.get(checksum)
+        if elements is None:
+            elements = frozenset(
+                element for element in content.splitlines() if not element.startswith("#")
+            )
+            cls._elements_by_checksum[checksum] = elements
+        return checksum, elements
+
+    @classmethod
+    def _reload(cls, compare_list: CompareList) -> bool:
+        """Loads the list again and replaces its elements in place if its content changed.
+        Local list files whose modification time and size did not change are not read again."""
+        file_state = cls._get_file_state(compare_list.path)
+        if file_state is None or file_state != compare_list.file_state:
+            checksum, elements = cls._load(compare_list.path)
+        else:
+            checksum, elements = compare_list.checksum, compare_list.elements
+        compare_list.loaded_at = time.monotonic()
+        compare_list.file_state = file_state
+        if checksum == compare_list.checksum:
+            return False
+        compare_list.checksum, compare_list.elements = checksum, elements
+        return True
+
+    @staticmethod
+    def _get_file_state(path: str) -> Optional[Tuple[int, int]]:
+        getter = GetterFactory.from_string(path)
+        if not isinstance(getter, FileGetter):
+            return None
+        stat = os.stat(getter.target)
+        return stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def _remove_unused_elements(cls):
+        used_checksums = {compare_list.checksum for compare_list in cls._lists.values()}
+        for checksum in set(cls._elements_by_checksum).difference(used_checksums):
+            del cls._elements_by_checksum[checksum]
@@ -18,6 +18,7 @@ Processor Configuration
         generic_rules:
             - tests/testdata/rules/generic/
         list_search_base_path: /path/to/list/dir
+        list_refresh_interval: 300
 
 .. autoclass:: logprep.processor.list_comparison.processor.ListComparison.Config
    :members:
@@ -28,13 +29,20 @@ Processor Configuration
 .. automodule:: logprep.processor.list_comparison.rule
 """
 
+import logging
+import time
+from typing import Optional
+
 from attr import define, field, validators
 
 from logprep.abc.processor import Processor
 from logprep.processor.base.exceptions import FieldExistsWarning
+from logprep.processor.list_comparison.list_registry import ListRegistry
 from logprep.processor.list_comparison.rule import ListComparisonRule
 from logprep.util.helper import add_field_to, get_dotted_field_value
 
+logger = logging.getLogger("ListComparison")
+
 
 class ListComparisonError(BaseException):
     """Base class for ListComparison related exceptions."""
@@ -56,13 +64,44 @@ class ListComparison(Processor):
         You can also pass a template with keys from environment,
         e.g.,  :code:`${<your environment variable>}`. The special key :code:`${LOGPREP_LIST}`
         will be filled by this processor. """
+        list_refresh_interval: Optional[int] = field(
+            default=None,
+            validator=validators.optional([validators.instance_of(int), validators.gt(0)]),
+        )
+        """Interval in seconds in which the lists are reloaded.
+        Changed lists replace the old ones without a restart of the pipeline.
+        Lists that can not be loaded on refresh keep their current content.
+        If not set, the lists are only loaded on setup.
+
+        The refresh runs in the pipeline process and blocks event processing while it runs.
+        Local list files are only read again if their modification time or size changed, but
+        lists from remote locations are downloaded completely on every refresh, so the interval
+        should be chosen according to the size of these lists.
+
+        Lists are shared by all rules in a process, so rules referencing the same list
+        do not load it multiple times. Lists that have been loaded before are reloaded once
+        on setup."""
 
     rule_class = ListComparisonRule
 
     def setup(self):
         super().setup()
+        setup_time = time.monotonic()
         for rule in [*self._specific_rules, *self._generic_rules]:
-            rule.init_list_comparison(self._config.list_search_base_path)
+            rule.init_list_comparison(self._config.list_search_base_path, setup_time)
+        if self._config.list_refresh_interval:
+            self._schedule_task(
+                task=self._refresh_lists, seconds=self._config.list_refresh_interval
+            )
+
+    def _refresh_lists(self):
+        list_paths = {
+            compare_list.path
+            for rule in [*self._specific_rules, *self._generic_rules]
+            for compare_list in rule.compare_lists.values()
+        }
+        for list_path in ListRegistry.refresh(list_paths):
+            logger.info("Refreshed list '%s'", list_path)
 
     def _apply_rules(self, event, rule):
         """
@@ -100,11 +139,11 @@ class ListComparison(Processor):
 
         # iterate over lists and check if element is in any
         list_matches = []
-        for compare_list in rule.compare_sets:
-            if field_value in rule.compare_sets[compare_list]:
-                list_matches.append(compare_list)
+        for list_name, compare_list in rule.compare_lists.items():
+            if field_value in compare_list.elements:
+                list_matches.append(list_name)
 
         # if matching list was found return it, otherwise return all list names
         if len(list_matches) == 0:
-            return list(rule.compare_sets.keys()), "not_in_list"
+            return list(rule.compare_lists.keys()), "not_in_list"
         return list_matches, "in_list"
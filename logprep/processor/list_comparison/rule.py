@@ -43,13 +43,13 @@ target field :code:`List_comparison.example`.
 
 import os.path
 from string import Template
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from attrs import define, field, validators
 
 from logprep.filter.expression.filter_expression import FilterExpression
 from logprep.processor.field_manager.rule import FieldManagerRule
-from logprep.util.getter import GetterFactory
+from logprep.processor.list_comparison.list_registry import CompareList, ListRegistry
 
 
 class ListComparisonRule(FieldManagerRule):
@@ -75,7 +75,7 @@ class ListComparisonRule(FieldManagerRule):
 
     def __init__(self, filter_rule: FilterExpression, config: dict, processor_name: str):
         super().__init__(filter_rule, config, processor_name)
-        self._compare_sets = {}
+        self._compare_lists = {}
 
     def _get_list_search_base_path(self, list_search_base_path):
         if list_search_base_path is None:
@@ -84,18 +84,20 @@ class ListComparisonRule(FieldManagerRule):
             return self._config.list_search_base_path
         return list_search_base_path
 
-    def init_list_comparison(self, list_search_base_path: Optional[str] = None):
-        """init method for list_comparision lists"""
+    def init_list_comparison(
+        self, list_search_base_path: Optional[str] = None, loaded_after: Optional[float] = None
+    ):
+        """init method for list_comparision lists
+
+        Lists that have been loaded before :code:`loaded_after` are reloaded."""
         list_search_base_path = self._get_list_search_base_path(list_search_base_path)
         if list_search_base_path.startswith("http"):
             for list_path in self._config.list_file_paths:
                 list_search_base_path_resolved = Template(list_search_base_path).substitute(
                     {**os.environ, **{"LOGPREP_LIST": list_path}}
                 )
-                content = GetterFactory.from_string(list_search_base_path_resolved).get()
-                compare_elements = content.splitlines()
-                file_elem_tuples = (elem for elem in compare_elements if not elem.startswith("#"))
-                self._compare_sets.update({list_path: set(file_elem_tuples)})
+                compare_list = ListRegistry.get(list_search_base_path_resolved, loaded_after)
+                self._compare_lists.update({list_path: compare_list})
             return
         absolute_list_paths = [
             list_path for list_path in self._config.list_file_paths if list_path.startswith("/")
@@ -109,12 +111,14 @@ class ListComparisonRule(FieldManagerRule):
         ]
         list_paths = [*absolute_list_paths, *converted_absolute_list_paths]
         for list_path in list_paths:
-            content = GetterFactory.from_string(list_path).get()
-            compare_elements = content.splitlines()
-            file_elem_tuples = (elem for elem in compare_elements if not elem.startswith("#"))
             filename = os.path.basename(list_path)
-            self._compare_sets.update({filename: set(file_elem_tuples)})
+            self._compare_lists.update({filename: ListRegistry.get(list_path, loaded_after)})
+
+    @property
+    def compare_lists(self) -> Dict[str, CompareList]:
+        """Shared lists of this rule by list name"""
+        return self._compare_lists
 
     @property
     def compare_sets(self) -> dict:  # pylint: disable=missing-docstring
-        return self._compare_sets
+        return {name: compare_list.elements for name, compare_list in self._compare_lists.items()}
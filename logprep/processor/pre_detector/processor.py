@@ -20,6 +20,28 @@ Processor Configuration
         outputs:
             - kafka: sre_topic
         alert_ip_list_path: /tmp/ip_list.yml
+        aggregation_window: 60
+        aggregation_key_fields:
+            - host.name
+
+Detection Aggregation
+^^^^^^^^^^^^^^^^^^^^^
+
+By default, one detection is written per matching rule and event.
+If :code:`aggregation_window` is set, detections of a rule are grouped by the rule id and the
+values of the :code:`aggregation_key_fields` in the event for the given number of seconds.
+The first detection of a group is written immediately. Further events of the group within the
+window get the :code:`pre_detection_id` of the first detection and are not written as single
+detections. If there were such further events, a summary detection is written after the window
+has been closed. It is a copy of the first detection with the additional field
+:code:`aggregation`, which contains the number of aggregated detections including the first one
+(:code:`count`), the creation timestamps of the first and the last detection
+(:code:`first_timestamp`, :code:`last_timestamp`) and the window in seconds (:code:`window`).
+Closed windows are checked every second and the summaries of open windows are written when the
+pipeline shuts down.
+If an event already has a :code:`pre_detection_id` of a detection of another rule, its
+detection is written as single detection with this id instead of being aggregated, so that
+every event refers to a detection of each matching rule.
 
 .. autoclass:: logprep.processor.pre_detector.processor.PreDetector.Config
    :members:
@@ -30,12 +52,14 @@ Processor Configuration
 .. automodule:: logprep.processor.pre_detector.rule
 """
 
+import time
 from functools import cached_property
+from typing import Dict, List, Optional
 from uuid import uuid4
 
 from attr import define, field, validators
 
-from logprep.abc.processor import Processor
+from logprep.abc.processor import Processor, ProcessorResult
 from logprep.processor.base.exceptions import ProcessingWarning
 from logprep.processor.pre_detector.ip_alerter import IPAlerter
 from logprep.processor.pre_detector.rule import PreDetectorRule
@@ -87,8 +111,39 @@ class PreDetector(Processor):
         then the expiration date of the IP is being used.
         """
 
+        aggregation_window: Optional[int] = field(
+            default=None,
+            validator=validators.optional([validators.instance_of(int), validators.gt(0)]),
+        )
+        """Time window in seconds in which detections of a rule are aggregated into one summary
+        detection. If not set, detections are not aggregated.
+        See `Detection Aggregation`_ for details."""
+
+        aggregation_key_fields: list = field(
+            factory=list,
+            validator=validators.deep_iterable(member_validator=validators.instance_of(str)),
+        )
+        """List of dotted fields whose values in the event are used in addition to the rule id
+        to group detections if :code:`aggregation_window` is set."""
+
+    __slots__ = ["_creation_timestamp", "_aggregated_detections", "_closed_aggregations"]
+
+    _creation_timestamp: Optional[str]
+
+    _aggregated_detections: Dict[tuple, dict]
+    """Open aggregation windows by rule id and key field values"""
+
+    _closed_aggregations: List[tuple]
+    """Summary detections of closed aggregation windows that have not been written yet"""
+
     rule_class = PreDetectorRule
 
+    def __init__(self, name: str, configuration: Processor.Config):
+        super().__init__(name, configuration)
+        self._creation_timestamp = None
+        self._aggregated_detections = {}
+        self._closed_aggregations = []
+
     @cached_property
     def _ip_alerter(self):
         return IPAlerter(self._config.alert_ip_list_path)
@@ -96,12 +151,7 @@ class PreDetector(Processor):
     def normalize_timestamp(self, rule: PreDetectorRule, timestamp: str) -> str:
         """method for normalizing the timestamp"""
         try:
-            parsed_datetime = TimeParser.parse_datetime(
-                timestamp, rule.source_format, rule.source_timezone
-            )
-            return (
-                parsed_datetime.astimezone(rule.target_timezone).isoformat().replace("+00:00", "Z")
-            )
+            return rule.timestamp_parser.normalize(timestamp)
         except TimeParserException as error:
             error_message = "Could not parse timestamp"
             raise (
@@ -113,32 +163,111 @@ class PreDetector(Processor):
                 )
             ) from error
 
+    def setup(self):
+        super().setup()
+        if self._config.aggregation_window is not None:
+            self._schedule_task(task=self._close_expired_aggregations, seconds=1)
+
+    def process(self, event: dict) -> ProcessorResult:
+        self._creation_timestamp = None
+        return super().process(event)
+
+    def flush_extra_data(self, final: bool = False) -> list:
+        if final:
+            for aggregation_key in list(self._aggregated_detections):
+                self._close_aggregation(aggregation_key)
+        closed_aggregations, self._closed_aggregations = self._closed_aggregations, []
+        return closed_aggregations
+
     def _apply_rules(self, event: dict, rule: PreDetectorRule):
-        if not (
-            self._ip_alerter.has_ip_fields(rule)
-            and not self._ip_alerter.is_in_alerts_list(rule, event)
+        if self._ip_alerter.has_ip_fields(rule) and not self._ip_alerter.is_in_alerts_list(
+            rule, event
         ):
-            self._get_detection_result(event, rule)
-        for detection, _ in self.result.data:
-            detection["creation_timestamp"] = TimeParser.now().isoformat()
-            timestamp = get_dotted_field_value(event, rule.timestamp_field)
-            if timestamp is not None:
-                detection[rule.timestamp_field] = self.normalize_timestamp(rule, timestamp)
+            return
+        self._get_detection_result(event, rule)
+
+    def _get_creation_timestamp(self) -> str:
+        if self._creation_timestamp is None:
+            self._creation_timestamp = TimeParser.now().isoformat()
+        return self._creation_timestamp
 
     def _get_detection_result(self, event: dict, rule: PreDetectorRule):
         pre_detection_id = get_dotted_field_value(event, "pre_detection_id")
+        aggregation_key = None
+        if self._config.aggregation_window is not None:
+            aggregation_key = self._get_aggregation_key(event, rule)
+            aggregated_detection = self._aggregated_detections.get(aggregation_key)
+            if aggregated_detection is not None:
+                if aggregated_detection["flush_time"] <= time.time():
+                    self._close_aggregation(aggregation_key)
+                elif pre_detection_id is None:
+                    self._aggregate_detection(event, aggregated_detection)
+                    return
+                else:
+                    aggregation_key = None
+
         if pre_detection_id is None:
             pre_detection_id = str(uuid4())
             add_field_to(event, "pre_detection_id", pre_detection_id)
 
         detection_result = self._generate_detection_result(pre_detection_id, event, rule)
+        detection_result["creation_timestamp"] = self._get_creation_timestamp()
+        timestamp = get_dotted_field_value(event, rule.timestamp_field)
+        if timestamp is not None:
+            detection_result[rule.timestamp_field] = self.normalize_timestamp(rule, timestamp)
         self.result.data.append((detection_result, self._config.outputs))
+        if aggregation_key is not None:
+            self._aggregated_detections[aggregation_key] = {
+                "detection": detection_result.copy(),
+                "count": 1,
+                "first_timestamp": detection_result["creation_timestamp"],
+                "last_timestamp": detection_result["creation_timestamp"],
+                "flush_time": time.time() + self._config.aggregation_window,
+            }
+
+    def _get_aggregation_key(self, event: dict, rule: PreDetectorRule) -> tuple:
+        key_values = (
+            str(get_dotted_field_value(event, key_field))
+            for key_field in self._config.aggregation_key_fields
+        )
+        return (rule.detection_data["id"], *key_values)
+
+    def _aggregate_detection(self, event: dict, aggregated_detection: dict):
+        pre_detection_id = aggregated_detection["detection"]["pre_detection_id"]
+        add_field_to(event, "pre_detection_id", pre_detection_id)
+        aggregated_detection["count"] += 1
+        aggregated_detection["last_timestamp"] = self._get_creation_timestamp()
+
+    def _close_expired_aggregations(self):
+        now = time.time()
+        expired_keys = [
+            key
+            for key, aggregated_detection in self._aggregated_detections.items()
+            if aggregated_detection["flush_time"] <= now
+        ]
+        for key in expired_keys:
+            self._close_aggregation(key)
+
+    def _close_aggregation(self, aggregation_key: tuple):
+        """Closes the aggregation window and keeps its summary detection to be written if
+        detections have been aggregated after the first detection."""
+        aggregated_detection = self._aggregated_detections.pop(aggregation_key)
+        if aggregated_detection["count"] == 1:
+            return
+        detection_result = aggregated_detection["detection"]
+        detection_result["aggregation"] = {
+            "count": aggregated_detection["count"],
+            "first_timestamp": aggregated_detection["first_timestamp"],
+            "last_timestamp": aggregated_detection["last_timestamp"],
+            "window": self._config.aggregation_window,
+        }
+        self._closed_aggregations.append((detection_result, self._config.outputs))
 
     @staticmethod
     def _generate_detection_result(
         pre_detection_id: str, event: dict, rule: PreDetectorRule
     ) -> dict:
-        detection_result = rule.detection_data
+        detection_result = rule.detection_data.copy()
         detection_result["rule_filter"] = rule.filter_str
         detection_result["description"] = rule.description
         detection_result["pre_detection_id"] = pre_detection_id
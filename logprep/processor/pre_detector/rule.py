@@ -88,7 +88,7 @@ the IPs from the list is also available in the specified fields.
     ip_fields:
     - some_ip_field
 
-The pre_detector also has the option to normalize the timestamp. 
+The pre_detector also has the option to normalize the timestamp.
 To configure this the following parameters can be set in the rule configuration.
 
 ..  code-block:: yaml
@@ -110,7 +110,7 @@ To configure this the following parameters can be set in the rule configuration.
       target_timezone: <the timezone after normalization>
     description: Some malicious event.
 
-All of these new parameters are configurable and default to 
+All of these new parameters are configurable and default to
 standard values if not explicitly set.
 
 .. autoclass:: logprep.processor.pre_detector.rule.PreDetectorRule.Config
@@ -127,6 +127,7 @@ from zoneinfo import ZoneInfo
 from attrs import asdict, define, field, validators
 
 from logprep.processor.base.rule import Rule
+from logprep.util.time import TimestampParser
 
 
 class PreDetectorRule(Rule):
@@ -230,4 +231,8 @@ class PreDetectorRule(Rule):
     def timestamp_field(self) -> str:
         return self._config.timestamp_field
 
+    @cached_property
+    def timestamp_parser(self) -> TimestampParser:
+        return TimestampParser([self.source_format], self.source_timezone, self.target_timezone)
+
     # pylint: enable=C0111
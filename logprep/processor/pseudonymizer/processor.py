@@ -54,7 +54,6 @@ from typing import Optional, Pattern
 from urllib.parse import parse_qs, urlencode, urlparse
 
 from attrs import define, field, validators
-from tldextract import TLDExtract
 from urlextract import URLExtract
 
 from logprep.abc.processor import Processor
@@ -62,6 +61,7 @@ from logprep.factory_error import InvalidConfigurationError
 from logprep.metrics.metrics import CounterMetric, GaugeMetric
 from logprep.processor.field_manager.processor import FieldManager
 from logprep.processor.pseudonymizer.rule import PseudonymizerRule
+from logprep.util.artifacts import get_artifact
 from logprep.util.getter import GetterFactory
 from logprep.util.hasher import SHA256Hasher
 from logprep.util.helper import add_field_to, get_dotted_field_value
@@ -70,6 +70,7 @@ from logprep.util.pseudo.encrypter import (
     DualPKCS1HybridGCMEncrypter,
     Encrypter,
 )
+from logprep.util.tld import TLDExtractor, get_tld_extractor
 from logprep.util.validators import list_of_urls_validator
 
 
@@ -216,10 +217,13 @@ class Pseudonymizer(FieldManager):
         return encrypter
 
     @cached_property
-    def _tld_extractor(self) -> TLDExtract:
+    def _tld_extractor(self) -> TLDExtractor:
         if self._config.tld_lists is not None:
-            return TLDExtract(suffix_list_urls=self._config.tld_lists)
-        return TLDExtract()
+            tld_lists = [
+                f"file://{get_artifact(tld_list).absolute()}" for tld_list in self._config.tld_lists
+            ]
+            return get_tld_extractor(tld_lists)
+        return get_tld_extractor()
 
     @cached_property
     def _regex_mapping(self) -> dict:
@@ -235,6 +239,7 @@ class Pseudonymizer(FieldManager):
 
     def setup(self):
         super().setup()
+        _ = self._tld_extractor  # trigger download
         self._replace_regex_keywords_by_regex_expression()
 
     def _replace_regex_keywords_by_regex_expression(self):
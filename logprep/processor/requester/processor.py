@@ -26,6 +26,13 @@ Processor Configuration
             - tests/testdata/rules/specific/
         generic_rules:
             - tests/testdata/rules/generic/
+        response_cache_ttl: 60
+        max_cached_responses: 10000
+
+All requests of a processor instance are sent through one session, so connections to the same
+host are kept alive and reused.
+If :code:`response_cache_ttl` is set, successful responses are cached by the templated request
+for the given number of seconds, so identical requests of different events are only sent once.
 
 .. autoclass:: logprep.processor.requester.processor.Requester.Config
    :members:
@@ -38,34 +45,81 @@ Processor Configuration
 
 import json
 import re
+from functools import cached_property
+from http.cookiejar import DefaultCookiePolicy
+from typing import Optional
 
 import requests
+from attrs import define, field, validators
 
 from logprep.processor.base.exceptions import FieldExistsWarning
 from logprep.processor.field_manager.processor import FieldManager
+from logprep.processor.field_manager.rule import FIELD_PATTERN
 from logprep.processor.requester.rule import RequesterRule
+from logprep.util.cache import TTLCache
 from logprep.util.helper import (
     add_field_to,
     get_dotted_field_value,
     get_source_fields_dict,
 )
 
-TEMPLATE_KWARGS = ("url", "json", "data", "params")
+TEMPLATE_PATTERN = re.compile(FIELD_PATTERN)
+
+CACHEABLE_METHODS = ("GET", "HEAD")
+"""Methods of requests whose responses can be cached, because they do not change any state"""
 
 
 class Requester(FieldManager):
     """A processor to invoke http requests with field data
     and parses response data to field values"""
 
+    @define(kw_only=True)
+    class Config(FieldManager.Config):
+        """requester config"""
+
+        response_cache_ttl: Optional[float] = field(
+            default=None,
+            converter=lambda value: value if value is None else float(value),
+            validator=validators.optional(validators.gt(0)),
+        )
+        """(Optional) Number of seconds successful responses of :code:`GET` and :code:`HEAD`
+        requests are cached by the templated request. Identical requests within this time are
+        answered from the cache instead of being sent again. Defaults to :code:`None`, which
+        disables the cache."""
+
+        max_cached_responses: int = field(
+            default=10000, validator=[validators.instance_of(int), validators.gt(0)]
+        )
+        """Maximum number of cached responses. If exceeded, the least recently used responses
+        are discarded first. Only used if :code:`response_cache_ttl` is set."""
+
     rule_class = RequesterRule
 
+    @cached_property
+    def _session(self):
+        session = requests.Session()
+        # cookies of one request must not be sent with requests for other events
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    @cached_property
+    def _response_cache(self):
+        return TTLCache(
+            max_items=self._config.max_cached_responses, ttl=self._config.response_cache_ttl
+        )
+
+    def shut_down(self):
+        if "_session" in self.__dict__:
+            self._session.close()
+        super().shut_down()
+
     def _apply_rules(self, event, rule):
         source_field_dict = get_source_fields_dict(event, rule)
         if self._handle_missing_fields(event, rule, rule.source_fields, source_field_dict.values()):
             return
         if self._has_missing_values(event, rule, source_field_dict):
             return
-        kwargs = self._template_kwargs(rule.kwargs, source_field_dict)
+        kwargs = self._template_kwargs(rule, source_field_dict)
         response = self._request(event, rule, kwargs)
         if response is not None:
             self._handle_response(event, rule, response)
@@ -100,8 +154,19 @@ class Requester(FieldManager):
             raise FieldExistsWarning(rule, event, [rule.target_field])
 
     def _request(self, event, rule, kwargs):
+        if self._config.response_cache_ttl is None or kwargs["method"] not in CACHEABLE_METHODS:
+            return self._send_request(event, rule, kwargs)
+        cache_key = json.dumps(kwargs, sort_keys=True, default=str)
+        response = self._response_cache.lookup(cache_key)
+        if response is None:
+            response = self._send_request(event, rule, kwargs)
+            if response is not None:
+                self._response_cache.store(cache_key, response)
+        return response
+
+    def _send_request(self, event, rule, kwargs):
         try:
-            response = requests.request(**kwargs)
+            response = self._session.request(**kwargs)
             response.raise_for_status()
             return response
         except requests.exceptions.HTTPError as error:
@@ -118,16 +183,16 @@ class Requester(FieldManager):
             result = response.content.decode("utf-8")
         return result
 
-    def _template_kwargs(self, kwargs: dict, source: dict):
-        for key, value in kwargs.items():
-            if key in TEMPLATE_KWARGS:
-                kwargs.update({key: json.loads(self._template(json.dumps(value), source))})
+    def _template_kwargs(self, rule: RequesterRule, source: dict) -> dict:
+        kwargs = rule.kwargs
+        for key, template in rule.templates.items():
+            kwargs[key] = json.loads(self._template(template, source))
         return kwargs
 
     @staticmethod
     def _template(string: str, source: dict) -> str:
-        for key, value in source.items():
-            key = key.replace(".", r"\.")
-            pattern = r"\$\{(" + rf"{key}" + r")\}"
-            string = re.sub(pattern, str(value), string)
-        return string
+        def replace(match: re.Match) -> str:
+            key = match.group(1)
+            return str(source[key]) if key in source else match.group(0)
+
+        return TEMPLATE_PATTERN.sub(replace, string)
@@ -70,6 +70,7 @@ import re
 import requests
 from attrs import define, field, validators
 
+from logprep.filter.expression.filter_expression import FilterExpression
 from logprep.processor.field_manager.rule import FIELD_PATTERN, FieldManagerRule
 
 parameter_keys = inspect.signature(requests.Request).parameters.keys()
@@ -78,6 +79,7 @@ REQUEST_CONFIG_KEYS = [
 ] + ["timeout", "proxies", "verify", "cert"]
 URL_REGEX_PATTERN = r"(http|https):\/\/.+"
 HTTP_METHODS = ["GET", "OPTIONS", "HEAD", "POST", "PUT", "PATCH", "DELETE"]
+TEMPLATE_KWARGS = ("url", "json", "data", "params")
 
 
 class RequesterRule(FieldManagerRule):
@@ -186,15 +188,33 @@ class RequesterRule(FieldManagerRule):
             self.source_fields = list({*url_fields, *json_fields, *data_fields, *params_fields})
             super().__attrs_post_init__()
 
-    # pylint: disable=missing-docstring
-    @property
-    def kwargs(self):
-        kwargs = {
+    _kwargs: dict
+
+    templates: dict
+    """The serialized request kwargs that contain field references and have to be templated
+    with the event values for each request"""
+
+    def __init__(
+        self, filter_rule: FilterExpression, config: "RequesterRule.Config", processor_name: str
+    ):
+        super().__init__(filter_rule, config, processor_name)
+        self._kwargs = {
             key: getattr(self._config, key)
             for key in REQUEST_CONFIG_KEYS
             if getattr(self._config, key)
         }
-        return kwargs
+        self.templates = {}
+        for key in TEMPLATE_KWARGS:
+            if key not in self._kwargs:
+                continue
+            template = json.dumps(self._kwargs[key])
+            if re.search(FIELD_PATTERN, template):
+                self.templates[key] = template
+
+    # pylint: disable=missing-docstring
+    @property
+    def kwargs(self):
+        return self._kwargs.copy()
 
     @property
     def target_field_mapping(self):
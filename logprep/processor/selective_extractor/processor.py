@@ -31,7 +31,6 @@ Processor Configuration
 
 from logprep.processor.field_manager.processor import FieldManager
 from logprep.processor.selective_extractor.rule import SelectiveExtractorRule
-from logprep.util.helper import add_field_to, get_source_fields_dict
 
 
 class SelectiveExtractor(FieldManager):
@@ -54,16 +53,18 @@ class SelectiveExtractor(FieldManager):
             The rule to apply
 
         """
-        flattened_fields = get_source_fields_dict(event, rule)
-        if self._handle_missing_fields(event, rule, rule.source_fields, flattened_fields.values()):
+        field_values = self._get_field_values(event, rule.source_fields)
+        if self._handle_missing_fields(event, rule, rule.source_fields, field_values):
             return
-        flattened_fields = {
-            dotted_field: content
-            for dotted_field, content in flattened_fields.items()
-            if content is not None
-        }
-        if flattened_fields:
-            filtered_event = {}
-            for field, content in flattened_fields.items():
-                add_field_to(filtered_event, field, content)
+        filtered_event = {}
+        for index, parent_keys, key in rule.extraction_projection:
+            content = field_values[index]
+            if content is None:
+                continue
+            target = filtered_event
+            for parent_key in parent_keys:
+                target = target.setdefault(parent_key, {})
+            if target.get(key) is None:
+                target[key] = content
+        if filtered_event:
             self.result.data.append((filtered_event, rule.outputs))
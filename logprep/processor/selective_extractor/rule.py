@@ -55,7 +55,7 @@ It contains the path to a text file with a list of fields per line to be extract
     filter: extract_test
     selective_extractor:
         extract_from_file: /path/to/file
-        outputs: 
+        outputs:
             - opensearch: topic_to_send_to
     description: '...'
 
@@ -99,13 +99,15 @@ It is possible to mix both extraction sources. They will be merged to one list w
    :noindex:
 """
 
-from typing import List
+from functools import cached_property
+from typing import List, Tuple
 
 from attrs import define, field, validators
 
 from logprep.processor.base.rule import InvalidRuleDefinitionError
 from logprep.processor.field_manager.rule import FieldManagerRule
 from logprep.util.getter import GetterFactory
+from logprep.util.helper import get_dotted_field_list
 
 
 class SelectiveExtractorRuleError(InvalidRuleDefinitionError):
@@ -195,5 +197,27 @@ class SelectiveExtractorRule(FieldManagerRule):
         """
         return self._config.source_fields
 
+    @cached_property
+    def extraction_projection(self) -> Tuple[Tuple[int, Tuple[str, ...], str], ...]:
+        """
+        returns:
+        --------
+        extraction_projection: for every field that has to be written into the extracted
+        document, the index of the field in :code:`source_fields`, the keys of its parent
+        fields and its own key. Fields that are a subfield of another extracted field and
+        duplicated fields are omitted, since they are already contained in the extracted
+        document.
+        """
+        projection = []
+        extracted_fields = set()
+        for index, dotted_field in enumerate(self.source_fields):
+            keys = tuple(get_dotted_field_list(dotted_field))
+            parents = {keys[:length] for length in range(1, len(keys) + 1)}
+            if parents & extracted_fields:
+                continue
+            extracted_fields.add(keys)
+            projection.append((index, keys[:-1], keys[-1]))
+        return tuple(projection)
+
     def __eq__(self, other: "SelectiveExtractorRule") -> bool:
         return all([other.filter == self._filter, other._config == self._config])
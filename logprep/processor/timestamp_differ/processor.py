@@ -32,7 +32,7 @@ from typing import Union
 from logprep.processor.field_manager.processor import FieldManager
 from logprep.processor.timestamp_differ.rule import TimestampDifferRule
 from logprep.util.helper import get_source_fields_dict
-from logprep.util.time import TimeParser, TimeParserException, UTC
+from logprep.util.time import UTC, TimeParser, TimeParserException, TimestampParser
 
 
 class TimestampDiffer(FieldManager):
@@ -41,7 +41,6 @@ class TimestampDiffer(FieldManager):
     rule_class = TimestampDifferRule
 
     def _apply_rules(self, event, rule):
-        source_field_formats = rule.source_field_formats
         source_field_dict = get_source_fields_dict(event, rule)
         if self._handle_missing_fields(event, rule, rule.source_fields, source_field_dict.values()):
             return
@@ -50,7 +49,7 @@ class TimestampDiffer(FieldManager):
         diff = None
         try:
             timestamp_objects = map(
-                self._create_timestamp_object, source_field_dict.values(), source_field_formats
+                self._create_timestamp_object, source_field_dict.values(), rule.timestamp_parsers
             )
             diff = reduce(lambda a, b: a - b, timestamp_objects)
         except TimeParserException as error:
@@ -64,12 +63,12 @@ class TimestampDiffer(FieldManager):
             self._write_target_field(event, rule, diff)
 
     @staticmethod
-    def _create_timestamp_object(source: Union[str, int], format_str: str) -> datetime:
+    def _create_timestamp_object(
+        source: Union[str, int], timestamp_parser: TimestampParser
+    ) -> datetime:
         if isinstance(source, int):
             return TimeParser.from_timestamp(source).astimezone(UTC)
-        if format_str is None:
-            return TimeParser.from_string(source).astimezone(UTC)
-        return TimeParser.from_format(source, format_str).astimezone(UTC)
+        return timestamp_parser.parse(source)
 
     @staticmethod
     def _apply_output_format(diff, rule):
@@ -45,11 +45,13 @@ Examples for timestamp_differ:
 """
 
 import re
+from functools import cached_property
 
 from attr import field
 from attrs import define, validators
 
 from logprep.processor.field_manager.rule import FIELD_PATTERN, FieldManagerRule
+from logprep.util.time import TimestampParser
 
 
 class TimestampDifferRule(FieldManagerRule):
@@ -111,4 +113,11 @@ class TimestampDifferRule(FieldManagerRule):
     def show_unit(self):
         return self._config.show_unit
 
+    @cached_property
+    def timestamp_parsers(self):
+        return [
+            TimestampParser([source_format or "ISO8601"], set_missing_year=False)
+            for source_format in self.source_field_formats
+        ]
+
     # pylint: enable=missing-function-docstring
@@ -30,7 +30,7 @@ from logprep.processor.base.exceptions import ProcessingWarning
 from logprep.processor.field_manager.processor import FieldManager
 from logprep.processor.timestamper.rule import TimestamperRule
 from logprep.util.helper import get_dotted_field_value
-from logprep.util.time import TimeParser, TimeParserException
+from logprep.util.time import TimeParserException
 
 
 class Timestamper(FieldManager):
@@ -43,22 +43,8 @@ class Timestamper(FieldManager):
         if self._handle_missing_fields(event, rule, rule.source_fields, [source_value]):
             return
 
-        source_timezone, target_timezone, source_formats = (
-            rule.source_timezone,
-            rule.target_timezone,
-            rule.source_format,
-        )
-        parsed_successfully = False
-        for source_format in source_formats:
-            try:
-                parsed_datetime = TimeParser.parse_datetime(
-                    source_value, source_format, source_timezone
-                )
-            except TimeParserException:
-                continue
-            result = parsed_datetime.astimezone(target_timezone).isoformat().replace("+00:00", "Z")
-            self._write_target_field(event, rule, result)
-            parsed_successfully = True
-            break
-        if not parsed_successfully:
-            raise ProcessingWarning(str("Could not parse timestamp"), rule, event)
+        try:
+            result = rule.timestamp_parser.normalize(source_value)
+        except TimeParserException as error:
+            raise ProcessingWarning(str("Could not parse timestamp"), rule, event) from error
+        self._write_target_field(event, rule, result)
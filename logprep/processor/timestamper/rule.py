@@ -9,7 +9,7 @@ A speaking example:
     :caption: Given timestamper rule
 
     filter: "winlog.event_id: 123456789"
-    timestamper: 
+    timestamper:
         source_fields: ["winlog.event_data.some_timestamp_utc"]
         target_field: "@timestamp"
         source_format: UNIX
@@ -57,11 +57,13 @@ Examples for timestamper:
 
 """
 
+from functools import cached_property
 from zoneinfo import ZoneInfo
 
 from attrs import define, field, validators
 
 from logprep.processor.field_manager.rule import FieldManagerRule
+from logprep.util.time import TimestampParser
 
 
 class TimestamperRule(FieldManagerRule):
@@ -94,6 +96,8 @@ class TimestamperRule(FieldManagerRule):
         time format string the format must be given in the syntax of the
         python builtin :code:`datetime.strptime`
         (see: https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes).
+        The formats are tried in the given order, so a value that matches multiple formats is
+        parsed with the first of these formats.
         Additionally, the value :code:`ISO8601` (default)  and :code:`UNIX` can be used in the list
         of the source_formats field. The former can be used if the timestamp already exists
         in the ISO8601 format, such that only a timezone conversion should be applied.
@@ -146,3 +150,8 @@ class TimestamperRule(FieldManagerRule):
     def source_timezone(self):
         """returns the source timezone"""
         return self._config.source_timezone
+
+    @cached_property
+    def timestamp_parser(self) -> TimestampParser:
+        """returns the parser for the source formats and timezones of this rule"""
+        return TimestampParser(self.source_format, self.source_timezone, self.target_timezone)
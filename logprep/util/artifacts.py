@@ -0,0 +1,159 @@
+"""Node local cache for model and data artifacts like geoip databases, tld lists or models.
+
+Artifacts are fetched via the :code:`GetterFactory` and stored read-only in a shared cache
+directory. All pipeline processes on the node share the same file, so files can be memory
+mapped instead of being held in every process. A cached artifact is revalidated against the
+server with the :code:`ETag` and :code:`Last-Modified` headers of its last download, so an
+unchanged artifact is not transferred again on restarts, but an updated artifact is.
+Artifacts that have been validated recently, e.g. by another process of the same pipeline, are
+used without revalidation, and cached artifacts are used if the server can not be reached.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+from zipfile import ZipFile
+
+from filelock import FileLock
+
+from logprep.util.getter import FileGetter, GetterFactory
+
+logger = logging.getLogger("Artifacts")
+
+ARTIFACT_CACHE_DIR = Path(tempfile.gettempdir()) / "logprep" / "artifacts"
+
+ARTIFACT_REVALIDATION_INTERVAL = 60
+"""Number of seconds after the last validation in which a cached artifact is used without
+revalidating it"""
+
+
+def get_artifact(uri: str) -> Path:
+    """Returns a local path for the artifact behind the given uri.
+
+    Local files are returned as they are. Remote artifacts are downloaded into
+    :code:`ARTIFACT_CACHE_DIR`, keyed by the uri. A cached artifact is revalidated with a
+    conditional request and only downloaded again if the server reports a modified artifact,
+    if the server sends neither an :code:`ETag` nor a :code:`Last-Modified` header or if the
+    cached file has been changed since its download. Artifacts that have been validated within
+    the last :code:`ARTIFACT_REVALIDATION_INTERVAL` seconds are not revalidated and the cached
+    artifact is used if it can not be revalidated.
+
+    Parameters
+    ----------
+    uri : str
+        Path or URI of the artifact. For valid URI formats see :ref:`getters`
+
+    Returns
+    -------
+    Path
+        The path of the local, read-only artifact.
+    """
+    getter = GetterFactory.from_string(uri)
+    if isinstance(getter, FileGetter):
+        return Path(getter.target)
+    artifact_path = _cache_path(uri)
+    with FileLock(f"{artifact_path}.lock"):
+        metadata = _get_metadata(artifact_path)
+        if metadata is not None and _is_recently_validated(metadata):
+            return artifact_path
+        cache_validators = {} if metadata is None else metadata.get("cache_validators", {})
+        try:
+            content, cache_validators = getter.get_raw_if_modified(cache_validators)
+        except Exception as error:  # pylint: disable=broad-except
+            if metadata is None:
+                raise
+            logger.warning(
+                "could not revalidate artifact '%s', using cached artifact: %s", uri, error
+            )
+            return artifact_path
+        if content is None:
+            logger.debug("artifact '%s' has not been modified.", uri)
+            _write_metadata(artifact_path, metadata | {"validated_at": time.time()})
+        else:
+            logger.debug("downloaded artifact '%s'.", uri)
+            _write_artifact(
+                artifact_path, content, cache_validators=cache_validators, validated_at=time.time()
+            )
+    return artifact_path
+
+
+def get_artifact_member(uri: str, member: str) -> Path:
+    """Returns a local path for a member of a zip archive artifact.
+
+    The member is extracted once next to the cached archive, so it can be opened or
+    memory mapped directly by all processes instead of being unpacked in each of them.
+    If the archive changes, the member is extracted again and replaces the previous extraction.
+
+    Parameters
+    ----------
+    uri : str
+        Path or URI of the zip archive. For valid URI formats see :ref:`getters`
+    member : str
+        The name of the member in the archive.
+
+    Returns
+    -------
+    Path
+        The path of the local, read-only archive member.
+    """
+    archive_path = get_artifact(uri)
+    member_path = _cache_path(f"{archive_path.absolute()}:{member}")
+    member_path = member_path.with_name(f"{member_path.name}-{Path(member).name}")
+    with FileLock(f"{member_path}.lock"):
+        archive_mtime_ns = archive_path.stat().st_mtime_ns
+        metadata = _get_metadata(member_path)
+        if metadata is None or metadata.get("archive_mtime_ns") != archive_mtime_ns:
+            with ZipFile(archive_path, mode="r") as zip_file:
+                _write_artifact(
+                    member_path, zip_file.read(member), archive_mtime_ns=archive_mtime_ns
+                )
+    return member_path
+
+
+def _cache_path(key: str) -> Path:
+    os.makedirs(ARTIFACT_CACHE_DIR, exist_ok=True)
+    return ARTIFACT_CACHE_DIR / hashlib.sha256(key.encode("utf8")).hexdigest()
+
+
+def _metadata_path(artifact_path: Path) -> Path:
+    return artifact_path.with_name(f"{artifact_path.name}.json")
+
+
+def _get_metadata(artifact_path: Path) -> Optional[dict]:
+    """Returns the metadata of the cached artifact or None if the artifact does not exist or
+    its size or modification time differ from the time it was written."""
+    metadata_path = _metadata_path(artifact_path)
+    if not artifact_path.is_file() or not metadata_path.is_file():
+        return None
+    metadata = json.loads(metadata_path.read_text(encoding="utf8"))
+    stat = artifact_path.stat()
+    if (stat.st_size, stat.st_mtime_ns) != (metadata["size"], metadata["mtime_ns"]):
+        return None
+    return metadata
+
+
+def _is_recently_validated(metadata: dict) -> bool:
+    return time.time() - metadata.get("validated_at", 0) < ARTIFACT_REVALIDATION_INTERVAL
+
+
+def _write_artifact(artifact_path: Path, content: bytes, **metadata) -> None:
+    """Replaces the artifact atomically, so processes that still use the previous file keep
+    using it, and writes its metadata."""
+    tmp_path = artifact_path.with_name(f"{artifact_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(content)
+    tmp_path.chmod(0o444)
+    stat = tmp_path.stat()
+    os.replace(tmp_path, artifact_path)
+    _write_metadata(artifact_path, {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, **metadata})
+
+
+def _write_metadata(artifact_path: Path, metadata: dict) -> None:
+    metadata_path = _metadata_path(artifact_path)
+    tmp_path = metadata_path.with_name(f"{metadata_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(metadata), encoding="utf8")
+    os.replace(tmp_path, metadata_path)
@@ -1,8 +1,9 @@
 """Module for caching items and checking if they need to be stored (again)."""
 
-from typing import Union
+from typing import Any, Hashable, Union
 
 import datetime
+import time
 from collections import OrderedDict
 
 
@@ -35,3 +36,51 @@ class Cache(OrderedDict):
                 self.popitem(last=False)
             return True
         return False
+
+
+class TTLCache(OrderedDict):
+    """Caches values by key for a fixed time to live and evicts the least recently used
+    values if the maximum number of items is exceeded."""
+
+    def __init__(self, max_items: int = 10000, ttl: float = 60.0):
+        self._max_items = max_items
+        self._ttl = ttl
+        super().__init__()
+
+    def lookup(self, key: Hashable) -> Any:
+        """Get the value for a key if it is cached and not expired.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the value.
+
+        Returns
+        -------
+        Any
+            The cached value or None if the key is not cached or expired.
+        """
+        cached = super().get(key)
+        if cached is None:
+            return None
+        expiration_time, value = cached
+        if expiration_time <= time.monotonic():
+            del self[key]
+            return None
+        self.move_to_end(key)
+        return value
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """Cache a value for the time to live of the cache.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key of the value.
+        value : Any
+            The value to cache.
+        """
+        self[key] = (time.monotonic() + self._ttl, value)
+        self.move_to_end(key)
+        if len(self) > self._max_items:
+            self.popitem(last=False)
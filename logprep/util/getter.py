@@ -8,7 +8,7 @@ from collections import defaultdict
 from importlib.metadata import version
 from pathlib import Path
 from string import Template
-from typing import Tuple
+from typing import Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
@@ -151,13 +151,50 @@ class HttpGetter(Getter):
 
     def get_raw(self) -> bytearray:
         """gets the content from a http server via uri"""
+        return self._get_response().content
+
+    def get_raw_if_modified(self, cache_validators: dict) -> Tuple[Optional[bytes], dict]:
+        """Gets the content from a http server via uri only if it has been modified since it
+        has been retrieved with the given cache validators.
+
+        Parameters
+        ----------
+        cache_validators : dict
+            The :code:`ETag` and :code:`Last-Modified` headers of the response that delivered
+            the current content. They are sent as :code:`If-None-Match` and
+            :code:`If-Modified-Since` headers. If it is empty, the content is always retrieved.
+
+        Returns
+        -------
+        Tuple[Optional[bytes], dict]
+            The content or None if the server responded that it has not been modified, and the
+            cache validators of the current content.
+        """
+        headers = {}
+        if cache_validators.get("ETag"):
+            headers["If-None-Match"] = cache_validators["ETag"]
+        if cache_validators.get("Last-Modified"):
+            headers["If-Modified-Since"] = cache_validators["Last-Modified"]
+        resp = self._get_response(headers)
+        if headers and resp.status_code == 304:
+            return None, cache_validators
+        response_validators = {
+            name: resp.headers[name] for name in ("ETag", "Last-Modified") if name in resp.headers
+        }
+        return resp.content, response_validators
+
+    def _get_response(self, headers: Optional[dict] = None) -> requests.Response:
         domain = urlparse(self.url).netloc
         scheme = urlparse(self.url).scheme
         domain_uri = f"{scheme}://{domain}"
         if domain_uri not in self._credentials_registry:
             self._credentials_registry.update({domain_uri: self.credentials})
         session = self._credentials_registry.get(domain_uri).get_session()
-        resp = session.get(url=self.url, timeout=5, allow_redirects=True, headers=self._headers)
+        if headers:
+            headers = self._headers | headers
+        else:
+            headers = self._headers
+        resp = session.get(url=self.url, timeout=5, allow_redirects=True, headers=headers)
         try:
             resp.raise_for_status()
         except requests.exceptions.HTTPError as error:
@@ -171,4 +208,4 @@ class HttpGetter(Getter):
                     f"'{ENV_NAME_LOGPREP_CREDENTIALS_FILE}'"
                 )
             ) from error
-        return resp.content
+        return resp
@@ -26,10 +26,12 @@ SOFTWARE.
 import re
 import string
 import sys
+from functools import lru_cache
 from hashlib import md5
 from itertools import chain
 from pathlib import Path
 from re import error
+from typing import Callable, NamedTuple, Optional
 
 import numpy as np
 import pkg_resources
@@ -67,6 +69,7 @@ class Grok:
     type_mapper: dict = field(init=False, factory=dict)
     field_mapper: dict = field(init=False, factory=dict)
     regex_obj = field(init=False, default=None)
+    required_literals: list = field(init=False, factory=list, repr=False)
 
     def __attrs_post_init__(self):
         self.predefined_patterns = _reload_patterns(DEFAULT_PATTERNS_DIRS)
@@ -93,16 +96,9 @@ class Grok:
         or custom_patterns_dir.
         """
 
-        if self.fullmatch:
-            match_obj = [regex_pattern.fullmatch(text) for regex_pattern in self.regex_obj]
-        else:
-            match_obj = [regex_pattern.search(text) for regex_pattern in self.regex_obj]
-
-        match_obj = [match for match in match_obj if match is not None]
-        matches = [match.groupdict() for match in match_obj]
-        if not matches:
+        first_match = self._match_first_pattern(text)
+        if first_match is None:
             return {}
-        first_match = matches[0]
         if self.type_mapper:
             for key, match in first_match.items():
                 type_ = INT_FLOAT.get(self.type_mapper.get(key))
@@ -110,6 +106,21 @@ class Grok:
                     first_match[key] = type_(match)
         return {self.field_mapper[field_hash]: value for field_hash, value in first_match.items()}
 
+    def _match_first_pattern(self, text):
+        """Returns the named groups of the first pattern that matches the text. Patterns whose
+        required literal is not contained in the text can not match and are skipped without
+        running the regex."""
+        for regex_pattern, required_literal in zip(self.regex_obj, self.required_literals):
+            if required_literal and required_literal not in text:
+                continue
+            if self.fullmatch:
+                match = regex_pattern.fullmatch(text)
+            else:
+                match = regex_pattern.search(text)
+            if match is not None:
+                return match.groupdict()
+        return None
+
     def _map_types(self, matches):
         for key, match in matches.items():
             type_ = INT_FLOAT.get(self.type_mapper.get(key))
@@ -176,6 +187,7 @@ class Grok:
             self.regex_obj = list(map(self._compile_pattern, py_regex_pattern))
         else:
             self.regex_obj = [self._compile_pattern(py_regex_pattern)]
+        self.required_literals = [_get_required_literal(regex.pattern) for regex in self.regex_obj]
 
     def _compile_pattern(self, py_regex_pattern):
         while re.search(Grok.oniguruma, py_regex_pattern):
@@ -198,6 +210,74 @@ class Grok:
         return re.compile(py_regex_pattern)
 
 
+class _RegexParser(NamedTuple):
+    """The parts of the private regex parser of the :code:`re` module that are used to extract
+    required literals"""
+
+    parse: Callable
+    literal: object
+    subpattern: object
+    ignorecase: int
+
+
+@lru_cache(maxsize=None)
+def _get_regex_parser() -> Optional[_RegexParser]:
+    """Returns the private regex parser of the :code:`re` module or None if it is not available
+    in this python version, which disables the prefilter by required literals."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        if sys.version_info.minor < 11:
+            import sre_constants  # pylint: disable=deprecated-module
+            import sre_parse as sre_parser  # pylint: disable=deprecated-module
+        else:
+            # pylint: disable=no-name-in-module
+            from re import _constants as sre_constants
+            from re import _parser as sre_parser
+        return _RegexParser(
+            parse=sre_parser.parse,
+            literal=sre_constants.LITERAL,
+            subpattern=sre_constants.SUBPATTERN,
+            ignorecase=sre_constants.SRE_FLAG_IGNORECASE,
+        )
+    except (ImportError, AttributeError):
+        return None
+
+
+def _get_required_literal(pattern: str) -> str:
+    """Returns the longest literal string that has to be contained in every text matched by the
+    pattern or an empty string if no such literal could be determined."""
+    regex_parser = _get_regex_parser()
+    if regex_parser is None:
+        return ""
+    try:
+        parsed_pattern = regex_parser.parse(pattern)
+        if parsed_pattern.state.flags & regex_parser.ignorecase:
+            return ""
+        literals = [""]
+        _collect_required_literals(regex_parser, parsed_pattern, literals)
+    except Exception:  # pylint: disable=broad-except
+        # e.g. syntax of the regex module that is not supported by the parser
+        return ""
+    return max(literals, key=len)
+
+
+def _collect_required_literals(regex_parser: _RegexParser, sub_pattern, literals: list):
+    """Collects runs of consecutive literal characters. Only literals and groups on the top level
+    of the pattern are required, every other element (repetitions, branches, character sets,
+    anchors) ends the current run of literals."""
+    for operation, argument in sub_pattern:
+        if operation is regex_parser.literal:
+            literals[-1] += chr(argument)
+        elif operation is regex_parser.subpattern:
+            _, add_flags, _, group_pattern = argument
+            if add_flags & regex_parser.ignorecase:
+                literals.append("")
+                continue
+            _collect_required_literals(regex_parser, group_pattern, literals)
+        else:
+            literals.append("")
+
+
 def _reload_patterns(patterns_dirs):
     """ """
     patterns_dirs = [Path(directory) for directory in patterns_dirs]
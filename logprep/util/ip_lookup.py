@@ -0,0 +1,109 @@
+"""Longest prefix match lookup of IP addresses in IPv4 and IPv6 networks.
+
+The lookup is built once from a collection of IPs and networks in CIDR format.
+Networks are stored in one hash table per prefix length, so looking up an IP costs one
+dictionary lookup per distinct prefix length, independent of the number of networks.
+Single IPs are treated as host networks, i.e. :code:`/32` for IPv4 and :code:`/128` for IPv6.
+
+Example
+-------
+>>> lookup = IPNetworkLookup()
+>>> lookup.add("127.0.0.0/8", "loopback")
+>>> lookup.add("127.0.0.1", "localhost")
+>>> lookup.longest_match("127.0.0.1")
+(IPv4Network('127.0.0.1/32'), 'localhost')
+>>> lookup.longest_match("127.1.2.3")
+(IPv4Network('127.0.0.0/8'), 'loopback')
+"""
+
+from functools import lru_cache
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+IPNetwork = Union[IPv4Network, IPv6Network]
+
+
+@lru_cache(maxsize=65536)
+def _parse_ip(ip_string: str) -> Optional[Tuple[int, int]]:
+    try:
+        ip_object = ip_address(ip_string)
+    except ValueError:
+        return None
+    return ip_object.version, int(ip_object)
+
+
+class IPNetworkLookup:
+    """Maps IPv4 and IPv6 networks to values and finds the most specific network of an IP."""
+
+    __slots__ = ("_tables", "_prefix_lengths")
+
+    _tables: Dict[int, Dict[int, Dict[int, Tuple[IPNetwork, Any]]]]
+
+    _prefix_lengths: Dict[int, List[int]]
+
+    _max_prefix_lengths = {4: 32, 6: 128}
+
+    def __init__(self):
+        self._tables = {4: {}, 6: {}}
+        self._prefix_lengths = {4: [], 6: []}
+
+    def __len__(self) -> int:
+        return sum(len(table) for tables in self._tables.values() for table in tables.values())
+
+    def add(self, network: Union[str, IPNetwork], value: Any = None) -> None:
+        """Adds an IP or a network in CIDR format with an associated value.
+
+        An already existing network is overwritten.
+
+        Parameters
+        ----------
+        network : Union[str, IPNetwork]
+            IP or network, e.g. :code:`127.0.0.1` or :code:`127.0.0.0/8`.
+        value : Any
+            The value associated with the network.
+
+        Raises
+        ------
+        ValueError
+            If the network is not a valid IP or network.
+        """
+        network = ip_network(network)
+        tables = self._tables[network.version]
+        if network.prefixlen not in tables:
+            tables[network.prefixlen] = {}
+            self._prefix_lengths[network.version] = sorted(tables, reverse=True)
+        key = self._key(network.version, int(network.network_address), network.prefixlen)
+        tables[network.prefixlen][key] = (network, value)
+
+    def longest_match(self, ip_string: str) -> Optional[Tuple[IPNetwork, Any]]:
+        """Returns the most specific network containing the IP and its value.
+
+        Parameters
+        ----------
+        ip_string : str
+            The IP to look up.
+
+        Returns
+        -------
+        Optional[Tuple[IPNetwork, Any]]
+            The matching network and its value or None if the IP is invalid
+            or not contained in any network.
+        """
+        if not isinstance(ip_string, str):
+            return None
+        parsed_ip = _parse_ip(ip_string)
+        if parsed_ip is None:
+            return None
+        version, ip_int = parsed_ip
+        tables = self._tables[version]
+        for prefix_length in self._prefix_lengths[version]:
+            match = tables[prefix_length].get(self._key(version, ip_int, prefix_length))
+            if match is not None:
+                return match
+        return None
+
+    def __contains__(self, ip_string: str) -> bool:
+        return self.longest_match(ip_string) is not None
+
+    def _key(self, version: int, ip_int: int, prefix_length: int) -> int:
+        return ip_int >> (self._max_prefix_lengths[version] - prefix_length)
@@ -1,7 +1,8 @@
 """logprep time helpers module"""
 
+import re
 from datetime import datetime, tzinfo
-from typing import Union
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple, Union
 from zoneinfo import ZoneInfo
 
 import ciso8601
@@ -147,3 +148,202 @@ class TimeParser:
             parsed_datetime = parsed_datetime.replace(tzinfo=source_timezone)
 
         return parsed_datetime
+
+
+FAST_PATH_DIRECTIVES = {
+    "%Y": r"(?P<year>[0-9]{4})",
+    "%m": r"(?P<month>[0-9]{2})",
+    "%d": r"(?P<day>[0-9]{2})",
+    "%H": r"(?P<hour>[0-9]{2})",
+    "%M": r"(?P<minute>[0-9]{2})",
+    "%S": r"(?P<second>[0-9]{2})",
+    "%f": r"(?P<microsecond>[0-9]{1,6})",
+}
+
+FORMATS_WITH_YEAR = ("ISO8601", "UNIX")
+
+
+class TimestampParser:
+    """Parses timestamps with a fixed list of source formats and converts them into a target
+    timezone.
+
+    The parser is meant to be created once per rule. It tries the formats in the given order,
+    parses fixed width numeric formats like :code:`%Y-%m-%d %H:%M:%S` with one precompiled
+    regular expression instead of :code:`datetime.strptime` and caches the normalized strings
+    of recently seen timestamps.
+    If a value can be parsed by multiple formats, the first of these formats wins.
+    """
+
+    __slots__ = (
+        "_source_formats",
+        "_source_timezone",
+        "_target_timezone",
+        "_fast_paths",
+        "_cache",
+        "_max_cached_timestamps",
+        "_set_missing_year",
+    )
+
+    _source_formats: List[str]
+
+    _fast_paths: Dict[str, Pattern]
+
+    _cache: Dict[str, str]
+
+    def __init__(
+        self,
+        source_formats: Iterable[str],
+        source_timezone: tzinfo = UTC,
+        target_timezone: tzinfo = UTC,
+        max_cached_timestamps: int = 1024,
+        set_missing_year: bool = True,
+    ):
+        """
+        Parameters
+        ----------
+        source_formats : Iterable[str]
+            The formats to try in the given order. Besides a format string 'ISO8601' and 'UNIX'
+            are allowed formats.
+        source_timezone : tzinfo
+            The timezone of timestamps without timezone.
+        target_timezone : tzinfo
+            The timezone the parsed timestamps are converted into.
+        max_cached_timestamps : int
+            The maximum number of normalized timestamps that are cached.
+        set_missing_year : bool
+            Replace the year 1900 of timestamps parsed by formats without year with the current
+            year like :code:`TimeParser.parse_datetime`.
+        """
+        self._source_formats = list(source_formats)
+        self._source_timezone = source_timezone
+        self._target_timezone = target_timezone
+        self._max_cached_timestamps = max_cached_timestamps
+        self._set_missing_year = set_missing_year
+        self._cache = {}
+        self._fast_paths = {}
+        for source_format in self._source_formats:
+            fast_path = self._compile_fast_path(source_format)
+            if fast_path is not None:
+                self._fast_paths[source_format] = fast_path
+
+    @staticmethod
+    def _compile_fast_path(source_format: str) -> Optional[Pattern]:
+        if not all(directive in source_format for directive in ("%Y", "%m", "%d")):
+            return None
+        pattern = ""
+        for part in re.split(r"(%.)", source_format):
+            if part.startswith("%"):
+                if part not in FAST_PATH_DIRECTIVES or part in source_format.replace(part, "", 1):
+                    return None
+                pattern += FAST_PATH_DIRECTIVES[part]
+            else:
+                pattern += re.escape(part)
+        return re.compile(pattern)
+
+    def parse(self, timestamp: Union[str, int]) -> datetime:
+        """Parses a timestamp with the first matching source format and converts it into the
+        target timezone. Timestamps without timezone are interpreted in the source timezone.
+
+        Parameters
+        ----------
+        timestamp : Union[str, int]
+            The timestamp to parse.
+
+        Returns
+        -------
+        datetime
+            The parsed timestamp in the target timezone.
+
+        Raises
+        ------
+        TimeParserException
+            If the timestamp could not be parsed with any source format.
+        """
+        return self._parse(timestamp)[0]
+
+    def normalize(self, timestamp: Union[str, int]) -> str:
+        """Parses a timestamp like :code:`parse` and returns it as ISO8601 string with
+        :code:`Z` as designator for UTC.
+
+        Parameters
+        ----------
+        timestamp : Union[str, int]
+            The timestamp to normalize.
+
+        Returns
+        -------
+        str
+            The normalized timestamp.
+
+        Raises
+        ------
+        TimeParserException
+            If the timestamp could not be parsed with any source format.
+        """
+        if not isinstance(timestamp, str):
+            return self._to_string(self.parse(timestamp))
+        normalized = self._cache.get(timestamp)
+        if normalized is None:
+            parsed_datetime, source_format = self._parse(timestamp)
+            normalized = self._to_string(parsed_datetime)
+            if self._is_cacheable(source_format):
+                if len(self._cache) >= self._max_cached_timestamps:
+                    del self._cache[next(iter(self._cache))]
+                self._cache[timestamp] = normalized
+        return normalized
+
+    @staticmethod
+    def _to_string(parsed_datetime: datetime) -> str:
+        return parsed_datetime.isoformat().replace("+00:00", "Z")
+
+    def _is_cacheable(self, source_format: str) -> bool:
+        """Timestamps parsed by formats without year get the current year and can not be cached"""
+        if not self._set_missing_year:
+            return True
+        return source_format in FORMATS_WITH_YEAR or "%Y" in source_format or "%y" in source_format
+
+    def _parse(self, timestamp: Union[str, int]) -> Tuple[datetime, str]:
+        """Returns the timestamp parsed by the first matching source format and this format"""
+        error = None
+        for source_format in self._source_formats:
+            try:
+                parsed_datetime = self._parse_with_format(timestamp, source_format)
+            except TimeParserException as parser_error:
+                error = parser_error
+                continue
+            return parsed_datetime.astimezone(self._target_timezone), source_format
+        if len(self._source_formats) == 1:
+            raise error
+        raise TimeParserException(
+            f"could not parse timestamp '{timestamp}' with any source format"
+        ) from error
+
+    def _parse_with_format(self, timestamp: Union[str, int], source_format: str) -> datetime:
+        fast_path = self._fast_paths.get(source_format)
+        if fast_path is not None and isinstance(timestamp, str):
+            match = fast_path.fullmatch(timestamp)
+            if match is not None:
+                try:
+                    return self._from_match(match)
+                except ValueError:
+                    pass  # let strptime raise the exception with its message
+        if self._set_missing_year or source_format in FORMATS_WITH_YEAR:
+            return TimeParser.parse_datetime(timestamp, source_format, self._source_timezone)
+        parsed_datetime = TimeParser.from_format(timestamp, source_format, set_missing_utc=False)
+        if parsed_datetime.tzinfo is None:
+            parsed_datetime = parsed_datetime.replace(tzinfo=self._source_timezone)
+        return parsed_datetime
+
+    def _from_match(self, match: re.Match) -> datetime:
+        values = match.groupdict()
+        microsecond = values.get("microsecond")
+        return datetime(
+            int(values["year"]),
+            int(values["month"]),
+            int(values["day"]),
+            int(values.get("hour") or 0),
+            int(values.get("minute") or 0),
+            int(values.get("second") or 0),
+            int(microsecond.ljust(6, "0")) if microsecond else 0,
+            tzinfo=self._source_timezone,
+        )
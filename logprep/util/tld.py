@@ -0,0 +1,101 @@
+"""Process-wide extraction of the subdomain, domain and public suffix of hostnames and URLs.
+
+Processors that split domains, like the :code:`domain_label_extractor`, the
+:code:`domain_resolver` and the :code:`pseudonymizer`, share one :code:`TLDExtractor` per list of
+suffix list URLs in each process. Thus, the public suffix list is loaded only once into the suffix
+trie of :code:`tldextract` and the extraction results are memoized in one bounded LRU cache, so a
+hostname that is extracted by multiple processors for the same event is only parsed once.
+
+Example
+-------
+>>> extractor = get_tld_extractor()
+>>> extractor("http://www.google.co.uk/some/path").suffix
+'co.uk'
+"""
+
+from functools import cached_property, lru_cache
+from threading import Lock
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from tldextract import TLDExtract
+from tldextract.tldextract import ExtractResult
+
+MAX_CACHED_EXTRACTIONS = 100000
+"""Maximum number of extraction results that are cached per extractor"""
+
+_extractors: Dict[Optional[Tuple[str, ...]], "TLDExtractor"] = {}
+
+_extractors_lock = Lock()
+
+
+class TLDExtractor:
+    """Extracts subdomain, domain and suffix of hostnames and URLs and caches the results."""
+
+    _suffix_list_urls: Optional[Tuple[str, ...]]
+
+    _max_cached_extractions: int
+
+    def __init__(
+        self,
+        suffix_list_urls: Optional[Sequence[str]] = None,
+        max_cached_extractions: int = MAX_CACHED_EXTRACTIONS,
+    ):
+        self._suffix_list_urls = None if suffix_list_urls is None else tuple(suffix_list_urls)
+        self._max_cached_extractions = max_cached_extractions
+
+    @property
+    def suffix_list_urls(self) -> Tuple[str, ...]:
+        """The URLs of the public suffix lists that are used for the extraction."""
+        return self._tld_extract.suffix_list_urls
+
+    @cached_property
+    def _tld_extract(self) -> TLDExtract:
+        if self._suffix_list_urls is None:
+            return TLDExtract()
+        return TLDExtract(suffix_list_urls=self._suffix_list_urls)
+
+    @cached_property
+    def _extract_cached(self) -> Callable[[str], ExtractResult]:
+        return lru_cache(maxsize=self._max_cached_extractions)(self._tld_extract.__call__)
+
+    def __call__(self, url: str) -> ExtractResult:
+        """Returns the subdomain, domain and suffix of a hostname or URL.
+
+        Parameters
+        ----------
+        url : str
+            The hostname or URL.
+
+        Returns
+        -------
+        ExtractResult
+            The immutable result of :code:`tldextract`.
+        """
+        if not isinstance(url, str):
+            return self._tld_extract(url)
+        return self._extract_cached(url)
+
+    def cache_info(self):
+        """Returns the statistics of the extraction cache."""
+        return self._extract_cached.cache_info()
+
+
+def get_tld_extractor(suffix_list_urls: Optional[Sequence[str]] = None) -> TLDExtractor:
+    """Returns the extractor of the current process for the given suffix list URLs.
+
+    Parameters
+    ----------
+    suffix_list_urls : Optional[Sequence[str]]
+        The URLs of the public suffix lists. The default lists of :code:`tldextract` are used if
+        it is None.
+
+    Returns
+    -------
+    TLDExtractor
+        The extractor that is shared by all callers with the same suffix list URLs.
+    """
+    key = None if suffix_list_urls is None else tuple(suffix_list_urls)
+    with _extractors_lock:
+        if key not in _extractors:
+            _extractors[key] = TLDExtractor(suffix_list_urls)
+        return _extractors[key]
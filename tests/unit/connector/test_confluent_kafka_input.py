@@ -16,6 +16,7 @@ from logprep.abc.input import (
     FatalInputError,
     InputWarning,
 )
+from logprep.abc.output import FatalOutputError
 from logprep.connector.confluent_kafka.input import logger
 from logprep.factory import Factory
 from logprep.factory_error import InvalidConfigurationError
@@ -121,6 +122,7 @@ class TestConfluentKafkaInput(BaseInputTestCase, CommonConfluentKafkaTestCase):
         kafka_consumer = kafka_input._consumer
         message = "test message"
         kafka_input._last_valid_records = {0: message}
+        kafka_input._position = 1
         kafka_input.batch_finished_callback()
         if handlers is None:
             assert kafka_consumer.commit.call_count == 0
@@ -152,6 +154,7 @@ class TestConfluentKafkaInput(BaseInputTestCase, CommonConfluentKafkaTestCase):
 
         getattr(kafka_consumer, handler).side_effect = raise_generator(return_sequence)
         kafka_input._last_valid_records = {0: "message"}
+        kafka_input._position = 1
         with pytest.raises(InputWarning):
             kafka_input.batch_finished_callback()
 
@@ -229,6 +232,145 @@ class TestConfluentKafkaInput(BaseInputTestCase, CommonConfluentKafkaTestCase):
         ):
             self.object._get_event(0.001)
 
+    @staticmethod
+    def _get_mock_message(partition, offset, value=b'{"foo": "bar"}'):
+        message = mock.MagicMock()
+        message.error.return_value = None
+        message.partition.return_value = partition
+        message.offset.return_value = offset
+        message.value.return_value = value
+        return message
+
+    def _create_batch_consuming_object(self):
+        config = deepcopy(self.CONFIG)
+        config["consume_batch_size"] = 10
+        with mock.patch("logprep.connector.confluent_kafka.input.Consumer"):
+            connector = Factory.create({"test": config})
+            _ = connector._consumer
+        return connector
+
+    def test_get_next_consumes_batches_and_hands_out_messages_in_order(self):
+        connector = self._create_batch_consuming_object()
+        messages = [
+            self._get_mock_message(0, 1, b'{"order": 0}'),
+            self._get_mock_message(1, 5, b'{"order": 1}'),
+            self._get_mock_message(0, 2, b'{"order": 2}'),
+        ]
+        connector._consumer.consume.side_effect = [messages, []]
+        events = [connector.get_next(0.01)[0] for _ in range(4)]
+        assert events == [{"order": 0}, {"order": 1}, {"order": 2}, None]
+        connector._consumer.consume.assert_called_with(num_messages=10, timeout=0.01)
+        assert connector._consumer.consume.call_count == 2
+        connector._consumer.poll.assert_not_called()
+        assert connector._last_valid_records == {0: messages[2], 1: messages[1]}
+
+    def test_batch_consumption_sets_current_offsets_once_per_partition(self):
+        connector = self._create_batch_consuming_object()
+        connector._consumer.consume.return_value = [
+            self._get_mock_message(0, 1),
+            self._get_mock_message(0, 2),
+            self._get_mock_message(1, 5),
+        ]
+        connector.metrics.current_offsets = mock.MagicMock()
+        connector.get_next(0.01)
+        connector.get_next(0.01)
+        assert connector.metrics.current_offsets.add_with_labels.call_args_list == [
+            mock.call(3, {"description": "topic: test_input_raw - partition: 0"}),
+            mock.call(6, {"description": "topic: test_input_raw - partition: 1"}),
+        ]
+
+    def test_batch_consumption_raises_critical_input_error_for_message_with_error(self):
+        connector = self._create_batch_consuming_object()
+        message = self._get_mock_message(0, 1)
+        message.error.return_value = KafkaError(3)
+        connector._consumer.consume.return_value = [message]
+        with pytest.raises(CriticalInputError, match="contains an error code"):
+            connector.get_next(0.01)
+
+    def test_revoke_callback_removes_buffered_messages_of_revoked_partitions(self):
+        connector = self._create_batch_consuming_object()
+        connector.output_connector = mock.MagicMock()
+        connector._consumer.consume.return_value = [
+            self._get_mock_message(0, 1),
+            self._get_mock_message(1, 1),
+            self._get_mock_message(0, 2),
+            self._get_mock_message(1, 2),
+        ]
+        connector.get_next(0.01)
+        revoked_partition = mock.MagicMock()
+        revoked_partition.partition = 0
+        connector._revoke_callback(connector._consumer, [revoked_partition])
+        assert [message.partition() for message in connector._messages] == [1, 1]
+
+    def _create_offset_storing_object(self, **config_update):
+        config = deepcopy(self.CONFIG)
+        config.update(config_update)
+        with mock.patch("logprep.connector.confluent_kafka.input.Consumer"):
+            connector = Factory.create({"test": config})
+            _ = connector._consumer
+        return connector
+
+    def test_acknowledge_stores_offsets_of_checkpoint_only(self):
+        connector = self._create_offset_storing_object()
+        messages = [self._get_mock_message(0, 1), self._get_mock_message(0, 2)]
+        connector._consumer.poll.side_effect = messages
+        connector.get_next(0.01)
+        checkpoint = connector.get_checkpoint()
+        connector.get_next(0.01)
+        connector.acknowledge(checkpoint)
+        connector._consumer.store_offsets.assert_called_once_with(message=messages[0])
+
+    def test_batch_finished_callback_stores_offsets_after_offset_store_count_messages(self):
+        connector = self._create_offset_storing_object(offset_store_count=3)
+        messages = [self._get_mock_message(0, offset) for offset in range(5)]
+        connector._consumer.poll.side_effect = messages
+        for _ in messages:
+            connector.get_next(0.01)
+            connector.batch_finished_callback()
+        connector._consumer.store_offsets.assert_called_once_with(message=messages[2])
+
+    def test_offsets_are_stored_after_offset_store_interval_without_new_messages(self):
+        connector = self._create_offset_storing_object(
+            offset_store_count=100, offset_store_interval=5
+        )
+        connector._consumer.poll.side_effect = [self._get_mock_message(0, 1), None, None]
+        with mock.patch("time.monotonic", return_value=connector._last_offset_store + 1):
+            connector.get_next(0.01)
+            connector.batch_finished_callback()
+            connector.get_next(0.01)
+        connector._consumer.store_offsets.assert_not_called()
+        with mock.patch("time.monotonic", return_value=connector._last_offset_store + 5):
+            connector.get_next(0.01)
+        connector._consumer.store_offsets.assert_called_once()
+
+    def test_shut_down_stores_acknowledged_offsets_before_closing_consumer(self):
+        connector = self._create_offset_storing_object(offset_store_count=100)
+        message = self._get_mock_message(0, 1)
+        connector._consumer.poll.return_value = message
+        connector.get_next(0.01)
+        connector.batch_finished_callback()
+        kafka_consumer = connector._consumer
+        kafka_consumer.store_offsets.assert_not_called()
+        connector.shut_down()
+        kafka_consumer.store_offsets.assert_called_once_with(message=message)
+        kafka_consumer.close.assert_called()
+
+    def test_shut_down_stores_acknowledged_offsets_if_output_backlog_fails(self):
+        connector = self._create_offset_storing_object(offset_store_count=100)
+        message = self._get_mock_message(0, 1)
+        connector._consumer.poll.return_value = message
+        connector.get_next(0.01)
+        connector.batch_finished_callback()
+        connector.output_connector = mock.MagicMock()
+        connector.output_connector._write_backlog.side_effect = FatalOutputError(
+            connector.output_connector, "delivery failed"
+        )
+        kafka_consumer = connector._consumer
+        with pytest.raises(FatalOutputError, match="delivery failed"):
+            connector.shut_down()
+        kafka_consumer.store_offsets.assert_called_once_with(message=message)
+        kafka_consumer.close.assert_called()
+
     def test_setup_raises_fatal_input_error_on_invalid_config(self):
         kafka_config = {
             "bootstrap.servers": "testinstance:9092",
@@ -382,7 +524,7 @@ class TestConfluentKafkaInput(BaseInputTestCase, CommonConfluentKafkaTestCase):
         assert self.object.metrics.number_of_warnings == 1
 
     @mock.patch("logprep.connector.confluent_kafka.input.Consumer")
-    def test_revoke_callback_writes_output_backlog_and_calls_batch_finished_callback(
+    def test_revoke_callback_writes_output_backlog_and_does_not_call_batch_finished_callback(
         self, mock_consumer
     ):
         self.object.output_connector = mock.MagicMock()
@@ -390,7 +532,23 @@ class TestConfluentKafkaInput(BaseInputTestCase, CommonConfluentKafkaTestCase):
         mock_partitions = [mock.MagicMock()]
         self.object._revoke_callback(mock_consumer, mock_partitions)
         self.object.output_connector._write_backlog.assert_called()
-        self.object.batch_finished_callback.assert_called()
+        self.object.batch_finished_callback.assert_not_called()
+
+    def test_revoke_callback_stores_only_offsets_acknowledged_by_output(self):
+        connector = self._create_offset_storing_object(offset_store_count=100)
+        acknowledged_message = self._get_mock_message(0, 1)
+        unacknowledged_message = self._get_mock_message(0, 2)
+        connector._consumer.poll.return_value = acknowledged_message
+        connector.get_next(0.01)
+        checkpoint = connector.get_checkpoint()
+        connector._consumer.poll.return_value = unacknowledged_message
+        connector.get_next(0.01)
+        connector.output_connector = mock.MagicMock()
+        connector.output_connector._write_backlog.side_effect = lambda: connector.acknowledge(
+            checkpoint
+        )
+        connector._revoke_callback(connector._consumer, [])
+        connector._consumer.store_offsets.assert_called_once_with(message=acknowledged_message)
 
     def test_health_returns_true_if_no_error(self):
         with mock.patch("logprep.connector.confluent_kafka.input.Consumer"):
@@ -12,6 +12,7 @@ from unittest import mock
 import pytest
 from confluent_kafka.error import KafkaException
 
+from logprep.abc.component import Component
 from logprep.abc.output import CriticalOutputError, FatalOutputError
 from logprep.factory import Factory
 from logprep.factory_error import InvalidConfigurationError
@@ -36,6 +37,9 @@ class TestConfluentKafkaOutput(BaseOutputTestCase, CommonConfluentKafkaTestCase)
 
     expected_metrics = [
         "logprep_confluent_kafka_output_librdkafka_age",
+        "logprep_confluent_kafka_output_delivery_success",
+        "logprep_confluent_kafka_output_delivery_failures",
+        "logprep_confluent_kafka_output_buffer_retries",
         "logprep_confluent_kafka_output_librdkafka_msg_cnt",
         "logprep_confluent_kafka_output_librdkafka_msg_size",
         "logprep_confluent_kafka_output_librdkafka_msg_max",
@@ -63,7 +67,7 @@ class TestConfluentKafkaOutput(BaseOutputTestCase, CommonConfluentKafkaTestCase)
         kafka_producer = self.object._producer
         event = {"field": "content"}
         event_raw = json.dumps(event, separators=(",", ":")).encode("utf-8")
-        expected_call = mock.call(self.CONFIG.get("topic"), value=event_raw)
+        expected_call = mock.call(self.CONFIG.get("topic"), value=event_raw, on_delivery=mock.ANY)
         self.object.store(event)
         kafka_producer.produce.assert_called()
         assert expected_call in kafka_producer.produce.mock_calls
@@ -73,11 +77,26 @@ class TestConfluentKafkaOutput(BaseOutputTestCase, CommonConfluentKafkaTestCase)
         kafka_producer = self.object._producer
         event = {"field": "content"}
         event_raw = json.dumps(event, separators=(",", ":")).encode("utf-8")
-        expected_call = mock.call(self.CONFIG.get("topic"), value=event_raw)
+        expected_call = mock.call(self.CONFIG.get("topic"), value=event_raw, on_delivery=mock.ANY)
         self.object.store_custom(event, self.CONFIG.get("topic"))
         kafka_producer.produce.assert_called()
         assert expected_call in kafka_producer.produce.mock_calls
 
+    @mock.patch("logprep.connector.confluent_kafka.output.Producer")
+    def test_store_custom_batch_produces_all_events_and_polls_once(self, _):
+        kafka_producer = self.object._producer
+        events = [{"field": "content"}, {"field": "other content"}]
+        self.object.store_custom_batch(events, "custom_topic")
+        assert kafka_producer.produce.mock_calls == [
+            mock.call(
+                "custom_topic",
+                value=json.dumps(event, separators=(",", ":")).encode(),
+                on_delivery=mock.ANY,
+            )
+            for event in events
+        ]
+        kafka_producer.poll.assert_called_once()
+
     @mock.patch("logprep.connector.confluent_kafka.output.Producer")
     def test_store_failed_calls_producer_produce(self, _):
         kafka_producer = self.object._producer
@@ -97,20 +116,64 @@ class TestConfluentKafkaOutput(BaseOutputTestCase, CommonConfluentKafkaTestCase)
         assert "timestamp" in mock_produce_call_value
 
     @mock.patch("logprep.connector.confluent_kafka.output.Producer")
-    def test_store_custom_calls_producer_flush_on_buffererror(self, _):
+    def test_store_custom_retries_produce_on_buffererror_without_flush(self, _):
         kafka_producer = self.object._producer
-        kafka_producer.produce.side_effect = BufferError
+        kafka_producer.produce.side_effect = [BufferError, BufferError, None]
+        self.object.metrics.buffer_retries = 0
         self.object.store_custom({"message": "does not matter"}, "doesnotcare")
-        kafka_producer.flush.assert_called()
+        assert kafka_producer.produce.call_count == 3
+        assert self.object.metrics.buffer_retries == 2
+        kafka_producer.poll.assert_any_call(self.CONFIG.get("flush_timeout"))
+        kafka_producer.flush.assert_not_called()
 
     @mock.patch("logprep.connector.confluent_kafka.output.Producer")
-    def test_store_failed_calls_producer_flush_on_buffererror(self, _):
+    def test_store_custom_raises_fatal_output_error_if_buffer_stays_full(self, _):
+        kafka_output = Factory.create({"test connector": self.CONFIG})
+        kafka_producer = kafka_output._producer
+        kafka_producer.produce.side_effect = BufferError
+        with pytest.raises(FatalOutputError, match="Producer queue is full"):
+            kafka_output.store_custom({"message": "does not matter"}, "doesnotcare")
+        assert kafka_producer.produce.call_count == kafka_output._config.max_buffer_retries + 1
+        kafka_producer.flush.assert_not_called()
+
+    @mock.patch("logprep.connector.confluent_kafka.output.Producer")
+    def test_store_does_not_acknowledge_event_if_buffer_stays_full(self, _):
+        self.object.input_connector = mock.MagicMock()
+        self.object._producer.produce.side_effect = BufferError
+        with pytest.raises(FatalOutputError, match="Producer queue is full"):
+            self.object.store({"message": "does not matter"})
+        self.object._write_backlog()
+        self.object.input_connector.get_checkpoint.assert_not_called()
+        self.object.input_connector.acknowledge.assert_not_called()
+
+    @mock.patch("logprep.connector.confluent_kafka.output.Producer")
+    def test_store_failed_raises_fatal_output_error_if_buffer_stays_full(self, _):
         kafka_producer = self.object._producer
         kafka_producer.produce.side_effect = BufferError
-        self.object.store_failed(
-            "doesnotcare", {"message": "does not matter"}, {"message": "does not matter"}
-        )
-        kafka_producer.flush.assert_called()
+        self.object.metrics.number_of_errors = 0
+        with pytest.raises(FatalOutputError, match="could not store failed event"):
+            self.object.store_failed(
+                "doesnotcare", {"message": "does not matter"}, {"message": "does not matter"}
+            )
+        assert self.object.metrics.number_of_errors == 1
+        kafka_producer.flush.assert_not_called()
+
+    @mock.patch("logprep.connector.confluent_kafka.output.Producer")
+    def test_store_polls_after_messages_per_poll_messages(self, _):
+        config = deepcopy(self.CONFIG)
+        config["messages_per_poll"] = 3
+        kafka_output = Factory.create({"test connector": config})
+        for _ in range(7):
+            kafka_output.store({"message": "my event message"})
+        assert kafka_output._producer.poll.call_count == 2
+
+    @mock.patch("logprep.connector.confluent_kafka.output.Producer")
+    def test_delivery_callback_counts_delivered_messages(self, _):
+        self.object.metrics.delivery_success = 0
+        self.object.store({"message": "my event message"})
+        on_delivery = self.object._producer.produce.call_args.kwargs["on_delivery"]
+        on_delivery(None, mock.MagicMock())
+        assert self.object.metrics.delivery_success == 1
 
     @mock.patch("logprep.connector.confluent_kafka.output.Producer")
     def test_shut_down_calls_producer_flush(self, _):
@@ -146,7 +209,79 @@ class TestConfluentKafkaOutput(BaseOutputTestCase, CommonConfluentKafkaTestCase)
     def test_store_calls_batch_finished_callback(self, _):  # pylint: disable=arguments-differ
         self.object.input_connector = mock.MagicMock()
         self.object.store({"message": "my event message"})
-        self.object.input_connector.batch_finished_callback.assert_called()
+        self.object.input_connector.batch_finished_callback.assert_not_called()
+
+    @mock.patch("logprep.connector.confluent_kafka.output.Producer")
+    def test_store_acknowledges_checkpoints_of_delivered_events_in_order(self, _):
+        self.object.input_connector = mock.MagicMock()
+        self.object.input_connector.get_checkpoint.side_effect = [
+            "first",
+            "second",
+            "third",
+            "fourth",
+            "fifth",
+        ]
+        for _ in range(3):
+            self.object.store({"message": "my event message"})
+        first, second, third = [
+            call.kwargs["on_delivery"] for call in self.object._producer.produce.call_args_list
+        ]
+        second(None, mock.MagicMock())
+        self.object.store({"message": "my event message"})
+        self.object.input_connector.acknowledge.assert_not_called()
+        first(None, mock.MagicMock())
+        self.object.store({"message": "my event message"})
+        self.object.input_connector.acknowledge.assert_called_once_with("second")
+        third(None, mock.MagicMock())
+        self.object._write_backlog()
+        self.object.input_connector.acknowledge.assert_called_with("third")
+
+    @mock.patch("logprep.connector.confluent_kafka.output.Producer")
+    def test_delivery_callback_counts_and_logs_errors(self, _):
+        self.object.metrics.number_of_errors = 0
+        self.object.store({"message": "my event message"})
+        on_delivery = self.object._producer.produce.call_args.kwargs["on_delivery"]
+        self.object.metrics.delivery_failures = 0
+        with mock.patch("logging.Logger.error") as mock_error:
+            on_delivery(KafkaException("delivery failed"), mock.MagicMock())
+        mock_error.assert_called()
+        assert self.object.metrics.number_of_errors == 1
+        assert self.object.metrics.delivery_failures == 1
+
+    @mock.patch("logprep.connector.confluent_kafka.output.Producer")
+    def test_failed_delivery_stops_acknowledgement_and_raises(self, _):
+        self.object.input_connector = mock.MagicMock()
+        self.object.input_connector.get_checkpoint.side_effect = ["first", "second", "third"]
+        for _ in range(3):
+            self.object.store({"message": "my event message"})
+        first, second, third = [
+            call.kwargs["on_delivery"] for call in self.object._producer.produce.call_args_list
+        ]
+        first(None, mock.MagicMock())
+        second(KafkaException("delivery failed"), mock.MagicMock())
+        third(None, mock.MagicMock())
+        for _ in range(2):
+            with pytest.raises(FatalOutputError, match="Could not deliver message"):
+                self.object._write_backlog()
+        self.object.input_connector.acknowledge.assert_called_once_with("first")
+
+    @mock.patch("logprep.connector.confluent_kafka.output.Producer")
+    def test_scheduled_delivery_reports_acknowledge_last_event(self, _):
+        self.object.input_connector = mock.MagicMock()
+        self.object.input_connector.get_checkpoint.return_value = "last"
+        self.object.store({"message": "my event message"})
+        on_delivery = self.object._producer.produce.call_args.kwargs["on_delivery"]
+        on_delivery(None, mock.MagicMock())
+        self.object.input_connector.acknowledge.assert_not_called()
+        self.object._serve_delivery_reports()
+        self.object._producer.poll.assert_called_with(0)
+        self.object.input_connector.acknowledge.assert_called_once_with("last")
+
+    @mock.patch("logprep.connector.confluent_kafka.output.Producer")
+    def test_setup_schedules_serving_of_delivery_reports(self, _):
+        job_count = len(Component._scheduler.jobs)
+        self.object.setup()
+        assert len(Component._scheduler.jobs) == job_count + 1
 
     def test_setup_raises_fatal_output_error_on_invalid_config(self):
         kafka_config = {"myconfig": "the config", "bootstrap.servers": "testserver:9092"}
@@ -34,6 +34,18 @@ class TestJsonlOutputOutput(BaseOutputTestCase):
         assert len(self.object.events) == 1
         assert self.object.events[0] == {"whatever": self.document}
 
+    @mock.patch("logprep.connector.jsonl.output.JsonlOutput._write_json_lines")
+    def test_store_custom_batch_writes_all_documents_at_once(self, _):
+        self.object.metrics.number_of_processed_events = 0
+        documents = [{"order": 0}, {"order": 1}]
+        self.object.store_custom_batch(documents, target="whatever")
+        expected = [{"whatever": {"order": 0}}, {"whatever": {"order": 1}}]
+        assert self.object.events == expected
+        self.object._write_json_lines.assert_called_once_with(
+            self.object._config.output_file_custom, expected
+        )
+        assert self.object.metrics.number_of_processed_events == 2
+
     @mock.patch("logprep.connector.jsonl.output.JsonlOutput._write_json")
     def test_store_maintains_order_of_documents(self, _):
         for i in range(0, 3):
@@ -8,6 +8,7 @@ import copy
 import json
 import os
 import re
+import threading
 import time
 import uuid
 from datetime import datetime
@@ -31,6 +32,12 @@ class NotJsonSerializableMock:
     pass
 
 
+def _deserialize(entry):
+    action, source = entry
+    ((_, meta),) = json.loads(action).items()
+    return json.loads(source) | meta
+
+
 in_ci = os.environ.get("GITHUB_ACTIONS") == "true"
 
 helpers.parallel_bulk = mock.MagicMock()
@@ -65,8 +72,9 @@ class TestOpenSearchOutput(BaseOutputTestCase):
         }
         self.object.store(event)
 
-        assert self.object._message_backlog[0].pop("@timestamp")
-        assert self.object._message_backlog[0] == expected
+        document = _deserialize(self.object._message_backlog[0])
+        assert document.pop("@timestamp")
+        assert document == expected
 
     def test_store_sends_event_to_expected_index_with_date_pattern_if_index_missing_in_event(self):
         default_index = "default_index-%{%y-%m-%d}"
@@ -85,8 +93,9 @@ class TestOpenSearchOutput(BaseOutputTestCase):
         self.object = Factory.create({"opensearch_output": config})
         self.object.store(event)
 
-        assert self.object._message_backlog[0].pop("@timestamp")
-        assert self.object._message_backlog[0] == expected
+        document = _deserialize(self.object._message_backlog[0])
+        assert document.pop("@timestamp")
+        assert document == expected
 
     def test_store_custom_sends_event_to_expected_index(self):
         custom_index = "custom_index"
@@ -96,7 +105,17 @@ class TestOpenSearchOutput(BaseOutputTestCase):
         config["message_backlog_size"] = 2
         self.object = Factory.create({"opensearch_output": config})
         self.object.store_custom(event, custom_index)
-        assert self.object._message_backlog[0] == expected
+        assert _deserialize(self.object._message_backlog[0]) == expected
+
+    def test_store_custom_batch_adds_events_with_index_to_backlog(self):
+        config = copy.deepcopy(self.CONFIG)
+        config["message_backlog_size"] = 10
+        self.object = Factory.create({"opensearch_output": config})
+        self.object.store_custom_batch([{"field": "a"}, {"field": "b"}], "custom_index")
+        assert list(map(_deserialize, self.object._message_backlog)) == [
+            {"field": "a", "_index": "custom_index"},
+            {"field": "b", "_index": "custom_index"},
+        ]
 
     def test_store_failed(self):
         error_index = "error_index"
@@ -116,7 +135,7 @@ class TestOpenSearchOutput(BaseOutputTestCase):
         self.object = Factory.create({"opensearch_output": config})
         self.object.store_failed(error_message, event_received, event)
 
-        error_document = self.object._message_backlog[0]
+        error_document = _deserialize(self.object._message_backlog[0])
         # timestamp is compared to be approximately the same,
         # since it is variable and then removed to compare the rest
         error_time = datetime.timestamp(TimeParser.from_string(error_document["@timestamp"]))
@@ -454,6 +473,152 @@ class TestOpenSearchOutput(BaseOutputTestCase):
             assert mock_sleep.call_count == 2
             assert self.object._message_backlog == []
 
+    def test_store_serializes_action_line_once_per_op_type_and_index(self):
+        config = copy.deepcopy(self.CONFIG)
+        config["message_backlog_size"] = 10
+        self.object = Factory.create({"opensearch_output": config})
+        event = {"field": "content", "_index": "my_index", "_op_type": "create"}
+        self.object.store(event)
+        self.object.store({"field": "other", "_index": "my_index", "_op_type": "create"})
+        first, second = self.object._message_backlog
+        assert first == ('{"create":{"_index":"my_index"}}', '{"field":"content"}')
+        assert first[0] is second[0]
+        assert event == {"field": "content", "_index": "my_index", "_op_type": "create"}
+
+    def test_store_expands_actions_of_documents_with_other_meta_fields(self):
+        config = copy.deepcopy(self.CONFIG)
+        config["message_backlog_size"] = 10
+        self.object = Factory.create({"opensearch_output": config})
+        self.object.store({"field": "content", "_index": "my_index", "_id": "my_id"})
+        action, source = self.object._message_backlog[0]
+        assert json.loads(action) == {"index": {"_index": "my_index", "_id": "my_id"}}
+        assert json.loads(source) == {"field": "content"}
+
+    def test_message_backlog_is_written_if_message_backlog_size_mb_is_reached(self):
+        config = copy.deepcopy(self.CONFIG)
+        config["message_backlog_size"] = 100
+        config["message_backlog_size_mb"] = 10**-4
+        self.object = Factory.create({"opensearch_output": config})
+        with mock.patch.object(self.object, "_bulk") as mock_bulk:
+            self.object.store({"_index": "test_index", "field": "a" * 10})
+            mock_bulk.assert_not_called()
+            assert self.object._message_backlog_bytes == 57
+            self.object.store({"_index": "test_index", "field": "a" * 40})
+        mock_bulk.assert_called_once()
+        assert self.object._message_backlog_bytes == 0
+
+    def test_store_raises_fatal_output_error_if_document_can_not_be_serialized(self):
+        with pytest.raises(FatalOutputError, match="in document"):
+            self.object.store({"_index": "test_index", "field": NotJsonSerializableMock()})
+
+    def test_write_backlog_passes_serialized_documents_to_bulk_helper(self):
+        config = copy.deepcopy(self.CONFIG)
+        config["message_backlog_size"] = 10
+        config["parallel_bulk"] = False
+        self.object = Factory.create({"opensearch_output": config})
+        self.object.store({"_index": "test_index", "field": "content"})
+        self.object._message_backlog.append({"_index": "error_index", "error": "content"})
+        actions = list(self.object._message_backlog)
+        with mock.patch("opensearchpy.helpers.bulk") as mock_bulk:
+            self.object._write_backlog()
+        expand_action = mock_bulk.call_args.kwargs["expand_action_callback"]
+        assert list(map(expand_action, actions)) == [
+            ('{"index":{"_index":"test_index"}}', '{"field":"content"}'),
+            ({"index": {"_index": "error_index"}}, {"error": "content"}),
+        ]
+
+    def test_search_context_compresses_requests_if_configured(self):
+        config = copy.deepcopy(self.CONFIG)
+        config["compress_requests"] = True
+        self.object = Factory.create({"opensearch_output": config})
+        with mock.patch("opensearchpy.OpenSearch") as mock_opensearch:
+            _ = self.object._search_context
+        assert mock_opensearch.call_args.kwargs["http_compress"] is True
+
+    def test_build_failed_index_document_keeps_serialized_document(self):
+        failed_document = self.object._build_failed_index_document('{"foo":"bar"}', "reason")
+        assert failed_document["message"] == '{"foo":"bar"}'
+
+    def _create_object_with_bulk_writers(self, **config_update):
+        config = copy.deepcopy(self.CONFIG)
+        config.update({"bulk_writer_threads": 1, **config_update})
+        output = Factory.create({"opensearch_output": config})
+        output.input_connector = mock.MagicMock()
+        output.input_connector.get_checkpoint.side_effect = range(100)
+        output._start_bulk_writers()
+        return output
+
+    def test_store_hands_full_backlog_over_to_bulk_writers(self):
+        self.object = self._create_object_with_bulk_writers()
+        with mock.patch.object(self.object, "_bulk") as mock_bulk:
+            self.object.store({"_index": "test_index", "event": "test_event"})
+            assert self.object._message_backlog == []
+            self.object._write_backlog()
+        mock_bulk.assert_called_once()
+        assert list(map(_deserialize, mock_bulk.call_args.args[1])) == [
+            {"_index": "test_index", "event": "test_event"}
+        ]
+        self.object.input_connector.acknowledge.assert_called_once_with(0)
+        self.object.input_connector.batch_finished_callback.assert_not_called()
+        self.object.shut_down()
+
+    def test_hand_over_backlog_blocks_if_max_pending_bulks_are_reached(self):
+        self.object = self._create_object_with_bulk_writers(max_pending_bulks=1)
+        release = threading.Event()
+        with mock.patch.object(self.object, "_bulk", side_effect=lambda *_, **__: release.wait()):
+            self.object.store({"_index": "test_index", "event": "first"})
+            self.object.input_connector.acknowledge.assert_not_called()
+            threading.Timer(0.1, release.set).start()
+            self.object.store({"_index": "test_index", "event": "second"})
+            self.object.input_connector.acknowledge.assert_called_once_with(0)
+            assert len(self.object._pending_bulks) == 1
+            self.object._write_backlog()
+        self.object.input_connector.acknowledge.assert_called_with(1)
+        self.object.shut_down()
+
+    def test_error_of_bulk_writer_is_raised_in_pipeline(self):
+        self.object = self._create_object_with_bulk_writers()
+        error = FatalOutputError(self.object, "bulk failed")
+        with mock.patch.object(self.object, "_bulk", side_effect=error):
+            self.object.store({"_index": "test_index", "event": "test_event"})
+            with pytest.raises(FatalOutputError, match="bulk failed"):
+                self.object._write_backlog()
+        self.object.input_connector.acknowledge.assert_not_called()
+        self.object.shut_down()
+
+    def test_failed_bulk_stops_acknowledgement_of_later_bulks(self):
+        self.object = self._create_object_with_bulk_writers(max_pending_bulks=3)
+        error = FatalOutputError(self.object, "bulk failed")
+        release = threading.Event()
+        bulk_results = iter([error, None, None])
+
+        def bulk(*_, **__):
+            release.wait()
+            result = next(bulk_results)
+            if result is not None:
+                raise result
+
+        with mock.patch.object(self.object, "_bulk", side_effect=bulk):
+            for event in ("first", "second", "third"):
+                self.object.store({"_index": "test_index", "event": event})
+            release.set()
+            for bulk_to_write in list(self.object._pending_bulks):
+                bulk_to_write.done.wait()
+            for _ in range(2):
+                with pytest.raises(FatalOutputError, match="bulk failed"):
+                    self.object._write_backlog()
+            with pytest.raises(FatalOutputError, match="bulk failed"):
+                self.object.store({"_index": "test_index", "event": "fourth"})
+        self.object.input_connector.acknowledge.assert_not_called()
+        with pytest.raises(FatalOutputError, match="bulk failed"):
+            self.object.shut_down()
+
+    def test_shut_down_stops_bulk_writers(self):
+        self.object = self._create_object_with_bulk_writers(bulk_writer_threads=2)
+        bulk_writers = list(self.object._bulk_writers)
+        self.object.shut_down()
+        assert not any(bulk_writer.is_alive() for bulk_writer in bulk_writers)
+
     def test_health_returns_true_on_success(self):
         self.object._search_context = mock.MagicMock()
         self.object._search_context.cluster.health.return_value = {"status": "green"}
@@ -433,8 +433,10 @@ class TestPipeline(ConfigurationForTests):
         self.pipeline._pipeline.append(deepcopy(self.pipeline._pipeline[0]))
         self.pipeline.process_pipeline()
         assert self.pipeline._input.get_next.call_count == 1
-        assert self.pipeline._output["dummy"].store_custom.call_count == 1
-        self.pipeline._output["dummy"].store_custom.assert_called_with({"foo": "bar"}, "target")
+        assert self.pipeline._output["dummy"].store_custom_batch.call_count == 1
+        self.pipeline._output["dummy"].store_custom_batch.assert_called_with(
+            [{"foo": "bar"}], "target"
+        )
 
     def test_store_custom_calls_all_defined_outputs(self, _):
         self.pipeline._output.update({"dummy1": mock.MagicMock()})
@@ -453,11 +455,13 @@ class TestPipeline(ConfigurationForTests):
         self.pipeline._input.get_next.return_value = ({"some": "event"}, None)
         self.pipeline.process_pipeline()
         assert self.pipeline._input.get_next.call_count == 1
-        assert self.pipeline._output["dummy"].store_custom.call_count == 1
-        assert self.pipeline._output["dummy1"].store_custom.call_count == 1
-        self.pipeline._output["dummy"].store_custom.assert_called_with({"foo": "bar"}, "target")
-        self.pipeline._output["dummy1"].store_custom.assert_called_with(
-            {"foo": "bar"}, "second_target"
+        assert self.pipeline._output["dummy"].store_custom_batch.call_count == 1
+        assert self.pipeline._output["dummy1"].store_custom_batch.call_count == 1
+        self.pipeline._output["dummy"].store_custom_batch.assert_called_with(
+            [{"foo": "bar"}], "target"
+        )
+        self.pipeline._output["dummy1"].store_custom_batch.assert_called_with(
+            [{"foo": "bar"}], "second_target"
         )
 
     def test_extra_data_list_is_passed_to_store_custom(self, _):
@@ -470,8 +474,53 @@ class TestPipeline(ConfigurationForTests):
         self.pipeline._input.get_next.return_value = ({"some": "event"}, None)
         self.pipeline.process_pipeline()
         assert self.pipeline._input.get_next.call_count == 1
-        assert self.pipeline._output["dummy"].store_custom.call_count == 1
-        self.pipeline._output["dummy"].store_custom.assert_called_with({"foo": "bar"}, "target")
+        assert self.pipeline._output["dummy"].store_custom_batch.call_count == 1
+        self.pipeline._output["dummy"].store_custom_batch.assert_called_with(
+            [{"foo": "bar"}], "target"
+        )
+
+    def test_extra_data_is_grouped_by_output_and_target(self, _):
+        self.pipeline._output.update({"dummy1": mock.MagicMock()})
+        self.pipeline._setup()
+        self.pipeline._store_extra_data(
+            [
+                ({"foo": "bar"}, ({"dummy": "target"}, {"dummy1": "target"})),
+                ({"foo": "baz"}, ({"dummy": "target"},)),
+                ({"foo": "qux"}, ({"dummy": "other_target"},)),
+            ]
+        )
+        assert self.pipeline._output["dummy"].store_custom_batch.call_args_list == [
+            mock.call([{"foo": "bar"}, {"foo": "baz"}], "target"),
+            mock.call([{"foo": "qux"}], "other_target"),
+        ]
+        self.pipeline._output["dummy1"].store_custom_batch.assert_called_once_with(
+            [{"foo": "bar"}], "target"
+        )
+
+    def test_flushed_extra_data_of_processors_is_stored_without_event(self, _):
+        self.pipeline._setup()
+        self.pipeline._pipeline[1] = deepcopy(self.pipeline._pipeline[0])
+        self.pipeline._pipeline[0].flush_extra_data.return_value = [
+            ({"foo": "bar"}, ({"dummy": "target"},))
+        ]
+        self.pipeline._pipeline[1].flush_extra_data.return_value = []
+        self.pipeline._input.get_next.return_value = (None, None)
+        self.pipeline.process_pipeline()
+        self.pipeline._pipeline[0].flush_extra_data.assert_called_once_with(False)
+        self.pipeline._output["dummy"].store_custom_batch.assert_called_once_with(
+            [{"foo": "bar"}], "target"
+        )
+
+    def test_shut_down_stores_all_flushed_extra_data_of_processors(self, _):
+        self.pipeline._setup()
+        self.pipeline._pipeline[1] = deepcopy(self.pipeline._pipeline[0])
+        processor = self.pipeline._pipeline[0]
+        processor.flush_extra_data.return_value = [({"foo": "bar"}, ({"dummy": "target"},))]
+        self.pipeline._pipeline[1].flush_extra_data.return_value = []
+        output = self.pipeline._output["dummy"]
+        self.pipeline._shut_down()
+        processor.flush_extra_data.assert_called_once_with(True)
+        output.store_custom_batch.assert_called_once_with([{"foo": "bar"}], "target")
 
     def test_setup_adds_versions_information_to_input_connector_config(self, mock_create):
         self.pipeline._setup()
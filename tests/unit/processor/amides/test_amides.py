@@ -3,13 +3,14 @@
 import hashlib
 import re
 from copy import deepcopy
-from multiprocessing import current_process
 from pathlib import Path
+from unittest import mock
 
 import pytest
 import responses
 
 from logprep.factory import Factory
+from logprep.util.artifacts import get_artifact
 from tests.unit.processor.base import BaseProcessorTestCase
 
 
@@ -175,33 +176,19 @@ class TestAmides(BaseProcessorTestCase):
         )
         assert re.match(".*FieldExistsWarning.*", str(result.warnings))
 
-    def test_setup_get_model_via_file_getter(self, tmp_path, monkeypatch):
-        model_uri = "file://tests/testdata/unit/amides/model.zip"
-        model_original = Path(self.CONFIG["models_path"])
-        expected_checksum = hashlib.md5(model_original.read_bytes()).hexdigest()  # nosemgrep
-
-        (tmp_path / model_original.parent).mkdir(parents=True)
-        model_test_copy = tmp_path / model_original
-        model_test_copy.touch()
-        model_test_copy.write_bytes(model_original.read_bytes())
-
+    def test_setup_get_model_via_file_getter(self, tmp_path):
         config = deepcopy(self.CONFIG)
-        config["models_path"] = model_uri
+        config["models_path"] = "file://tests/testdata/unit/amides/model.zip"
         self.object = Factory.create({"amides": config})
-
-        with monkeypatch.context() as monkey_context:
-            monkey_context.chdir(tmp_path)
+        with mock.patch("logprep.util.artifacts.ARTIFACT_CACHE_DIR", tmp_path):
             self.object.setup()
-            cached_file = Path(f"{current_process().name}-{self.object.name}.zip")
-            assert cached_file.exists()
-            cached_checksum = hashlib.md5(cached_file.read_bytes()).hexdigest()  # nosemgrep
-            assert expected_checksum == cached_checksum
+        assert not list(tmp_path.glob("*.zip"))
+        assert self.object._misuse_detector is not None
 
     @responses.activate
-    def test_setup_get_model_via_http_getter(self, tmp_path, monkeypatch):
+    def test_setup_get_model_via_http_getter(self, tmp_path):
         model_uri = "http://model-path-target/model.zip"
-        model_original = Path(self.CONFIG["models_path"])
-        model_original_content = model_original.read_bytes()
+        model_original_content = Path(self.CONFIG["models_path"]).read_bytes()
         expected_checksum = hashlib.md5(model_original_content).hexdigest()  # nosemgrep
         responses.add(responses.GET, model_uri, model_original_content)
 
@@ -209,10 +196,20 @@ class TestAmides(BaseProcessorTestCase):
         config["models_path"] = model_uri
         self.object = Factory.create({"amides": config})
 
-        with monkeypatch.context() as monkey_context:
-            monkey_context.chdir(tmp_path)
+        with mock.patch("logprep.util.artifacts.ARTIFACT_CACHE_DIR", tmp_path):
             self.object.setup()
-            loaded_file = Path(f"{current_process().name}-{self.object.name}.zip")
-            assert loaded_file.exists()
-            loaded_checksum = hashlib.md5(loaded_file.read_bytes()).hexdigest()  # nosemgrep
-            assert expected_checksum == loaded_checksum
+            loaded_file = get_artifact(model_uri)
+        loaded_checksum = hashlib.md5(loaded_file.read_bytes()).hexdigest()  # nosemgrep
+        assert expected_checksum == loaded_checksum
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_setup_downloads_model_only_once_per_node(self, tmp_path):
+        model_uri = "http://model-path-target/model.zip"
+        responses.add(responses.GET, model_uri, Path(self.CONFIG["models_path"]).read_bytes())
+        config = deepcopy(self.CONFIG)
+        config["models_path"] = model_uri
+        with mock.patch("logprep.util.artifacts.ARTIFACT_CACHE_DIR", tmp_path):
+            for name in ("amides_1", "amides_2"):
+                Factory.create({name: config}).setup()
+        assert len(responses.calls) == 1
@@ -1,14 +1,19 @@
 # pylint: disable=missing-docstring
 import numpy as np
 import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.preprocessing import MinMaxScaler
+from sklearn.svm import SVC
 
 from logprep.processor.amides.detection import (
+    DetectionModel,
     MissingModelComponentError,
     MisuseDetector,
     RuleAttributor,
     RuleAttributorError,
+    StackedRuleModels,
 )
+from logprep.processor.amides.features import CommaSeparation
 
 
 class MockVectorizer:
@@ -143,3 +148,38 @@ class TestRuleAttributor:
 
         results = attributor.attribute("malicious")
         assert results == expected
+
+
+class TestStackedRuleModels:
+    @pytest.fixture
+    def linear_rule_models(self):
+        samples = ["cmd,exe,whoami", "powershell,enc,iex", "net,user,add", "cmd,exe,dir", "ls,la"]
+        rule_models = {}
+        for rule_name, labels in [("rule_a", [1, 0, 0, 1]), ("rule_b", [0, 1, 1, 0, 0])]:
+            vectorizer = TfidfVectorizer(tokenizer=CommaSeparation(), token_pattern=None)
+            features = vectorizer.fit_transform(samples[: len(labels)])
+            clf = SVC(kernel="linear").fit(features, labels)
+            scaler = MinMaxScaler().fit(clf.decision_function(features).reshape(-1, 1))
+            rule_models[rule_name] = {"clf": clf, "vectorizer": vectorizer, "scaler": scaler}
+        return rule_models
+
+    def test_rule_attributor_uses_stacked_models_for_linear_models(self, linear_rule_models):
+        attributor = RuleAttributor(linear_rule_models, num_rule_attributions=2)
+        assert isinstance(attributor._stacked_rule_models, StackedRuleModels)
+
+    def test_rule_attributor_does_not_stack_models_without_linear_classifiers(self, misuse_model):
+        attributor = RuleAttributor({"rule_a": misuse_model}, num_rule_attributions=2)
+        assert attributor._stacked_rule_models is None
+
+    @pytest.mark.parametrize(
+        "sample",
+        ["cmd,exe,whoami", "powershell,enc,net", "cmd,cmd,exe,add", "unknown,tokens", ""],
+    )
+    def test_stacked_confidence_values_equal_single_model_values(self, linear_rule_models, sample):
+        stacked = StackedRuleModels.from_models(list(linear_rule_models.values()))
+        expected = [DetectionModel(model).detect(sample) for model in linear_rule_models.values()]
+        assert np.allclose(stacked.confidence_values(sample), expected)
+
+    def test_models_with_different_tokenization_are_not_stacked(self, linear_rule_models):
+        linear_rule_models["rule_b"]["vectorizer"].set_params(ngram_range=(1, 2))
+        assert StackedRuleModels.from_models(list(linear_rule_models.values())) is None
@@ -0,0 +1,93 @@
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+import itertools
+from unittest import mock
+
+import pytest
+
+from logprep.processor.calculator.expression import CompiledExpression
+from logprep.processor.calculator.fourFn import BNF, evaluate_stack
+from logprep.processor.calculator.processor import Calculator
+
+TEMPLATES = [
+    "${a}",
+    "-${a}",
+    "--${a}",
+    "+-${a}",
+    "5 - ${a}",
+    "5*+${a}",
+    "${a}^2",
+    "2^-${a}",
+    "(${a}+${b})/2",
+    "round(${a}, 1)",
+    "from_hex(${a})",
+    "multiply(${a},-${b})",
+    "- + ${a}",
+]
+
+VALUES = ["3", "-3", "+-3", " 4 ", "1.5", "1e-5", "0x1f", "pi", "-E", "abc", "3+4", 7, -2.5]
+
+
+def _evaluate_templated(calc, source):
+    bnf = BNF()
+    bnf.exprStack.clear()
+    bnf.parseString(Calculator._template(calc, source), parseAll=True)
+    return bnf.evaluate_stack()
+
+
+def _result_of(function, *args):
+    try:
+        return function(*args)
+    except Exception as error:  # pylint: disable=broad-except
+        return type(error)
+
+
+class TestCompiledExpression:
+    @pytest.mark.parametrize("calc", TEMPLATES)
+    def test_bound_expression_evaluates_like_templated_expression(self, calc):
+        expression = CompiledExpression.compile(calc)
+        assert expression is not None
+        for value_a, value_b in itertools.product(VALUES, VALUES[:3]):
+            source = {"a": value_a, "b": value_b}
+            stack = expression.bind(source)
+            if stack is None:
+                continue
+            expected = _result_of(_evaluate_templated, calc, source)
+            assert _result_of(evaluate_stack, stack) == expected, source
+
+    @pytest.mark.parametrize("value", ["3+4", "", "-", "1e-5", "(3)", "[1, 2]"])
+    def test_values_that_are_not_a_single_token_are_not_bound(self, value):
+        expression = CompiledExpression.compile("${a} * 2")
+        assert expression.bind({"a": value}) is None
+
+    @pytest.mark.parametrize(
+        "calc", ["${a}e5", "1.${a}", "${a}${b}", "${a}(2)", "${a} +", "logprepcalculatorslot0"]
+    )
+    def test_expressions_with_inseparable_field_references_are_not_compiled(self, calc):
+        assert CompiledExpression.compile(calc) is None
+
+    def test_compiling_does_not_leave_tokens_on_the_grammar_stack(self):
+        CompiledExpression.compile("${a} + 5")
+        assert not BNF().exprStack
+
+    def test_bind_does_not_change_compiled_stack(self):
+        expression = CompiledExpression.compile("${a} - ${b}")
+        stack = list(expression._stack)
+        assert evaluate_stack(expression.bind({"a": "5", "b": "-3"})) == 8
+        assert expression._stack == stack
+
+
+class TestCalculatorWithCompiledExpression:
+    def test_calculator_does_not_parse_bound_expressions(self):
+        calculator = Calculator(
+            "calculator", Calculator.Config(type="calculator", specific_rules=[], generic_rules=[])
+        )
+        rule = calculator.rule_class._create_from_dict(
+            {"filter": "a", "calculator": {"calc": "${a} * 2", "target_field": "result"}}
+        )
+        calculator._specific_tree.add_rule(rule)
+        event = {"a": "21"}
+        with mock.patch.object(BNF, "parseString") as mock_parse_string:
+            calculator.process(event)
+        mock_parse_string.assert_not_called()
+        assert event["result"] == 42
@@ -173,6 +173,30 @@ class TestClusterer(BaseProcessorTestCase):
 
         assert document == expected
 
+    def test_cluster_reuses_cached_signature(self):
+        rule_definition = {
+            "filter": "message",
+            "clusterer": {
+                "source_fields": ["message"],
+                "pattern": r"test (signature) test",
+                "repl": r"<+>\1</+>",
+            },
+            "description": "",
+        }
+        rule = ClustererRule._create_from_dict(rule_definition)
+        self.object._generic_tree.add_rule(rule, None)
+        for _ in range(3):
+            document = {"message": "test signature test"}
+            self.object._cluster(document, rule)
+            assert document["cluster_signature"] == "signature"
+        assert self.object.sps.cache_info().hits == 2
+
+    def test_signature_cache_can_be_disabled(self):
+        config = deepcopy(self.CONFIG)
+        config.update({"max_cached_signatures": 0})
+        clusterer = Factory.create({"test instance": config})
+        assert clusterer.sps.cache_info() is None
+
     def test_rule_dependency(self, tmp_path):
         config = deepcopy(self.CONFIG)
         empty_rules_path = tmp_path / "empty"
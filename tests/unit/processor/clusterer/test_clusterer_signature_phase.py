@@ -125,3 +125,36 @@ class TestSignaturePhaseStreaming:
             sig_str_no_tags, sig_text = sps.run(self.record, rule)
             self.record.raw_text = sig_text
         assert sig_str_no_tags == self.expected_log_sig
+
+    def test_run_chain_equals_sequential_run(self):
+        sig_str_no_tags, sig_text = SignaturePhaseStreaming().run_chain(
+            DatasetSignatureProcessing.test_record_1.raw_text, LogSaltModeTestComposition.rules
+        )
+        assert sig_str_no_tags == self.expected_log_sig
+        assert sig_text == DatasetSignatureProcessing.test_record_1.sig_text
+
+    def test_run_chain_caches_signatures(self):
+        sps = SignaturePhaseStreaming(max_cached_signatures=10)
+        raw_text = DatasetSignatureProcessing.test_record_1.raw_text
+        first_result = sps.run_chain(raw_text, LogSaltModeTestComposition.rules)
+        second_result = sps.run_chain(raw_text, LogSaltModeTestComposition.rules)
+        assert first_result == second_result
+        assert sps.cache_info().hits == 1
+        assert sps.cache_info().misses == 1
+
+    def test_run_chain_cache_distinguishes_rules(self):
+        sps = SignaturePhaseStreaming(max_cached_signatures=10)
+        raw_text = DatasetSignatureProcessing.test_record_1.raw_text
+        sps.run_chain(raw_text, LogSaltModeTestComposition.rules)
+        sps.run_chain(raw_text, LogSaltModeTestComposition.rules[:1])
+        assert sps.cache_info().misses == 2
+
+    def test_cache_is_disabled_by_default(self):
+        assert SignaturePhaseStreaming().cache_info() is None
+
+    def test_run_chain_raises_for_tags_in_raw_text_even_if_cached(self):
+        sps = SignaturePhaseStreaming(max_cached_signatures=10)
+        rules = LogSaltModeTestComposition.rules[:1]
+        for _ in range(2):
+            with pytest.raises(BaseException, match=r"Start-tag <\+> in raw log message"):
+                sps.run_chain("raw text with <+>", rules)
@@ -734,3 +734,33 @@ class TestDissector(BaseProcessorTestCase):
         assert len(result.warnings) == 1
         assert isinstance(result.warnings[0], ProcessingWarning)
         assert event == expected, testcase
+
+    def test_fused_conversion_failure_keeps_written_value(self):
+        rule = {
+            "filter": "message",
+            "dissector": {"mapping": {"message": "%{field1|int} %{field2|int}"}},
+        }
+        self._load_specific_rule(rule)
+        event = {"message": "one 2"}
+        result = self.object.process(event)
+        assert event == {
+            "message": "one 2",
+            "field1": "one",
+            "field2": 2,
+            "tags": ["_dissector_failure"],
+        }
+        assert len(result.warnings) == 1
+
+    def test_fused_conversion_of_skipped_write_converts_existing_value(self):
+        rule = {
+            "filter": "message",
+            "dissector": {
+                "mapping": {"doesnotexist": "%{field1}"},
+                "convert_datatype": {"field1": "int"},
+                "ignore_missing_fields": True,
+            },
+        }
+        self._load_specific_rule(rule)
+        event = {"message": "the message", "field1": "42"}
+        self.object.process(event)
+        assert event == {"message": "the message", "field1": 42}
@@ -6,6 +6,9 @@ import pytest
 
 from logprep.processor.base.exceptions import InvalidRuleDefinitionError
 from logprep.processor.dissector.rule import (
+    INDIRECT_TARGET,
+    INDIRECT_TARGET_NAME,
+    TARGET,
     DissectorRule,
     add_and_overwrite,
     append,
@@ -506,3 +509,54 @@ class TestDissectorRule:
         }
         rule = DissectorRule._create_from_dict(rule)
         assert rule.id == "my_id"
+
+    def test_groups_actions_by_source_field(self):
+        rule = {
+            "filter": "message",
+            "dissector": {
+                "mapping": {"field1": "%{field2}:%{?name} %{&name}", "field5": "%{field6}"}
+            },
+        }
+        rule = DissectorRule._create_from_dict(rule)
+        assert rule.extraction_program == [
+            (
+                "field1",
+                (
+                    (0, ":", "field2", None, TARGET),
+                    (1, " ", "name", None, INDIRECT_TARGET_NAME),
+                    (2, None, "name", None, INDIRECT_TARGET),
+                ),
+            ),
+            ("field5", ((3, None, "field6", None, TARGET),)),
+        ]
+
+    def test_write_order_is_sorted_by_position(self):
+        rule = {
+            "filter": "message",
+            "dissector": {"mapping": {"field1": "%{+field2/2} %{+field2/1} %{+field2}"}},
+        }
+        rule = DissectorRule._create_from_dict(rule)
+        assert rule.write_order == (2, 1, 0)
+
+    @pytest.mark.parametrize(
+        "mapping, convert_datatype, expected",
+        [
+            ({"field1": "%{field2|int} %{field3}"}, {}, {"field2"}),
+            ({"field1": "%{field2} %{field3}"}, {"field3": "float"}, {"field3"}),
+            ({"field1": "%{field2} %{field3}"}, {"field4": "float"}, set()),
+            ({"field1": "%{+field2|int} %{field3}"}, {}, set()),
+            ({"field1": "%{field2|int} %{field2}"}, {}, set()),
+            ({"field1": "%{field2|int} %{field2.sub}"}, {}, set()),
+            ({"field1": "%{field2.sub|int} %{field3}"}, {"field2": "string"}, set()),
+            ({"field1": "%{field2|int} %{?field3} %{&field3}"}, {}, set()),
+        ],
+    )
+    def test_fuses_conversions_into_single_writes(self, mapping, convert_datatype, expected):
+        rule = {
+            "filter": "message",
+            "dissector": {"mapping": mapping, "convert_datatype": convert_datatype},
+        }
+        rule = DissectorRule._create_from_dict(rule)
+        assert rule.fused_convert_targets == expected
+        for (_, _, target_field, *_), (_, _, converter) in zip(rule.actions, rule.write_program):
+            assert (converter is not None) == (target_field in expected)
@@ -2,8 +2,6 @@
 # pylint: disable=protected-access
 import hashlib
 import os
-import shutil
-import tempfile
 from copy import deepcopy
 from os.path import exists
 from pathlib import Path
@@ -14,6 +12,7 @@ import responses
 
 from logprep.factory import Factory
 from logprep.processor.base.exceptions import FieldExistsWarning, ProcessingWarning
+from logprep.util.artifacts import get_artifact
 from tests.unit.processor.base import BaseProcessorTestCase
 
 REL_TLD_LIST_PATH = "tests/testdata/external/public_suffix_list.dat"
@@ -280,42 +279,27 @@ sth.ac.at
         assert document == expected
 
     @responses.activate
-    def test_setup_downloads_tld_lists_to_separate_process_file(self):
-        tld_list = "http://db-path-target/list.dat"
-        tld_list_path = Path("/usr/bin/ls") if Path("/usr/bin/ls").exists() else Path("/bin/ls")
-        tld_list_content = tld_list_path.read_bytes()
-        expected_checksum = hashlib.md5(tld_list_content).hexdigest()  # nosemgrep
-        responses.add(responses.GET, tld_list, tld_list_content)
+    def test_setup_downloads_tld_list_to_shared_artifact_cache(self, tmp_path):
+        content_path = Path("/usr/bin/ls") if Path("/usr/bin/ls").exists() else Path("/bin/ls")
+        content = content_path.read_bytes()
+        expected_checksum = hashlib.md5(content).hexdigest()  # nosemgrep
+        responses.add(responses.GET, "http://db-path-target/list.dat", content)
         config = deepcopy(self.CONFIG)
-        config.update({"tld_lists": [tld_list]})
-        self.object = Factory.create({"resolver": config})
-        self.object.setup()
-        logprep_tmp_dir = Path(tempfile.gettempdir()) / "logprep"
-        downloaded_file = logprep_tmp_dir / f"{self.object.name}-tldlist-0.dat"
-        assert downloaded_file.exists()
+        config["tld_lists"] = ["http://db-path-target/list.dat"]
+        with mock.patch("logprep.util.artifacts.ARTIFACT_CACHE_DIR", tmp_path):
+            self.object = Factory.create({"resolver": config})
+            self.object.setup()
+            downloaded_file = get_artifact("http://db-path-target/list.dat")
         downloaded_checksum = hashlib.md5(downloaded_file.read_bytes()).hexdigest()  # nosemgrep
         assert expected_checksum == downloaded_checksum
-        # delete testfile
-        shutil.rmtree(logprep_tmp_dir)
+        assert len(responses.calls) == 1
 
     @responses.activate
-    def test_setup_doesnt_overwrite_already_existing_tld_list_file(self):
-        tld_list = "http://db-path-target/list.dat"
-        tld_list_content = "some content"
-        responses.add(responses.GET, tld_list, tld_list_content.encode("utf8"))
-
-        logprep_tmp_dir = Path(tempfile.gettempdir()) / "logprep"
-        os.makedirs(logprep_tmp_dir, exist_ok=True)
-        tld_temp_file = logprep_tmp_dir / f"{self.object.name}-tldlist-0.dat"
-
-        pre_existing_content = "file exists already"
-        tld_temp_file.touch()
-        tld_temp_file.write_bytes(pre_existing_content.encode("utf8"))
+    def test_setup_does_not_download_already_cached_tld_list_again(self, tmp_path):
+        responses.add(responses.GET, "http://db-path-target/list.dat", b"some content")
         config = deepcopy(self.CONFIG)
-        config.update({"tld_lists": [tld_list]})
-        self.object = Factory.create({"resolver": config})
-        self.object.setup()
-        assert tld_temp_file.exists()
-        assert tld_temp_file.read_bytes().decode("utf8") == pre_existing_content
-        assert tld_temp_file.read_bytes().decode("utf8") != tld_list_content
-        shutil.rmtree(logprep_tmp_dir)  # delete testfile
+        config["tld_lists"] = ["http://db-path-target/list.dat"]
+        with mock.patch("logprep.util.artifacts.ARTIFACT_CACHE_DIR", tmp_path):
+            for processor_name in ("resolver_1", "resolver_2"):
+                Factory.create({processor_name: config}).setup()
+        assert len(responses.calls) == 1
@@ -3,6 +3,7 @@
 import pytest
 
 from logprep.processor.base.exceptions import InvalidRuleDefinitionError
+from logprep.processor.field_manager import writers
 from logprep.processor.field_manager.rule import FieldManagerRule
 
 
@@ -118,3 +119,28 @@ class TestFieldManagerRule:
         rule1 = FieldManagerRule._create_from_dict(rule1)
         rule2 = FieldManagerRule._create_from_dict(rule2)
         assert (rule1 == rule2) == equality, testcase
+
+    @pytest.mark.parametrize(
+        ["extend_target_list", "overwrite_target", "expected_writer"],
+        [
+            (False, False, writers.write_without_extending),
+            (False, True, writers.write_without_extending),
+            (True, False, writers.write_extending),
+            (True, True, writers.write_extending_and_overwriting),
+        ],
+    )
+    def test_single_target_writer_is_chosen_by_rule_flags(
+        self, extend_target_list, overwrite_target, expected_writer
+    ):
+        rule = FieldManagerRule._create_from_dict(
+            {
+                "filter": "message",
+                "field_manager": {
+                    "source_fields": ["message"],
+                    "target_field": "new_field",
+                    "extend_target_list": extend_target_list,
+                    "overwrite_target": overwrite_target,
+                },
+            }
+        )
+        assert rule.single_target_writer is expected_writer
@@ -8,6 +8,7 @@ import re
 import tempfile
 import time
 from copy import deepcopy
+from decimal import Decimal
 from unittest import mock
 
 import pytest
@@ -32,6 +33,22 @@ BASE_TABLE_RESULTS = [
 ]
 
 
+@pytest.fixture(name="sql_file_paths", autouse=True)
+def fixture_sql_file_paths(request, tmp_path, monkeypatch):
+    """Writes the lock, table and index files of generic adders with a sql config into a temporary
+    directory instead of the working directory."""
+    config = getattr(request.cls, "CONFIG", {})
+    if "sql_config" not in config:
+        return
+    config = deepcopy(config)
+    config["sql_config"] |= {
+        "file_lock_path": str(tmp_path / "sql_update.lock"),
+        "db_file_path": str(tmp_path / "sql_db_table.json"),
+        "db_index_path": str(tmp_path / "sql_db_table.sqlite"),
+    }
+    monkeypatch.setattr(request.cls, "CONFIG", config)
+
+
 def mock_simulate_table_change():
     DBMock.Cursor.checksum += 1
     DBMock.Cursor.table_result[0] = [0, "TEST_0", "fi", "fo"]
@@ -86,6 +103,42 @@ class DBMockNeverEmpty(DBMock):
                 self._data = []
 
 
+INCREMENTAL_TABLE_RESULTS = [
+    [0, "TEST_0", "foo", "bar", 1],
+    [1, "TEST_1", "uuu", "vvv", 2],
+    [2, "TEST_2", "123", "456", 3],
+]
+
+
+TABLE_STATE_STATEMENT = (
+    "SELECT MAX(updated_at), COUNT(*), COUNT(DISTINCT CAST(UPPER(a) AS BINARY)) FROM test_table"
+)
+
+
+class DBMockIncremental(DBMock):
+    class Cursor(DBMock.Cursor):
+        table_result = deepcopy(INCREMENTAL_TABLE_RESULTS)
+        statements = []
+        database_upper = staticmethod(str.upper)
+
+        def execute(self, statement, params=()):
+            self.statements.append((statement, params))
+            if statement == TABLE_STATE_STATEMENT:
+                self._data = [
+                    max((row[-1] for row in self.table_result), default=None),
+                    len(self.table_result),
+                    len({self.database_upper(row[1]) for row in self.table_result}),
+                ]
+            elif statement == "desc test_table":
+                self._data = [["id"], ["a"], ["b"], ["c"], ["updated_at"]]
+            elif statement == "SELECT * FROM test_table":
+                self._data = self.table_result
+            elif statement == "SELECT * FROM test_table WHERE updated_at >= %s":
+                self._data = [row for row in self.table_result if row[-1] >= params[0]]
+            else:
+                self._data = []
+
+
 class TestGenericAdder(BaseProcessorTestCase):
     test_cases = [  # testcase, rule, event, expected
         (
@@ -816,3 +869,145 @@ class TestGenericAdderProcessorSQLWithAddedTarget(BaseTestGenericAdderSQLTestCas
         self.object.process(document)
 
         assert document == expected
+
+
+class TestGenericAdderProcessorSQLIncremental(BaseTestGenericAdderSQLTestCase):
+    mocks = {"mysql.connector.connect": {"return_value": DBMockIncremental()}}
+
+    CONFIG = {
+        "type": "generic_adder",
+        "generic_rules": ["tests/testdata/unit/generic_adder/rules/generic"],
+        "specific_rules": ["tests/testdata/unit/generic_adder/rules/specific"],
+        "sql_config": {
+            "user": "test_user",
+            "password": "foo_bar_baz",
+            "host": "127.0.0.1",
+            "database": "test_db",
+            "table": "test_table",
+            "target_column": "a",
+            "timer": 0.1,
+            "update_column": "updated_at",
+        },
+    }
+
+    def setup_method(self):
+        DBMockIncremental.Cursor.table_result = deepcopy(INCREMENTAL_TABLE_RESULTS)
+        DBMockIncremental.Cursor.statements = []
+        DBMockIncremental.Cursor.database_upper = staticmethod(str.upper)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.isfile(self.CONFIG["sql_config"]["db_index_path"] + suffix):
+                os.remove(self.CONFIG["sql_config"]["db_index_path"] + suffix)
+        super().setup_method()
+        DBMockIncremental.Cursor.statements = []
+
+    def teardown_method(self):
+        self.object.shut_down()
+        super().teardown_method()
+
+    def _wait_and_process(self, document):
+        time.sleep(0.2)  # nosemgrep
+        self.object.process(document)
+
+    def test_sql_database_enriches_via_shared_index(self):
+        expected = {
+            "add_from_sql_db_table": "Test",
+            "source": "TEST_0.test.123",
+            "db": {"test": {"b": "foo", "c": "bar"}},
+        }
+        document = {"add_from_sql_db_table": "Test", "source": "TEST_0.test.123"}
+
+        self.object.process(document)
+
+        assert document == expected
+        assert self.object._db_table.get("TEST_1") == (("b", "uuu"), ("c", "vvv"))
+
+    def test_sql_database_retrieves_only_changed_rows(self):
+        DBMockIncremental.Cursor.table_result[1] = [1, "TEST_1", "new", "row", 4]
+        DBMockIncremental.Cursor.table_result.append([3, "TEST_3", "abc", "def", 4])
+        document = {"add_from_sql_db_table": "Test", "source": "TEST_3.test.123"}
+
+        self._wait_and_process(document)
+
+        assert document["db"] == {"test": {"b": "abc", "c": "def"}}
+        assert self.object._db_table.get("TEST_1") == (("b", "new"), ("c", "row"))
+        assert (
+            "SELECT * FROM test_table WHERE updated_at >= %s",
+            (3,),
+        ) in DBMockIncremental.Cursor.statements
+        assert ("SELECT * FROM test_table", ()) not in DBMockIncremental.Cursor.statements
+
+    def test_sql_database_does_not_retrieve_rows_if_table_state_has_not_changed(self):
+        self._wait_and_process({"add_from_sql_db_table": "Test", "source": "TEST_0.test.123"})
+        statements = [statement for statement, _ in DBMockIncremental.Cursor.statements]
+        assert statements == [TABLE_STATE_STATEMENT]
+
+    def test_sql_database_reloads_table_if_rows_have_been_deleted(self):
+        del DBMockIncremental.Cursor.table_result[0]
+        document = {"add_from_sql_db_table": "Test", "source": "TEST_0.test.123"}
+
+        self._wait_and_process(document)
+
+        assert "db" not in document
+        assert ("SELECT * FROM test_table", ()) in DBMockIncremental.Cursor.statements
+
+    def test_sql_database_reloads_table_if_row_has_been_replaced(self):
+        DBMockIncremental.Cursor.table_result[0] = [3, "TEST_3", "abc", "def", 4]
+        document = {"add_from_sql_db_table": "Test", "source": "TEST_0.test.123"}
+
+        self._wait_and_process(document)
+
+        assert "db" not in document
+        assert self.object._db_table.get("TEST_3") == (("b", "abc"), ("c", "def"))
+        assert ("SELECT * FROM test_table", ()) in DBMockIncremental.Cursor.statements
+
+    def test_sql_database_reloads_table_if_target_column_has_been_changed(self):
+        DBMockIncremental.Cursor.table_result[0] = [0, "TEST_4", "foo", "bar", 4]
+        document = {"add_from_sql_db_table": "Test", "source": "TEST_0.test.123"}
+
+        self._wait_and_process(document)
+
+        assert "db" not in document
+        assert self.object._db_table.get("TEST_4") == (("b", "foo"), ("c", "bar"))
+        assert ("SELECT * FROM test_table", ()) in DBMockIncremental.Cursor.statements
+
+    def test_sql_database_reloads_table_only_once_if_database_and_python_keys_differ(self):
+        # e.g. keys that are only equal after converting them to upper case in python
+        DBMockIncremental.Cursor.database_upper = staticmethod(lambda key: key)
+        DBMockIncremental.Cursor.table_result.append([3, "test_2", "abc", "def", 4])
+        self._wait_and_process({"add_from_sql_db_table": "Test", "source": "TEST_0.test.123"})
+        assert ("SELECT * FROM test_table", ()) in DBMockIncremental.Cursor.statements
+        DBMockIncremental.Cursor.statements = []
+        DBMockIncremental.Cursor.table_result.append([4, "TEST_4", "ghi", "jkl", 5])
+        document = {"add_from_sql_db_table": "Test", "source": "TEST_4.test.123"}
+
+        self._wait_and_process(document)
+
+        assert document["db"] == {"test": {"b": "ghi", "c": "jkl"}}
+        assert ("SELECT * FROM test_table", ()) not in DBMockIncremental.Cursor.statements
+
+    def test_sql_database_keeps_types_of_values_in_shared_index(self):
+        DBMockIncremental.Cursor.table_result[0] = [0, "TEST_0", Decimal("1.5"), None, 4]
+        self._wait_and_process({"add_from_sql_db_table": "Test", "source": "TEST_1.test.123"})
+        assert self.object._db_table.get("TEST_0") == (("b", Decimal("1.5")), ("c", None))
+
+    def test_sql_database_does_not_check_database_if_index_has_been_updated_recently(self):
+        self.object._file_check_interval = 9999999
+        self._wait_and_process({"add_from_sql_db_table": "Test", "source": "TEST_0.test.123"})
+        assert not DBMockIncremental.Cursor.statements
+
+    def test_changes_of_other_processes_are_visible_via_shared_index(self):
+        sql_config = self.CONFIG["sql_config"]
+        other_processor = Factory.create({"other generic adder": deepcopy(self.CONFIG)})
+        assert other_processor._db_table.get("TEST_0") == (("b", "foo"), ("c", "bar"))
+        DBMockIncremental.Cursor.table_result[0] = [0, "TEST_0", "fi", "fo", 4]
+        self.object._db_connector._last_check = 0
+        self.object._update_db_index(time.time() + sql_config["timer"] + 1)
+        other_processor._db_table.refresh()
+        assert other_processor._db_table.get("TEST_0") == (("b", "fi"), ("c", "fo"))
+        other_processor.shut_down()
+
+    def test_update_column_must_contain_only_alphanumeric_or_underscore(self):
+        config = deepcopy(self.CONFIG)
+        config["sql_config"]["update_column"] = "updated_at; DROP TABLE test_table"
+        with pytest.raises(InvalidConfigurationError, match="Update column in 'sql_config'"):
+            Factory.create({"Test Instance Name": config})
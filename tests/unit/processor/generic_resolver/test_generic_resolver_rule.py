@@ -2,9 +2,15 @@
 # pylint: disable=missing-docstring
 # pylint: disable=wrong-import-position
 # pylint: disable=wrong-import-order
+import re
+
 import pytest
 
-from logprep.processor.generic_resolver.rule import GenericResolverRule
+from logprep.processor.base.exceptions import InvalidRuleDefinitionError
+from logprep.processor.generic_resolver.rule import (
+    GenericResolverRule,
+    ResolveListMatcher,
+)
 
 
 @pytest.fixture(name="specific_rule_definition")
@@ -158,3 +164,71 @@ class TestGenericResolverRule:
         rule1 = GenericResolverRule._create_from_dict(specific_rule_definition)
         rule2 = GenericResolverRule._create_from_dict(other_rule_definition)
         assert (rule1 == rule2) == is_equal, testcase
+
+    def test_rule_with_invalid_resolve_list_pattern_raises(self):
+        rule_definition = {
+            "filter": "message",
+            "generic_resolver": {
+                "field_mapping": {"to_resolve": "resolved"},
+                "resolve_list": {"(unclosed": "result"},
+            },
+        }
+        with pytest.raises(InvalidRuleDefinitionError, match="invalid regex pattern"):
+            GenericResolverRule._create_from_dict(rule_definition)
+
+    def test_resolve_from_file_pattern_is_precompiled_and_anchored(self, specific_rule_definition):
+        rule = GenericResolverRule._create_from_dict(specific_rule_definition)
+        assert rule.resolve_from_file_pattern.pattern == r"^\d*(?P<mapping>[a-z]+)\d*$"
+
+
+class TestResolveListMatcher:
+    @pytest.mark.parametrize(
+        "resolve_list, value, expected_index",
+        [
+            ({".*HELLO\\d": "a"}, "something HELLO1", 0),
+            ({".*HELLO\\d": "a"}, "something else", None),
+            ({"HELLO": "a", "HELLO\\d": "b"}, "HELLO1", 0),
+            ({"HELLO\\d": "a", "HELLO": "b"}, "HELLO1", 0),
+            ({"HELLO\\d": "a", "HELLO": "b"}, "HELLO", 1),
+            ({"^foo$": "a", "bar": "b"}, "foo", 0),
+            ({"^foo$": "a", "bar": "b"}, "foobar", 1),
+            ({"bar": "a", "^foobar$": "b"}, "foobar", 0),
+            ({"^foo$": "a"}, "foo\n", 0),
+            ({"^foo$": "a"}, "foobar", None),
+            ({"(?P<group>a)(b)": "a", "b(c)": "b"}, "bc", 1),
+            ({"(a)\\1": "a", "b": "b"}, "aa b", 0),
+            ({"(a)\\1": "a", "b": "b"}, "ab", 1),
+            ({"(?P<x>a)": "a", "(?P<x>b)": "b"}, "b", 1),
+            ({"(a)": "a", "(b)?(?(1)c|d)": "b"}, "bc", 1),
+            ({"(a)": "a", "(b)?(?(1)c|d)": "b"}, "d", 1),
+            ({"(?P<x>a)": "a", "(?P<y>b)?(?(y)c|d)": "b"}, "bc", 1),
+            ({"(?i)hello": "a", "world": "b"}, "HELLO world", 0),
+            ({"^start": "a", "end$": "b"}, "the end", 1),
+            ({"^start": "a", "end$": "b"}, "no start", None),
+            ({"a|b": "a", "c": "b"}, "c b", 0),
+            ({"first": "a", "second": "b"}, "multi\nline second", 1),
+        ],
+    )
+    def test_search_returns_index_of_first_matching_pattern(
+        self, resolve_list, value, expected_index
+    ):
+        matcher = ResolveListMatcher(resolve_list)
+        assert matcher.search(value) == expected_index
+        expected_by_search = next(
+            (index for index, pattern in enumerate(resolve_list) if re.search(pattern, value)),
+            None,
+        )
+        assert expected_index == expected_by_search
+
+    @pytest.mark.parametrize("pattern", ["(b)?(?(1)c|d)", "(?P<y>b)?(?(y)c|d)"])
+    def test_conditional_group_references_are_not_combined(self, pattern):
+        matcher = ResolveListMatcher({"(a)": "a", pattern: "b"})
+        assert matcher._combined is None
+        assert matcher.search("bc") == 1
+
+    def test_values_are_in_resolve_list_order(self):
+        matcher = ResolveListMatcher({"a": "first", "b": "second"})
+        assert matcher.values == ["first", "second"]
+
+    def test_search_with_empty_resolve_list_returns_none(self):
+        assert ResolveListMatcher({}).search("anything") is None
@@ -4,10 +4,7 @@
 # pylint: disable=too-many-statements
 import copy
 import hashlib
-import os
 import re
-import shutil
-import tempfile
 from pathlib import Path
 from unittest import mock
 
@@ -16,6 +13,7 @@ import responses
 from geoip2.errors import AddressNotFoundError
 
 from logprep.factory import Factory
+from logprep.util.artifacts import get_artifact
 from tests.unit.processor.base import BaseProcessorTestCase
 
 
@@ -94,6 +92,12 @@ class TestGeoipEnricher(BaseProcessorTestCase):
         "tree_config": "tests/testdata/unit/shared_data/tree_config.json",
     }
 
+    expected_metrics = [
+        "logprep_geoip_enricher_new_lookups",
+        "logprep_geoip_enricher_cached_lookups",
+        "logprep_geoip_enricher_num_cache_entries",
+    ]
+
     @property
     def generic_rules_dirs(self):
         return self.CONFIG["generic_rules"]
@@ -361,42 +365,76 @@ class TestGeoipEnricher(BaseProcessorTestCase):
         assert document == expected_event
 
     @responses.activate
-    def test_setup_downloads_geoip_database_if_not_exits(self):
-        geoip_database_path = "http://db-path-target/db_file.mmdb"
-        db_path = Path("/usr/bin/ls") if Path("/usr/bin/ls").exists() else Path("/bin/ls")
-        db_path_content = db_path.read_bytes()
-        expected_checksum = hashlib.md5(db_path_content).hexdigest()  # nosemgrep
-        responses.add(responses.GET, geoip_database_path, db_path_content)
+    def test_setup_downloads_geoip_database_to_shared_artifact_cache(self, tmp_path):
+        content_path = Path("/usr/bin/ls") if Path("/usr/bin/ls").exists() else Path("/bin/ls")
+        content = content_path.read_bytes()
+        expected_checksum = hashlib.md5(content).hexdigest()  # nosemgrep
+        responses.add(responses.GET, "http://db-path-target/db_file.mmdb", content)
         config = copy.deepcopy(self.CONFIG)
-        config["db_path"] = geoip_database_path
-        self.object = Factory.create({"geoip_enricher": config})
-        self.object.setup()
-        logprep_tmp_dir = Path(tempfile.gettempdir()) / "logprep"
-        downloaded_file = logprep_tmp_dir / f"{self.object.name}.mmdb"
-        assert downloaded_file.exists()
+        config["db_path"] = "http://db-path-target/db_file.mmdb"
+        with mock.patch("logprep.util.artifacts.ARTIFACT_CACHE_DIR", tmp_path):
+            self.object = Factory.create({"geoip_enricher": config})
+            self.object.setup()
+            downloaded_file = get_artifact("http://db-path-target/db_file.mmdb")
         downloaded_checksum = hashlib.md5(downloaded_file.read_bytes()).hexdigest()  # nosemgrep
         assert expected_checksum == downloaded_checksum
-        # delete testfile
-        shutil.rmtree(logprep_tmp_dir)
+        assert len(responses.calls) == 1
 
     @responses.activate
-    def test_setup_doesnt_overwrite_already_existing_geomap_file(self):
-        mmdb_file_path = "http://db-path-target/db_file.mmdb"
-        new_content = "some content"
-        responses.add(responses.GET, mmdb_file_path, new_content.encode("utf8"))
-
-        logprep_tmp_dir = Path(tempfile.gettempdir()) / "logprep"
-        os.makedirs(logprep_tmp_dir, exist_ok=True)
-        temporary_file = logprep_tmp_dir / f"{self.object.name}.mmdb"
-
-        pre_existing_content = "file exists already"
-        temporary_file.touch()
-        temporary_file.write_bytes(pre_existing_content.encode("utf8"))
+    def test_setup_does_not_download_already_cached_geoip_database_again(self, tmp_path):
+        responses.add(responses.GET, "http://db-path-target/db_file.mmdb", b"some content")
+        config = copy.deepcopy(self.CONFIG)
+        config["db_path"] = "http://db-path-target/db_file.mmdb"
+        with mock.patch("logprep.util.artifacts.ARTIFACT_CACHE_DIR", tmp_path):
+            for processor_name in ("geoip_enricher_1", "geoip_enricher_2"):
+                Factory.create({processor_name: config}).setup()
+        assert len(responses.calls) == 1
+
+    def test_repeated_ip_is_looked_up_once(self):
+        with mock.patch.object(
+            self.object, "_try_getting_geoip_data", wraps=self.object._try_getting_geoip_data
+        ) as mock_lookup:
+            for _ in range(3):
+                self.object.process({"client": {"ip": "8.8.8.8"}})
+        mock_lookup.assert_called_once_with("8.8.8.8")
+
+    def test_cached_results_are_not_shared_between_events(self):
+        first_document = {"client": {"ip": "8.8.8.8"}}
+        second_document = {"client": {"ip": "8.8.8.8"}}
+        self.object.process(first_document)
+        self.object.process(second_document)
+        assert first_document == second_document
+        first_coordinates = first_document["geoip"]["geometry"]["coordinates"]
+        second_coordinates = second_document["geoip"]["geometry"]["coordinates"]
+        assert first_coordinates == [1.1, 2.2]
+        assert first_coordinates is not second_coordinates
+        first_coordinates.append(3.3)
+        third_document = {"client": {"ip": "8.8.8.8"}}
+        self.object.process(third_document)
+        assert third_document["geoip"]["geometry"]["coordinates"] == [1.1, 2.2]
+
+    def test_cache_updates_metrics(self):
+        self.object.metrics.new_lookups = 0
+        self.object.metrics.cached_lookups = 0
+        for ip in ("8.8.8.8", "8.8.8.8", "1.2.3.4", "8.8.8.8"):
+            self.object.process({"client": {"ip": ip}})
+        assert self.object.metrics.new_lookups == 2
+        assert self.object.metrics.cached_lookups == 2
+        assert self.object._get_geoip_data_cached.cache_info().currsize == 2
+
+    def test_cache_can_be_disabled(self):
         config = copy.deepcopy(self.CONFIG)
-        config["db_path"] = mmdb_file_path
-        self.object = Factory.create({"geoip_enricher": config})
-        self.object.setup()
-        assert temporary_file.exists()
-        assert temporary_file.read_bytes().decode("utf8") == pre_existing_content
-        assert temporary_file.read_bytes().decode("utf8") != new_content
-        shutil.rmtree(logprep_tmp_dir)  # delete testfile
+        config["max_cached_ips"] = 0
+        geoip_enricher = Factory.create({"geoip_enricher": config})
+        geoip_enricher.setup()
+        with mock.patch.object(
+            geoip_enricher, "_try_getting_geoip_data", return_value={}
+        ) as mock_lookup:
+            for _ in range(2):
+                geoip_enricher.process({"client": {"ip": "8.8.8.8"}})
+        assert mock_lookup.call_count == 2
+
+    def test_unhashable_ip_value_is_not_cached(self):
+        document = {"client": {"ip": ["8.8.8.8"]}}
+        self.object.process(document)
+        assert "geoip" not in document
@@ -3,6 +3,7 @@
 # pylint: disable=no-self-use
 
 import pytest
+
 from logprep.processor.geoip_enricher.rule import GeoipEnricherRule
 
 
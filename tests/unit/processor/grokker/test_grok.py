@@ -1,5 +1,7 @@
 # pylint: disable=missing-docstring
-from logprep.util.grok.grok import Grok
+from unittest import mock
+
+from logprep.util.grok.grok import Grok, _get_regex_parser
 
 
 def test_one_pat():
@@ -233,3 +235,46 @@ def test_matches_with_mixed_oniguruma_and_grok_syntax():
     match = grok.match(text)
     assert match["number1"] == "123", f"grok match failed: {text}, {pat}"
     assert match["number2"] == "456", f"grok match failed: {text}, {pat}"
+
+
+def test_required_literals_are_extracted_per_pattern():
+    pat = ["%{WORD:vendor} format1 %{INT:number}", r"(?<prefix>CEF:\d)|%{INT:number}"]
+    grok = Grok(pat)
+    assert grok.required_literals == [" format1 ", ""]
+
+
+def test_required_literals_are_empty_for_case_insensitive_patterns():
+    grok = Grok(["(?i)format %{INT:number}", "(?i:format) %{INT:number}"])
+    assert grok.required_literals == ["", " "]
+
+
+def test_first_matching_pattern_wins_with_prefilter():
+    text = "acme format2 1024"
+    pat = [
+        "%{WORD:vendor} format1 %{INT:number}",
+        "%{WORD:vendor} format2 %{INT:number}",
+        "%{WORD:vendor} %{WORD:format} %{INT:number}",
+    ]
+    grok = Grok(pat)
+    match = grok.match(text)
+    assert match == {"vendor": "acme", "number": "1024"}
+
+
+def test_patterns_without_required_literal_in_text_are_not_tried():
+    text = "acme format2 1024"
+    grok = Grok(["%{WORD:vendor} format1 %{INT:number}", "%{WORD:vendor} format2 %{INT:number}"])
+    grok.regex_obj[0] = mock.MagicMock(wraps=grok.regex_obj[0])
+    match = grok.match(text)
+    grok.regex_obj[0].fullmatch.assert_not_called()
+    assert match == {"vendor": "acme", "number": "1024"}
+
+
+def test_patterns_are_matched_without_prefilter_if_regex_parser_is_not_available():
+    _get_regex_parser.cache_clear()
+    try:
+        with mock.patch("re._parser", new=object()):
+            grok = Grok(["%{WORD:vendor} format1 %{INT:number}", "%{WORD:vendor} format2"])
+    finally:
+        _get_regex_parser.cache_clear()
+    assert grok.required_literals == ["", ""]
+    assert grok.match("acme format2") == {"vendor": "acme"}
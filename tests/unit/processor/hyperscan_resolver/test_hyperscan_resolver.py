@@ -4,6 +4,7 @@
 # pylint: disable=wrong-import-order
 from collections import OrderedDict
 from copy import deepcopy
+from unittest import mock
 
 import pytest
 
@@ -15,7 +16,11 @@ from logprep.processor.base.exceptions import (
 pytest.importorskip("hyperscan")
 
 # pylint: disable=ungrouped-imports
-from logprep.processor.hyperscan_resolver.rule import InvalidHyperscanResolverDefinition
+from logprep.factory import Factory
+from logprep.processor.hyperscan_resolver.rule import (
+    HyperscanResolverRule,
+    InvalidHyperscanResolverDefinition,
+)
 from tests.unit.processor.base import BaseProcessorTestCase
 
 # pylint: enable=ungrouped-imports
@@ -733,3 +738,70 @@ class TestHyperscanResolverProcessorWithPatterns(BaseProcessorTestCase):
             r"'path': 'i/do/not/exist', 'pattern': 'bar'}' not found!",
         ):
             self._load_specific_rule(rule)
+
+    def _create_persistent_rule(self, resolve_list):
+        return HyperscanResolverRule._create_from_dict(
+            {
+                "filter": "to_resolve",
+                "hyperscan_resolver": {
+                    "field_mapping": {"to_resolve": "resolved"},
+                    "resolve_list": resolve_list,
+                    "store_db_persistent": True,
+                },
+            }
+        )
+
+    def _create_processor_with_db_path(self, db_path):
+        config = deepcopy(self.CONFIG)
+        config["hyperscan_db_path"] = str(db_path)
+        return Factory.create({"test instance": config})
+
+    def test_setup_compiles_databases_for_all_rules(self):
+        self.object._hyperscan_databases = {}
+        self.object.setup()
+        rules_with_resolve_list = [rule for rule in self.object.rules if rule.resolve_list]
+        for rule in rules_with_resolve_list:
+            assert rule.resolve_list_hash in self.object._hyperscan_databases
+
+    def test_persistent_database_is_stored_by_resolve_list_hash(self, tmp_path):
+        rule = self._create_persistent_rule({".*HELLO\\d": "Greeting"})
+        self.object = self._create_processor_with_db_path(tmp_path)
+        self._load_specific_rule(rule)
+        self.object.process({"to_resolve": "something HELLO1"})
+        assert (tmp_path / f"{rule.resolve_list_hash}.db").exists()
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_persistent_database_is_loaded_by_other_processor(self, tmp_path):
+        rule = self._create_persistent_rule({".*HELLO\\d": "Greeting", ".*BYE\\d": "Farewell"})
+        self.object = self._create_processor_with_db_path(tmp_path)
+        self._load_specific_rule(rule)
+        self.object.process({"to_resolve": "something HELLO1"})
+        self.object = self._create_processor_with_db_path(tmp_path)
+        self._load_specific_rule(rule)
+        with mock.patch.object(self.object, "_create_database") as mock_create_database:
+            document = {"to_resolve": "something BYE1"}
+            self.object.process(document)
+        mock_create_database.assert_not_called()
+        assert document == {"to_resolve": "something BYE1", "resolved": "Farewell"}
+
+    def test_changed_resolve_list_does_not_reuse_stale_database(self, tmp_path):
+        rule = self._create_persistent_rule({".*HELLO\\d": "Greeting"})
+        changed_rule = self._create_persistent_rule({".*BYE\\d": "Farewell"})
+        assert rule.resolve_list_hash != changed_rule.resolve_list_hash
+        self.object = self._create_processor_with_db_path(tmp_path)
+        self._load_specific_rule(rule)
+        self.object.process({"to_resolve": "something HELLO1"})
+        self.object = self._create_processor_with_db_path(tmp_path)
+        self._load_specific_rule(changed_rule)
+        document = {"to_resolve": "something BYE1"}
+        self.object.process(document)
+        assert document == {"to_resolve": "something BYE1", "resolved": "Farewell"}
+
+    def test_invalid_persistent_database_is_recompiled(self, tmp_path):
+        rule = self._create_persistent_rule({".*HELLO\\d": "Greeting"})
+        (tmp_path / f"{rule.resolve_list_hash}.db").write_bytes(b"not a hyperscan database")
+        self.object = self._create_processor_with_db_path(tmp_path)
+        self._load_specific_rule(rule)
+        document = {"to_resolve": "something HELLO1"}
+        self.object.process(document)
+        assert document == {"to_resolve": "something HELLO1", "resolved": "Greeting"}
@@ -1,8 +1,11 @@
 # pylint: disable=missing-docstring
 # pylint: disable=line-too-long
+# pylint: disable=protected-access
+from copy import deepcopy
 
 import pytest
 
+from logprep.factory import Factory
 from logprep.processor.base.exceptions import ProcessingWarning
 from tests.unit.processor.base import BaseProcessorTestCase
 
@@ -428,3 +431,50 @@ class TestIpInformer(BaseProcessorTestCase):
         assert len(result.warnings) == 1
         assert isinstance(result.warnings[0], ProcessingWarning)
         assert event == expected, testcase
+
+    def test_properties_are_cached_per_ip_and_properties(self):
+        rule = {
+            "filter": "ip",
+            "ip_informer": {"source_fields": ["ip"], "target_field": "result"},
+        }
+        self._load_specific_rule(rule)
+        for _ in range(3):
+            self.object.process({"ip": ["192.168.5.1", "127.0.0.1"]})
+        cache_info = self.object._get_ip_properties_cached.cache_info()
+        assert cache_info.misses == 2
+        assert cache_info.hits == 4
+
+    def test_cached_properties_are_not_shared_between_events(self):
+        rule = {
+            "filter": "ip",
+            "ip_informer": {
+                "source_fields": ["ip"],
+                "target_field": "result",
+                "properties": ["is_private"],
+            },
+        }
+        self._load_specific_rule(rule)
+        event = {"ip": "192.168.5.1"}
+        self.object.process(event)
+        event["result"]["192.168.5.1"]["is_private"] = "changed"
+        other_event = {"ip": "192.168.5.1"}
+        self.object.process(other_event)
+        assert other_event["result"] == {"192.168.5.1": {"is_private": True}}
+
+    def test_invalid_ips_are_not_cached(self):
+        rule = {
+            "filter": "ip",
+            "ip_informer": {"source_fields": ["ip"], "target_field": "result"},
+        }
+        self._load_specific_rule(rule)
+        for _ in range(2):
+            result = self.object.process({"ip": "not an ip"})
+            assert len(result.warnings) == 1
+        assert self.object._get_ip_properties_cached.cache_info().currsize == 0
+
+    def test_cache_can_be_disabled(self):
+        config = deepcopy(self.CONFIG)
+        config["max_cached_ips"] = 0
+        ip_informer = Factory.create({"ip_informer": config})
+        ip_informer.process({"ip": "192.168.5.1"})
+        assert ip_informer._get_ip_properties_cached.cache_info().currsize == 0
@@ -60,3 +60,22 @@ class TestIpInformerRule:
             for key, value in rule.get("ip_informer").items():
                 assert hasattr(rule_instance._config, key)
                 assert value == getattr(rule_instance._config, key)
+
+    @pytest.mark.parametrize(
+        "properties, expected",
+        [
+            (["default"], None),
+            (["default", "is_private"], None),
+            (["is_private", "version"], ("is_private", "version")),
+        ],
+    )
+    def test_property_names(self, properties, expected):
+        rule = {
+            "filter": "ip",
+            "ip_informer": {
+                "source_fields": ["ip"],
+                "target_field": "result",
+                "properties": properties,
+            },
+        }
+        assert IpInformerRule._create_from_dict(rule).property_names == expected
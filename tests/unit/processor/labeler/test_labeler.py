@@ -5,6 +5,7 @@
 # pylint: disable=wrong-import-position
 # pylint: disable=wrong-import-order
 import copy
+from unittest import mock
 
 import pytest
 from pytest import raises
@@ -232,6 +233,68 @@ class TestLabeler(BaseProcessorTestCase):
 
         assert document == expected
 
+    def test_process_merges_labels_of_multiple_rules_into_sorted_lists(self):
+        rules = [
+            {"filter": "applyrule", "labeler": {"label": {"reporter": ["windows"]}}},
+            {"filter": "applyrule", "labeler": {"label": {"reporter": ["client", "windows"]}}},
+            {"filter": "applyrule", "labeler": {"label": {"object": ["file"]}}},
+        ]
+        for rule in rules:
+            self._load_specific_rule(rule)
+        document = {"applyrule": "yes", "label": {"action": ["write", "execute"]}}
+        self.object.process(document)
+        assert document["label"] == {
+            "action": ["execute", "write"],
+            "reporter": ["client", "windows"],
+            "object": ["file"],
+        }
+
+    def test_process_sorts_labels_once_per_rule_tree(self):
+        rules = [
+            {"filter": "applyrule", "labeler": {"label": {"reporter": ["windows"]}}},
+            {"filter": "applyrule", "labeler": {"label": {"object": ["file"]}}},
+        ]
+        for rule in rules:
+            self.object._specific_tree.add_rule(LabelerRule._create_from_dict(rule))
+        with mock.patch.object(
+            self.object,
+            "_convert_label_categories_to_sorted_list",
+            wraps=self.object._convert_label_categories_to_sorted_list,
+        ) as mock_convert:
+            self.object.process({"applyrule": "yes"})
+        assert mock_convert.call_count == 2
+
+    def test_generic_rule_matches_label_of_specific_rule(self):
+        specific_rule = {"filter": "applyrule", "labeler": {"label": {"reporter": ["windows"]}}}
+        generic_rule = {
+            "filter": "label.reporter: windows",
+            "labeler": {"label": {"action": ["execute"]}},
+        }
+        self.object._specific_tree.add_rule(LabelerRule._create_from_dict(specific_rule))
+        self.object._generic_tree.add_rule(LabelerRule._create_from_dict(generic_rule))
+        document = {"applyrule": "yes"}
+        self.object.process(document)
+        assert document["label"] == {"reporter": ["windows"], "action": ["execute"]}
+
+    def test_rule_matches_label_of_previous_rule_if_applied_multiple_times(self):
+        config = copy.deepcopy(self.CONFIG)
+        config["apply_multiple_times"] = True
+        labeler = Factory.create({"test instance": config})
+        rules = [
+            {"filter": "applyrule", "labeler": {"label": {"reporter": ["windows"]}}},
+            {"filter": "label.reporter: windows", "labeler": {"label": {"action": ["execute"]}}},
+        ]
+        for rule in rules:
+            labeler._specific_tree.add_rule(LabelerRule._create_from_dict(rule))
+        document = {"applyrule": "yes"}
+        labeler.process(document)
+        assert document["label"] == {"reporter": ["windows"], "action": ["execute"]}
+
+    def test_process_does_not_touch_labels_if_no_rule_matched(self):
+        document = {"does_not": "match", "label": {"reporter": ["windows", "client"]}}
+        self.object.process(document)
+        assert document["label"] == {"reporter": ["windows", "client"]}
+
     def test_create_fails_when_include_parent_labels_is_not_boolean(self):
         config = copy.deepcopy(self.CONFIG)
         config["include_parent_labels"] = "this is a string"
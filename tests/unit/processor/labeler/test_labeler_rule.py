@@ -214,3 +214,16 @@ class TestRule:
         document = {"applyrule": None}
 
         assert rule.matches(document)
+
+    def test_label_sets_are_frozensets(self):
+        rule = LabelerRule._create_from_dict(
+            {"filter": "applyrule", "labeler": {"label": {"reporter": ["windows", "windows"]}}}
+        )
+        assert rule.label_sets == {"reporter": frozenset({"windows"})}
+
+    def test_label_sets_include_parent_labels(self):
+        rule = LabelerRule._create_from_dict(
+            {"filter": "applyrule", "labeler": {"label": {"reporter": ["windows"]}}}
+        )
+        rule.add_parent_labels_from_schema(MockLabelingSchema(True))
+        assert rule.label_sets == {"reporter": frozenset({"parent:windows", "windows"})}
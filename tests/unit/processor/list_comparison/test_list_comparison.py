@@ -1,8 +1,11 @@
 # pylint: disable=missing-docstring
 # pylint: disable=protected-access
+from copy import deepcopy
 
+import pytest
 import responses
 
+from logprep.abc.component import Component
 from logprep.factory import Factory
 from logprep.processor.base.exceptions import FieldExistsWarning
 from tests.unit.processor.base import BaseProcessorTestCase
@@ -280,3 +283,82 @@ Hans
         assert processor._specific_rules[0].compare_sets == {
             "bad_users.list": {"Franz", "Heinz", "Hans"}
         }
+
+    def test_rules_share_lists_with_same_path(self):
+        rules = self.object._specific_rules + self.object._generic_rules
+        compare_lists = [
+            compare_list for rule in rules for compare_list in rule.compare_lists.values()
+        ]
+        user_lists = [
+            compare_list
+            for compare_list in compare_lists
+            if compare_list.path.endswith("/user_list.txt")
+        ]
+        assert len(user_lists) > 1
+        assert all(compare_list is user_lists[0] for compare_list in user_lists)
+
+    def test_setup_schedules_list_refresh_if_configured(self):
+        config = deepcopy(self.CONFIG)
+        config["list_refresh_interval"] = 60
+        processor = Factory.create({"test instance": config})
+        job_count = len(Component._scheduler.jobs)
+        processor.setup()
+        assert len(Component._scheduler.jobs) == job_count + 1
+
+    @pytest.mark.parametrize("list_refresh_interval", [0, -1, "60"])
+    def test_invalid_list_refresh_interval_raises(self, list_refresh_interval):
+        config = deepcopy(self.CONFIG)
+        config["list_refresh_interval"] = list_refresh_interval
+        with pytest.raises((ValueError, TypeError)):
+            Factory.create({"test instance": config})
+
+    def test_setup_does_not_schedule_list_refresh_by_default(self):
+        job_count = len(Component._scheduler.jobs)
+        Factory.create({"test instance": self.CONFIG}).setup()
+        assert len(Component._scheduler.jobs) == job_count
+
+    def test_refresh_lists_replaces_changed_lists(self, tmp_path):
+        list_file = tmp_path / "users.txt"
+        list_file.write_text("Franz\n", encoding="utf8")
+        rule_dict = {
+            "filter": "user",
+            "list_comparison": {
+                "source_fields": ["user"],
+                "target_field": "user_results",
+                "list_file_paths": [str(list_file)],
+            },
+            "description": "",
+        }
+        self._load_specific_rule(rule_dict)
+        self.object.setup()
+        document = {"user": "Heinz"}
+        self.object.process(document)
+        assert document["user_results"] == {"not_in_list": ["users.txt"]}
+        list_file.write_text("Franz\nHeinz\n", encoding="utf8")
+        self.object._refresh_lists()
+        document = {"user": "Heinz"}
+        self.object.process(document)
+        assert document["user_results"] == {"in_list": ["users.txt"]}
+
+    def test_setup_reloads_lists_changed_since_previous_setup(self, tmp_path):
+        list_file = tmp_path / "users.txt"
+        list_file.write_text("Franz\n", encoding="utf8")
+        rule_dict = {
+            "filter": "user",
+            "list_comparison": {
+                "source_fields": ["user"],
+                "target_field": "user_results",
+                "list_file_paths": [str(list_file)],
+            },
+            "description": "",
+        }
+        self._load_specific_rule(rule_dict)
+        self.object.setup()
+        list_file.write_text("Franz\nHeinz\n", encoding="utf8")
+        processor = Factory.create({"test instance": self.CONFIG})
+        self.object = processor
+        self._load_specific_rule(rule_dict)
+        processor.setup()
+        document = {"user": "Heinz"}
+        processor.process(document)
+        assert document["user_results"] == {"in_list": ["users.txt"]}
@@ -0,0 +1,98 @@
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+import os
+import time
+from unittest import mock
+
+import pytest
+
+from logprep.processor.list_comparison.list_registry import ListRegistry
+
+
+@pytest.fixture(name="list_file")
+def fixture_list_file(tmp_path):
+    list_file = tmp_path / "list.txt"
+    list_file.write_text("# comment\nFranz\nHeinz\n", encoding="utf8")
+    return list_file
+
+
+class TestListRegistry:
+    def setup_method(self):
+        ListRegistry.clear()
+
+    def teardown_method(self):
+        ListRegistry.clear()
+
+    def test_get_loads_list_without_comments(self, list_file):
+        compare_list = ListRegistry.get(str(list_file))
+        assert compare_list.elements == frozenset({"Franz", "Heinz"})
+        assert compare_list.path == str(list_file)
+
+    def test_get_loads_list_only_once(self, list_file):
+        with mock.patch.object(ListRegistry, "_load", wraps=ListRegistry._load) as mock_load:
+            first_list = ListRegistry.get(str(list_file))
+            second_list = ListRegistry.get(str(list_file))
+        assert first_list is second_list
+        mock_load.assert_called_once()
+
+    def test_get_reloads_list_loaded_before_loaded_after(self, list_file):
+        compare_list = ListRegistry.get(str(list_file))
+        list_file.write_text("Hans\n", encoding="utf8")
+        assert ListRegistry.get(str(list_file)).elements == frozenset({"Franz", "Heinz"})
+        reloaded_list = ListRegistry.get(str(list_file), loaded_after=time.monotonic())
+        assert reloaded_list is compare_list
+        assert compare_list.elements == frozenset({"Hans"})
+        assert list(ListRegistry._elements_by_checksum.values()) == [frozenset({"Hans"})]
+
+    def test_get_does_not_reload_list_loaded_after_loaded_after(self, list_file):
+        loaded_after = time.monotonic()
+        ListRegistry.get(str(list_file), loaded_after)
+        with mock.patch.object(ListRegistry, "_load", wraps=ListRegistry._load) as mock_load:
+            ListRegistry.get(str(list_file), loaded_after)
+        mock_load.assert_not_called()
+
+    def test_lists_with_same_content_share_elements(self, list_file, tmp_path):
+        other_list_file = tmp_path / "other_list.txt"
+        other_list_file.write_bytes(list_file.read_bytes())
+        first_list = ListRegistry.get(str(list_file))
+        second_list = ListRegistry.get(str(other_list_file))
+        assert first_list is not second_list
+        assert first_list.elements is second_list.elements
+
+    def test_refresh_replaces_elements_of_changed_lists(self, list_file):
+        compare_list = ListRegistry.get(str(list_file))
+        list_file.write_text("Hans\n", encoding="utf8")
+        assert ListRegistry.refresh([str(list_file)]) == [str(list_file)]
+        assert compare_list.elements == frozenset({"Hans"})
+
+    def test_refresh_ignores_unchanged_lists(self, list_file):
+        compare_list = ListRegistry.get(str(list_file))
+        elements = compare_list.elements
+        assert not ListRegistry.refresh([str(list_file)])
+        assert compare_list.elements is elements
+
+    def test_refresh_does_not_read_unchanged_list_files(self, list_file):
+        ListRegistry.get(str(list_file))
+        with mock.patch.object(ListRegistry, "_load", wraps=ListRegistry._load) as mock_load:
+            assert not ListRegistry.refresh([str(list_file)])
+        mock_load.assert_not_called()
+
+    def test_refresh_reads_list_files_with_changed_modification_time(self, list_file):
+        compare_list = ListRegistry.get(str(list_file))
+        list_file.write_text("# comment\nFranz\nHansi\n", encoding="utf8")
+        stat = list_file.stat()
+        os.utime(list_file, ns=(stat.st_atime_ns, compare_list.file_state[0] + 1))
+        assert ListRegistry.refresh([str(list_file)]) == [str(list_file)]
+        assert compare_list.elements == frozenset({"Franz", "Hansi"})
+
+    def test_refresh_keeps_elements_if_list_can_not_be_loaded(self, list_file):
+        compare_list = ListRegistry.get(str(list_file))
+        list_file.unlink()
+        assert not ListRegistry.refresh([str(list_file)])
+        assert compare_list.elements == frozenset({"Franz", "Heinz"})
+
+    def test_refresh_removes_unused_elements(self, list_file):
+        ListRegistry.get(str(list_file))
+        list_file.write_text("Hans\n", encoding="utf8")
+        ListRegistry.refresh([str(list_file)])
+        assert list(ListRegistry._elements_by_checksum.values()) == [frozenset({"Hans"})]
@@ -2,7 +2,7 @@
 # pylint: disable=no-self-use
 # pylint: disable=protected-access
 # pylint: disable=wrong-import-position
-from ipaddress import IPv4Network
+from ipaddress import ip_network
 
 import pytest
 
@@ -10,8 +10,10 @@ pytest.importorskip("logprep.processor.pre_detector")
 
 from logprep.processor.pre_detector.rule import PreDetectorRule
 from logprep.processor.pre_detector.ip_alerter import IPAlerter
+from logprep.util.time import TimeParser
 
 IP_ALERTS_PATH = "tests/testdata/unit/pre_detector/alert_ips.yml"
+EXPIRED = TimeParser.from_string("1900-08-31T16:47+00:00")
 IP_ALERTS_PATHS_LIST = [
     "tests/testdata/unit/pre_detector/alert_ips_1.yml",
     "tests/testdata/unit/pre_detector/alert_ips_2.yml",
@@ -59,35 +61,30 @@ def fixture_rule_with_fields():
 class TestIPAlerter:
     def test_ip_alerter_initialization(self, ip_alerter):
         expected_alert_ips = {
-            "12.12.12.12": "2027-08-31T16:47+00:00",
+            "12.12.12.12": TimeParser.from_string("2027-08-31T16:47+00:00"),
             "13.12.12.13": None,
-            "27.0.0.1": "2077-08-31T16:47+00:00",
-            "127.0.0.0/8": "2077-08-31T16:47+00:00",
-            "127.0.0.1": "2077-08-31T16:47+00:00",
+            "27.0.0.1": TimeParser.from_string("2077-08-31T16:47+00:00"),
+            "127.0.0.0/8": TimeParser.from_string("2077-08-31T16:47+00:00"),
+            "127.0.0.1": TimeParser.from_string("2077-08-31T16:47+00:00"),
         }
-        expected_single_alert_ips = {"27.0.0.1", "13.12.12.13", "127.0.0.1", "12.12.12.12"}
-        expected_alert_networks = {IPv4Network("127.0.0.0/8")}
-
-        assert ip_alerter._alert_ips_map == expected_alert_ips
-        assert ip_alerter._single_alert_ips == expected_single_alert_ips
-        assert ip_alerter._alert_network == expected_alert_networks
-
-    def test_ip_alerter_initialization_from_multiple_files(self):
-        expected_alert_ips = {
-            "12.12.12.12": "2027-08-31T16:47+00:00",
-            "13.12.12.13": None,
-            "27.0.0.1": "2077-08-31T16:47+00:00",
-            "127.0.0.0/8": "2077-08-31T16:47+00:00",
-            "127.0.0.1": "2077-08-31T16:47+00:00",
-        }
-        expected_single_alert_ips = {"27.0.0.1", "13.12.12.13", "127.0.0.1", "12.12.12.12"}
-        expected_alert_networks = {IPv4Network("127.0.0.0/8")}
-
-        ip_alerter = IPAlerter(IP_ALERTS_PATHS_LIST)
-
-        assert ip_alerter._alert_ips_map == expected_alert_ips
-        assert ip_alerter._single_alert_ips == expected_single_alert_ips
-        assert ip_alerter._alert_network == expected_alert_networks
+        assert len(ip_alerter._alert_networks) == len(expected_alert_ips)
+        for alert_ip, expiration_date in expected_alert_ips.items():
+            network, value = ip_alerter._alert_networks.longest_match(alert_ip.split("/")[0])
+            assert network == ip_network(alert_ip)
+            assert value == expiration_date
+
+    def test_ip_alerter_initialization_from_multiple_files(self, ip_alerter):
+        ip_alerter_from_multiple_files = IPAlerter(IP_ALERTS_PATHS_LIST)
+        assert len(ip_alerter_from_multiple_files._alert_networks) == len(
+            ip_alerter._alert_networks
+        )
+        for alert_ip in ("12.12.12.12", "13.12.12.13", "27.0.0.1", "127.0.0.1", "127.1.1.1"):
+            assert ip_alerter_from_multiple_files._alert_networks.longest_match(
+                alert_ip
+            ) == ip_alerter._alert_networks.longest_match(alert_ip)
+
+    def test_ip_alerter_ignores_expired_alert_ips(self, ip_alerter):
+        assert ip_alerter._alert_networks.longest_match("13.12.12.12") is None
 
     def test_ip_alerter_has_no_fields_fails(self, ip_alerter, rule_without_fields):
         assert not ip_alerter.has_ip_fields(rule_without_fields)
@@ -118,19 +115,33 @@ class TestIPAlerter:
 
     def test_time_single_exceeded_fails(self, ip_alerter, rule_with_fields):
         event = {"ip_field": "12.12.12.12"}
-        ip_alerter._alert_ips_map["12.12.12.12"] = "1900-08-31T16:47+00:00"
+        ip_alerter._alert_networks.add("12.12.12.12", EXPIRED)
         assert not ip_alerter.is_in_alerts_list(rule_with_fields, event)
 
     def test_time_single_and_network_exceeded_fails(self, ip_alerter, rule_with_fields):
         event = {"ip_field": "127.0.0.1"}
-        ip_alerter._alert_ips_map["127.0.0.1"] = "1900-08-31T16:47+00:00"
+        ip_alerter._alert_networks.add("127.0.0.1", EXPIRED)
         assert not ip_alerter.is_in_alerts_list(rule_with_fields, event)
 
     def test_time_network_exceeded_fails(self, ip_alerter, rule_with_fields):
         event = {"ip_field": "127.0.1.1"}
-        ip_alerter._alert_ips_map["127.0.0.0/8"] = "1900-08-31T16:47+00:00"
+        ip_alerter._alert_networks.add("127.0.0.0/8", EXPIRED)
         assert not ip_alerter.is_in_alerts_list(rule_with_fields, event)
 
     def test_field_does_not_exist(self, ip_alerter, rule_with_fields):
         event = {}
         assert not ip_alerter.is_in_alerts_list(rule_with_fields, event)
+
+    def test_ip_is_in_alerts_ipv6_network_succeeds(self, ip_alerter, rule_with_fields):
+        ip_alerter._alert_networks.add("2001:db8::/32", None)
+        event = {"ip_field": "2001:0db8:0000::1"}
+        assert ip_alerter.is_in_alerts_list(rule_with_fields, event)
+
+    def test_invalid_ip_is_not_in_alerts(self, ip_alerter, rule_with_fields):
+        event = {"ip_field": "not an ip"}
+        assert not ip_alerter.is_in_alerts_list(rule_with_fields, event)
+
+    def test_most_specific_network_determines_expiration(self, ip_alerter, rule_with_fields):
+        ip_alerter._alert_networks.add("127.0.0.0/16", EXPIRED)
+        assert not ip_alerter.is_in_alerts_list(rule_with_fields, {"ip_field": "127.0.1.1"})
+        assert ip_alerter.is_in_alerts_list(rule_with_fields, {"ip_field": "127.1.1.1"})
@@ -2,9 +2,12 @@
 # pylint: disable=protected-access
 import re
 from copy import deepcopy
+from unittest import mock
 
 import pytest
 
+from logprep.abc.component import Component
+from logprep.factory import Factory
 from tests.unit.processor.base import BaseProcessorTestCase
 
 
@@ -465,3 +468,164 @@ class TestPreDetector(BaseProcessorTestCase):
         assert "tags" in document
         assert "_pre_detector_failure" in document["tags"]
         assert "_pre_detector_timeparsing_failure" in document["tags"]
+
+    def test_creation_timestamp_is_only_computed_once_per_event(self):
+        document = {"winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}}}
+        with mock.patch("logprep.processor.pre_detector.processor.TimeParser.now") as mock_now:
+            self.object.process(document)
+        mock_now.assert_called_once()
+
+    def test_detections_do_not_share_rule_detection_data(self):
+        first_document = {"winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}}}
+        second_document = {"winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}}}
+        first_detection = self.object.process(first_document).data[0][0]
+        second_detection = self.object.process(second_document).data[0][0]
+        assert first_detection is not second_detection
+        assert first_detection["pre_detection_id"] == first_document["pre_detection_id"]
+        assert second_detection["pre_detection_id"] == second_document["pre_detection_id"]
+
+    def _create_aggregating_processor(self, **config):
+        config = {**self.CONFIG, "aggregation_window": 60, **config}
+        self.object = Factory.create({"aggregating pre_detector": config})
+        self.object.setup()
+        rule = {
+            "filter": "winlog.event_id: 123",
+            "pre_detector": {
+                "id": "RULE_ONE_ID",
+                "title": "RULE_ONE",
+                "severity": "critical",
+                "mitre": [],
+                "case_condition": "directly",
+            },
+            "description": "Test rule one",
+        }
+        self._load_specific_rule(rule)
+        return self.object
+
+    def test_aggregates_detections_within_window(self):
+        processor = self._create_aggregating_processor()
+        documents = [
+            {"winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}}}
+            for _ in range(3)
+        ]
+        with mock.patch("time.time", return_value=1000):
+            results = [processor.process(document) for document in documents]
+        assert [len(result.data) for result in results] == [1, 0, 0]
+        first_detection = results[0].data[0][0]
+        assert "aggregation" not in first_detection
+        assert len({document["pre_detection_id"] for document in documents}) == 1
+        with mock.patch("time.time", return_value=1059):
+            processor._close_expired_aggregations()
+        assert not processor.flush_extra_data()
+        with mock.patch("time.time", return_value=1060):
+            processor._close_expired_aggregations()
+        extra_data = processor.flush_extra_data()
+        assert len(extra_data) == 1
+        detection, outputs = extra_data[0]
+        assert outputs == ({"kafka": "pre_detector_alerts"},)
+        assert detection["id"] == "RULE_ONE_ID"
+        assert detection["pre_detection_id"] == documents[0]["pre_detection_id"]
+        assert detection["aggregation"]["count"] == 3
+        assert detection["aggregation"]["window"] == 60
+        assert "aggregation" not in first_detection
+        assert not processor.flush_extra_data()
+
+    def test_closed_window_without_further_detections_writes_no_summary(self):
+        processor = self._create_aggregating_processor()
+        with mock.patch("time.time", return_value=1000):
+            result = processor.process(
+                {"winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}}}
+            )
+        assert len(result.data) == 1
+        with mock.patch("time.time", return_value=1060):
+            processor._close_expired_aggregations()
+        assert not processor._aggregated_detections
+        assert not processor.flush_extra_data()
+
+    def test_setup_schedules_closing_of_aggregation_windows(self):
+        job_count = len(Component._scheduler.jobs)
+        self._create_aggregating_processor()
+        assert len(Component._scheduler.jobs) == job_count + 1
+
+    def test_final_flush_returns_summaries_of_open_windows(self):
+        processor = self._create_aggregating_processor()
+        with mock.patch("time.time", return_value=1000):
+            for _ in range(2):
+                processor.process(
+                    {"winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}}}
+                )
+        assert not processor.flush_extra_data()
+        extra_data = processor.flush_extra_data(final=True)
+        assert [detection["aggregation"]["count"] for detection, _ in extra_data] == [2]
+        assert not processor._aggregated_detections
+
+    def test_aggregation_window_starts_again_after_window_closed(self):
+        processor = self._create_aggregating_processor()
+        first_document = {"winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}}}
+        with mock.patch("time.time", return_value=1000):
+            processor.process(first_document)
+        document = {"winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}}}
+        with mock.patch("time.time", return_value=1060):
+            result = processor.process(document)
+        assert len(result.data) == 1
+        assert result.data[0][0]["pre_detection_id"] == document["pre_detection_id"]
+        assert document["pre_detection_id"] != first_document["pre_detection_id"]
+        assert len(processor._aggregated_detections) == 1
+
+    def test_aggregates_detections_by_key_fields(self):
+        processor = self._create_aggregating_processor(aggregation_key_fields=["host.name"])
+        with mock.patch("time.time", return_value=1000):
+            results = [
+                processor.process(
+                    {
+                        "winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}},
+                        "host": {"name": host},
+                    }
+                )
+                for host in ("first", "second", "first", "first")
+            ]
+        assert [len(result.data) for result in results] == [1, 1, 0, 0]
+        extra_data = processor.flush_extra_data(final=True)
+        assert [detection["aggregation"]["count"] for detection, _ in extra_data] == [3]
+        assert extra_data[0][0]["host"] == {"name": "first"}
+
+    def test_aggregation_records_creation_timestamps(self):
+        processor = self._create_aggregating_processor()
+        creation_timestamps = ["2024-01-01T00:00:00+00:00", "2024-01-01T00:00:30+00:00"]
+        with mock.patch("time.time", return_value=1000):
+            for creation_timestamp in creation_timestamps:
+                with mock.patch(
+                    "logprep.processor.pre_detector.processor.TimeParser.now"
+                ) as mock_now:
+                    mock_now.return_value.isoformat.return_value = creation_timestamp
+                    processor.process(
+                        {
+                            "@timestamp": "2019-07-30T14:37:42.861Z",
+                            "winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}},
+                        }
+                    )
+        aggregation = processor.flush_extra_data(final=True)[0][0]["aggregation"]
+        assert aggregation["first_timestamp"] == creation_timestamps[0]
+        assert aggregation["last_timestamp"] == creation_timestamps[1]
+
+    def test_event_with_pre_detection_id_of_other_rule_is_not_aggregated(self):
+        processor = self._create_aggregating_processor()
+        with mock.patch("time.time", return_value=1000):
+            processor.process(
+                {"winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}}}
+            )
+            document = {
+                "winlog": {"event_id": 123, "event_data": {"ServiceName": "VERY BAD"}},
+                "pre_detection_id": "other-detection",
+            }
+            result = processor.process(document)
+        assert len(result.data) == 1
+        assert result.data[0][0]["pre_detection_id"] == "other-detection"
+        assert document["pre_detection_id"] == "other-detection"
+        assert processor._aggregated_detections[("RULE_ONE_ID",)]["count"] == 1
+
+    @pytest.mark.parametrize("aggregation_window", [0, -1, "60"])
+    def test_invalid_aggregation_window_raises(self, aggregation_window):
+        config = {**self.CONFIG, "aggregation_window": aggregation_window}
+        with pytest.raises((ValueError, TypeError)):
+            Factory.create({"aggregating pre_detector": config})
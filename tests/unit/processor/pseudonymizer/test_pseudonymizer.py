@@ -6,8 +6,10 @@
 import re
 from copy import deepcopy
 from pathlib import Path
+from unittest import mock
 
 import pytest
+import responses
 
 from logprep.abc.processor import ProcessorResult
 from logprep.factory import Factory
@@ -774,6 +776,18 @@ class TestPseudonymizer(BaseProcessorTestCase):
             "tests/testdata/mock_external/tld_list.dat",
         )
 
+    @responses.activate
+    def test_setup_downloads_tld_list_to_shared_artifact_cache(self, tmp_path):
+        tld_list_url = "http://db-path-target/tld_list.dat"
+        responses.add(responses.GET, tld_list_url, Path(REL_TLD_LIST_PATH).read_bytes())
+        config = deepcopy(self.CONFIG)
+        config["tld_lists"] = [tld_list_url]
+        with mock.patch("logprep.util.artifacts.ARTIFACT_CACHE_DIR", tmp_path):
+            self.object = Factory.create({"pseudonymizer": config})
+            self.object.setup()
+        assert self.object._tld_extractor.suffix_list_urls[0].startswith(f"file://{tmp_path}")
+        assert len(responses.calls) == 1
+
     def _load_specific_rule(self, rule):
         config = deepcopy(self.CONFIG)
         config["regex_mapping"] = self.regex_mapping
@@ -1,11 +1,16 @@
 # pylint: disable=missing-docstring
+# pylint: disable=protected-access
+import json
 import re
+from copy import deepcopy
+from unittest import mock
 
 import pytest
 import responses
 from requests import ConnectTimeout, HTTPError
 from responses import matchers
 
+from logprep.factory import Factory
 from tests.unit.processor.base import BaseProcessorTestCase
 
 test_cases = [
@@ -354,3 +359,129 @@ class TestRequester(BaseProcessorTestCase):
         assert len(result.warnings) == 1
         assert re.match(error_message, str(result.warnings[0]))
         assert event == expected, testcase
+
+    def _create_caching_requester(self, rule, **config):
+        config = deepcopy(self.CONFIG) | {"response_cache_ttl": 60} | config
+        self.object = Factory.create({"caching requester": config})
+        self._load_specific_rule(rule)
+        return self.object
+
+    @responses.activate
+    def test_requests_are_sent_with_one_session(self):
+        responses.add(responses.GET, "http://mock-mock/")
+        rule = {"filter": "message", "requester": {"url": "http://mock-mock/", "method": "GET"}}
+        self._load_specific_rule(rule)
+        with mock.patch.object(
+            self.object._session, "request", wraps=self.object._session.request
+        ) as mock_request:
+            self.object.process({"message": "the message"})
+            self.object.process({"message": "the message"})
+        assert mock_request.call_count == 2
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_responses_are_not_cached_by_default(self):
+        responses.add(responses.GET, "http://mock-mock/", json={"foo": "bar"})
+        rule = {
+            "filter": "message",
+            "requester": {"url": "http://mock-mock/", "method": "GET", "target_field": "result"},
+        }
+        self._load_specific_rule(rule)
+        self.object.process({"message": "the message"})
+        self.object.process({"message": "the message"})
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_identical_requests_are_answered_from_cache(self):
+        responses.add(responses.GET, "http://mock-mock/first", json={"foo": "first"})
+        responses.add(responses.GET, "http://mock-mock/second", json={"foo": "second"})
+        rule = {
+            "filter": "path",
+            "requester": {
+                "url": "http://mock-mock/${path}",
+                "method": "GET",
+                "target_field": "result",
+            },
+        }
+        requester = self._create_caching_requester(rule)
+        documents = [{"path": path} for path in ("first", "second", "first", "second")]
+        for document in documents:
+            requester.process(document)
+        assert len(responses.calls) == 2
+        assert [document["result"] for document in documents] == [
+            {"foo": "first"},
+            {"foo": "second"},
+            {"foo": "first"},
+            {"foo": "second"},
+        ]
+        assert documents[0]["result"] is not documents[2]["result"]
+
+    @responses.activate
+    def test_cached_responses_expire(self):
+        responses.add(responses.GET, "http://mock-mock/", json={"foo": "bar"})
+        rule = {
+            "filter": "message",
+            "requester": {"url": "http://mock-mock/", "method": "GET", "target_field": "result"},
+        }
+        requester = self._create_caching_requester(rule)
+        with mock.patch("time.monotonic", return_value=1000):
+            requester.process({"message": "the message"})
+        with mock.patch("time.monotonic", return_value=1059):
+            requester.process({"message": "the message"})
+        assert len(responses.calls) == 1
+        with mock.patch("time.monotonic", return_value=1060):
+            requester.process({"message": "the message"})
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_failed_requests_are_not_cached(self):
+        responses.add(responses.GET, "http://mock-mock/", status=500)
+        rule = {"filter": "message", "requester": {"url": "http://mock-mock/", "method": "GET"}}
+        requester = self._create_caching_requester(rule)
+        requester.process({"message": "the message"})
+        requester.process({"message": "the message"})
+        assert len(responses.calls) == 2
+
+    @pytest.mark.parametrize("method", ["POST", "PUT", "PATCH", "DELETE", "OPTIONS"])
+    @responses.activate
+    def test_responses_of_non_cacheable_methods_are_not_cached(self, method):
+        responses.add(method, "http://mock-mock/")
+        rule = {"filter": "message", "requester": {"url": "http://mock-mock/", "method": method}}
+        requester = self._create_caching_requester(rule)
+        requester.process({"message": "the message"})
+        requester.process({"message": "the message"})
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_cookies_are_not_sent_with_later_requests(self):
+        responses.add(responses.GET, "http://mock-mock/", headers={"Set-Cookie": "session=abc"})
+        rule = {"filter": "message", "requester": {"url": "http://mock-mock/", "method": "GET"}}
+        self._load_specific_rule(rule)
+        self.object.process({"message": "the message"})
+        self.object.process({"message": "the message"})
+        assert len(responses.calls) == 2
+        assert "Cookie" not in responses.calls[1].request.headers
+        assert not self.object._session.cookies
+
+    @responses.activate
+    def test_templating_does_not_change_rule(self):
+        responses.add(responses.POST, "http://mock-mock/")
+        rule = {
+            "filter": "message",
+            "requester": {
+                "url": "http://mock-mock/",
+                "method": "POST",
+                "json": {"message": "${message}"},
+            },
+        }
+        self._load_specific_rule(rule)
+        self.object.process({"message": "first"})
+        self.object.process({"message": "second"})
+        assert json.loads(responses.calls[1].request.body) == {"message": "second"}
+        assert self.object.rules[0].kwargs["json"] == {"message": "${message}"}
+
+    @pytest.mark.parametrize("response_cache_ttl", [0, -1, "foo"])
+    def test_invalid_response_cache_ttl_raises(self, response_cache_ttl):
+        config = deepcopy(self.CONFIG) | {"response_cache_ttl": response_cache_ttl}
+        with pytest.raises((ValueError, TypeError)):
+            Factory.create({"caching requester": config})
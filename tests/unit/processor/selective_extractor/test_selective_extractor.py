@@ -180,3 +180,38 @@ class TestSelectiveExtractor(BaseProcessorTestCase):
         }
         self.object.process(document)
         assert document == expected
+
+    def test_process_extracts_nested_fields_into_shared_parents(self):
+        rule = {
+            "filter": "message",
+            "selective_extractor": {
+                "source_fields": ["other.message", "other.id", "message", "not.exists"],
+                "outputs": [{"opensearch": "index"}],
+            },
+        }
+        self._load_specific_rule(rule)
+        document = {"message": "test_message", "other": {"message": "value", "id": 1, "x": 2}}
+        result = self.object.process(document)
+        assert result.data == [
+            (
+                {"message": "test_message", "other": {"id": 1, "message": "value"}},
+                ({"opensearch": "index"},),
+            )
+        ]
+
+    def test_process_extracts_parent_field_only_once_if_subfields_are_extracted_too(self):
+        rule = {
+            "filter": "message",
+            "selective_extractor": {
+                "source_fields": ["other.message", "other", "message"],
+                "outputs": [{"opensearch": "index"}],
+            },
+        }
+        self._load_specific_rule(rule)
+        document = {"message": "test_message", "other": {"message": "value", "id": 1}}
+        result = self.object.process(document)
+        extracted_event, _ = result.data[0]
+        assert extracted_event == {
+            "message": "test_message",
+            "other": {"message": "value", "id": 1},
+        }
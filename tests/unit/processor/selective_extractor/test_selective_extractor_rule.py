@@ -304,3 +304,20 @@ class TestSelectiveExtractorRule:
     def test_rule_is_hashable(self, specific_rule_definition):
         rule = SelectiveExtractorRule._create_from_dict(specific_rule_definition)
         assert isinstance(rule, Hashable)
+
+    def test_extraction_projection_omits_subfields_of_extracted_fields(self):
+        rule = SelectiveExtractorRule._create_from_dict(
+            {
+                "filter": "message",
+                "selective_extractor": {
+                    "source_fields": ["message", "other.message", "other", "other.x.y", "a.b"],
+                    "outputs": [{"kafka": "topic"}],
+                },
+            }
+        )
+        assert rule.source_fields == ["a.b", "message", "other", "other.message", "other.x.y"]
+        assert rule.extraction_projection == (
+            (0, ("a",), "b"),
+            (1, (), "message"),
+            (2, (), "other"),
+        )
@@ -6,6 +6,18 @@ import pytest
 from tests.unit.processor.base import BaseProcessorTestCase
 
 test_cases = [  # testcase, rule, event, expected
+    (
+        "Time difference between timestamp without year and timestamp of year 1900",
+        {
+            "filter": "field1 AND field2",
+            "timestamp_differ": {
+                "diff": "${field2:%d.%m. %H:%M} - ${field1}",
+                "target_field": "time_diff",
+            },
+        },
+        {"field1": "1900-01-04 10:11:00", "field2": "05.01. 10:11"},
+        {"field1": "1900-01-04 10:11:00", "field2": "05.01. 10:11", "time_diff": "86400.0"},
+    ),
     (
         "Time difference between two timestamps",
         {
@@ -0,0 +1,228 @@
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+import hashlib
+import os
+from pathlib import Path
+from unittest import mock
+from zipfile import ZipFile
+
+import pytest
+import responses
+from responses import matchers
+
+from logprep.util.artifacts import get_artifact, get_artifact_member
+
+
+@pytest.fixture(name="cache_dir", autouse=True)
+def fixture_cache_dir(tmp_path):
+    cache_dir = tmp_path / "artifacts"
+    with mock.patch("logprep.util.artifacts.ARTIFACT_CACHE_DIR", cache_dir):
+        yield cache_dir
+
+
+@pytest.fixture(name="revalidation_interval", autouse=True)
+def fixture_revalidation_interval():
+    with mock.patch("logprep.util.artifacts.ARTIFACT_REVALIDATION_INTERVAL", 0):
+        yield
+
+
+class TestGetArtifact:
+    def test_returns_local_files_without_copying(self, cache_dir):
+        assert get_artifact("tests/testdata/unit/amides/model.zip") == Path(
+            "tests/testdata/unit/amides/model.zip"
+        )
+        assert get_artifact("file://tests/testdata/unit/amides/model.zip") == Path(
+            "tests/testdata/unit/amides/model.zip"
+        )
+        assert not cache_dir.exists()
+
+    @responses.activate
+    def test_not_modified_artifact_is_not_downloaded_again(self):
+        responses.add(
+            responses.GET, "http://artifact.server/list.dat", b"content", headers={"ETag": '"v1"'}
+        )
+        first_path = get_artifact("http://artifact.server/list.dat")
+        responses.replace(
+            responses.GET,
+            "http://artifact.server/list.dat",
+            status=304,
+            match=[matchers.header_matcher({"If-None-Match": '"v1"'})],
+        )
+        second_path = get_artifact("http://artifact.server/list.dat")
+        assert first_path == second_path
+        assert second_path.read_bytes() == b"content"
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_modified_artifact_is_downloaded_again(self):
+        responses.add(
+            responses.GET, "http://artifact.server/list.dat", b"old", headers={"ETag": '"v1"'}
+        )
+        get_artifact("http://artifact.server/list.dat")
+        responses.replace(
+            responses.GET,
+            "http://artifact.server/list.dat",
+            b"new",
+            headers={"ETag": '"v2"'},
+            match=[matchers.header_matcher({"If-None-Match": '"v1"'})],
+        )
+        assert get_artifact("http://artifact.server/list.dat").read_bytes() == b"new"
+        responses.replace(
+            responses.GET,
+            "http://artifact.server/list.dat",
+            status=304,
+            match=[matchers.header_matcher({"If-None-Match": '"v2"'})],
+        )
+        assert get_artifact("http://artifact.server/list.dat").read_bytes() == b"new"
+
+    @responses.activate
+    def test_artifact_is_revalidated_with_last_modified(self):
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        responses.add(
+            responses.GET,
+            "http://artifact.server/list.dat",
+            b"content",
+            headers={"Last-Modified": last_modified},
+        )
+        get_artifact("http://artifact.server/list.dat")
+        responses.replace(
+            responses.GET,
+            "http://artifact.server/list.dat",
+            status=304,
+            match=[matchers.header_matcher({"If-Modified-Since": last_modified})],
+        )
+        assert get_artifact("http://artifact.server/list.dat").read_bytes() == b"content"
+
+    @responses.activate
+    def test_artifact_without_cache_validators_is_downloaded_again(self):
+        responses.add(responses.GET, "http://artifact.server/list.dat", b"old")
+        get_artifact("http://artifact.server/list.dat")
+        responses.replace(responses.GET, "http://artifact.server/list.dat", b"new")
+        assert get_artifact("http://artifact.server/list.dat").read_bytes() == b"new"
+        assert "If-None-Match" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_different_uris_do_not_share_artifacts(self):
+        responses.add(responses.GET, "http://artifact.server/first.dat", b"first")
+        responses.add(responses.GET, "http://artifact.server/second.dat", b"second")
+        first_path = get_artifact("http://artifact.server/first.dat")
+        second_path = get_artifact("http://artifact.server/second.dat")
+        assert first_path != second_path
+        assert second_path.read_bytes() == b"second"
+
+    @responses.activate
+    def test_cached_artifact_is_read_only(self):
+        responses.add(responses.GET, "http://artifact.server/list.dat", b"content")
+        artifact_path = get_artifact("http://artifact.server/list.dat")
+        assert artifact_path.stat().st_mode & 0o777 == 0o444
+
+    @responses.activate
+    def test_changed_artifact_is_downloaded_again_without_condition(self):
+        responses.add(
+            responses.GET, "http://artifact.server/list.dat", b"content", headers={"ETag": '"v1"'}
+        )
+        artifact_path = get_artifact("http://artifact.server/list.dat")
+        artifact_path.chmod(0o644)
+        artifact_path.write_bytes(b"corrupted")
+        artifact_path = get_artifact("http://artifact.server/list.dat")
+        assert artifact_path.read_bytes() == b"content"
+        assert "If-None-Match" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_artifact_without_metadata_is_downloaded_again_without_condition(self):
+        responses.add(
+            responses.GET, "http://artifact.server/list.dat", b"content", headers={"ETag": '"v1"'}
+        )
+        artifact_path = get_artifact("http://artifact.server/list.dat")
+        artifact_path.with_name(f"{artifact_path.name}.json").unlink()
+        get_artifact("http://artifact.server/list.dat")
+        assert "If-None-Match" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_cached_artifact_is_not_hashed_on_revalidation(self):
+        responses.add(
+            responses.GET, "http://artifact.server/list.dat", b"content", headers={"ETag": '"v1"'}
+        )
+        get_artifact("http://artifact.server/list.dat")
+        responses.replace(responses.GET, "http://artifact.server/list.dat", status=304)
+        with mock.patch("hashlib.sha256", wraps=hashlib.sha256) as mock_sha256:
+            get_artifact("http://artifact.server/list.dat")
+        assert mock_sha256.call_count == 1
+
+    @responses.activate
+    def test_recently_validated_artifact_is_not_revalidated(self):
+        responses.add(
+            responses.GET, "http://artifact.server/list.dat", b"content", headers={"ETag": '"v1"'}
+        )
+        with mock.patch("logprep.util.artifacts.ARTIFACT_REVALIDATION_INTERVAL", 60):
+            first_path = get_artifact("http://artifact.server/list.dat")
+            assert get_artifact("http://artifact.server/list.dat") == first_path
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_not_modified_artifact_is_not_revalidated_again_within_interval(self):
+        responses.add(
+            responses.GET, "http://artifact.server/list.dat", b"content", headers={"ETag": '"v1"'}
+        )
+        get_artifact("http://artifact.server/list.dat")
+        responses.replace(responses.GET, "http://artifact.server/list.dat", status=304)
+        get_artifact("http://artifact.server/list.dat")
+        with mock.patch("logprep.util.artifacts.ARTIFACT_REVALIDATION_INTERVAL", 60):
+            get_artifact("http://artifact.server/list.dat")
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_cached_artifact_is_used_if_server_is_not_reachable(self):
+        responses.add(
+            responses.GET, "http://artifact.server/list.dat", b"content", headers={"ETag": '"v1"'}
+        )
+        get_artifact("http://artifact.server/list.dat")
+        responses.replace(
+            responses.GET, "http://artifact.server/list.dat", body=ConnectionError("unreachable")
+        )
+        with mock.patch("logging.Logger.warning") as mock_warning:
+            artifact_path = get_artifact("http://artifact.server/list.dat")
+        assert artifact_path.read_bytes() == b"content"
+        mock_warning.assert_called()
+
+    @responses.activate
+    def test_raises_if_server_is_not_reachable_and_artifact_is_not_cached(self):
+        responses.add(
+            responses.GET, "http://artifact.server/list.dat", body=ConnectionError("unreachable")
+        )
+        with pytest.raises(ConnectionError, match="unreachable"):
+            get_artifact("http://artifact.server/list.dat")
+
+
+class TestGetArtifactMember:
+    def test_extracts_member_once(self, tmp_path):
+        archive = tmp_path / "archive.zip"
+        with ZipFile(archive, mode="w") as zip_file:
+            zip_file.writestr("model", b"model content")
+        member_path = get_artifact_member(str(archive), "model")
+        assert member_path.read_bytes() == b"model content"
+        with mock.patch("logprep.util.artifacts.ZipFile") as mock_zip_file:
+            assert get_artifact_member(str(archive), "model") == member_path
+        mock_zip_file.assert_not_called()
+
+    def test_changed_archive_is_extracted_again(self, tmp_path):
+        archive = tmp_path / "archive.zip"
+        with ZipFile(archive, mode="w") as zip_file:
+            zip_file.writestr("model", b"old model")
+        get_artifact_member(str(archive), "model")
+        with ZipFile(archive, mode="w") as zip_file:
+            zip_file.writestr("model", b"new model")
+        os.utime(archive, ns=(0, archive.stat().st_mtime_ns + 1))
+        assert get_artifact_member(str(archive), "model").read_bytes() == b"new model"
+
+    def test_changed_archive_replaces_previous_extraction(self, tmp_path, cache_dir):
+        archive = tmp_path / "archive.zip"
+        with ZipFile(archive, mode="w") as zip_file:
+            zip_file.writestr("model", b"old model")
+        old_member_path = get_artifact_member(str(archive), "model")
+        cached_files = sorted(cache_dir.iterdir())
+        with ZipFile(archive, mode="w") as zip_file:
+            zip_file.writestr("model", b"new model")
+        os.utime(archive, ns=(0, archive.stat().st_mtime_ns + 1))
+        assert get_artifact_member(str(archive), "model") == old_member_path
+        assert sorted(cache_dir.iterdir()) == cached_files
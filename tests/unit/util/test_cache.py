@@ -3,10 +3,11 @@
 import datetime
 import time
 from collections import OrderedDict
+from unittest import mock
 
 import pytest
 
-from logprep.util.cache import Cache
+from logprep.util.cache import Cache, TTLCache
 
 
 @pytest.fixture(name="cache")
@@ -47,3 +48,31 @@ class TestCache:
             assert cache.requires_storing(i)
             assert len(cache) == min(i + 1, cache._max_items)
         assert set(cache.keys()) == set(range(extra_items, cache._max_items + extra_items))
+
+
+class TestTTLCache:
+    def test_lookup_returns_none_for_unknown_key(self):
+        assert TTLCache().lookup("foo") is None
+
+    def test_lookup_returns_stored_value(self):
+        cache = TTLCache()
+        cache.store("foo", "bar")
+        assert cache.lookup("foo") == "bar"
+
+    def test_values_expire_after_ttl(self):
+        cache = TTLCache(ttl=10)
+        with mock.patch("time.monotonic", return_value=100):
+            cache.store("foo", "bar")
+        with mock.patch("time.monotonic", return_value=109.9):
+            assert cache.lookup("foo") == "bar"
+        with mock.patch("time.monotonic", return_value=110):
+            assert cache.lookup("foo") is None
+        assert "foo" not in cache
+
+    def test_least_recently_used_values_are_evicted(self):
+        cache = TTLCache(max_items=2)
+        cache.store("first", 1)
+        cache.store("second", 2)
+        cache.lookup("first")
+        cache.store("third", 3)
+        assert set(cache.keys()) == {"first", "third"}
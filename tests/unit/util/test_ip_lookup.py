@@ -0,0 +1,63 @@
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+from ipaddress import ip_network
+
+import pytest
+
+from logprep.util.ip_lookup import IPNetworkLookup
+
+
+@pytest.fixture(name="lookup")
+def fixture_lookup():
+    lookup = IPNetworkLookup()
+    lookup.add("10.0.0.0/8", "private")
+    lookup.add("10.1.0.0/16", "datacenter")
+    lookup.add("10.1.2.3", "host")
+    lookup.add("2001:db8::/32", "documentation")
+    lookup.add("::1", "loopback")
+    return lookup
+
+
+class TestIPNetworkLookup:
+    @pytest.mark.parametrize(
+        "ip_string, expected",
+        [
+            ("10.1.2.3", ("10.1.2.3/32", "host")),
+            ("10.1.2.4", ("10.1.0.0/16", "datacenter")),
+            ("10.2.0.1", ("10.0.0.0/8", "private")),
+            ("2001:db8::1", ("2001:db8::/32", "documentation")),
+            ("2001:0db8:0000:0000::ffff", ("2001:db8::/32", "documentation")),
+            ("::1", ("::1/128", "loopback")),
+        ],
+    )
+    def test_longest_match_returns_most_specific_network(self, lookup, ip_string, expected):
+        network, value = lookup.longest_match(ip_string)
+        assert (network, value) == (ip_network(expected[0]), expected[1])
+
+    @pytest.mark.parametrize("ip_string", ["11.0.0.1", "2001:db9::1", "not an ip", "", None, 42])
+    def test_longest_match_returns_none_without_match(self, lookup, ip_string):
+        assert lookup.longest_match(ip_string) is None
+
+    def test_ipv4_and_ipv6_do_not_overlap(self):
+        lookup = IPNetworkLookup()
+        lookup.add("0.0.0.0/0", "all ipv4")
+        assert lookup.longest_match("::1") is None
+        assert lookup.longest_match("1.2.3.4") == (ip_network("0.0.0.0/0"), "all ipv4")
+
+    def test_add_overwrites_existing_network(self, lookup):
+        lookup.add("10.0.0.0/8", "overwritten")
+        assert lookup.longest_match("10.2.0.1")[1] == "overwritten"
+        assert len(lookup) == 5
+
+    def test_add_raises_for_invalid_network(self, lookup):
+        with pytest.raises(ValueError):
+            lookup.add("10.0.0.1/8")
+
+    def test_contains(self, lookup):
+        assert "10.9.9.9" in lookup
+        assert "11.9.9.9" not in lookup
+
+    def test_none_values_are_matches(self):
+        lookup = IPNetworkLookup()
+        lookup.add("192.168.0.0/24")
+        assert lookup.longest_match("192.168.0.7") == (ip_network("192.168.0.0/24"), None)
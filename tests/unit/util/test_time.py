@@ -2,11 +2,12 @@
 # pylint: disable=protected-access
 # pylint: disable=too-many-arguments
 from datetime import datetime
+from unittest import mock
 from zoneinfo import ZoneInfo
 
 import pytest
 
-from logprep.util.time import TimeParser
+from logprep.util.time import TimeParser, TimeParserException, TimestampParser
 
 
 class TestTimeParser:
@@ -168,3 +169,97 @@ class TestTimeParser:
         assert timestamp.tzinfo.tzname(timestamp) == expected_timezone_name
         for attribute, value in expected.items():
             assert getattr(timestamp, attribute) == value
+
+
+class TestTimestampParser:
+    @pytest.mark.parametrize(
+        "timestamp, source_format",
+        [
+            ("2024-01-05 10:11:12", "%Y-%m-%d %H:%M:%S"),
+            ("2024-1-5 10:11:12", "%Y-%m-%d %H:%M:%S"),
+            ("2024-01-05 10:11:12.123", "%Y-%m-%d %H:%M:%S.%f"),
+            ("2024-01-05T10:11:12.123456", "%Y-%m-%dT%H:%M:%S.%f"),
+            ("05.01.2024", "%d.%m.%Y"),
+            ("2024-07-05 10:11", "%Y-%m-%d %H:%M"),
+            ("2024-07-05 10:11:12 +0200", "%Y-%m-%d %H:%M:%S %z"),
+            ("2024-07-05T10:11:12+02:00", "ISO8601"),
+            ("1720174272", "UNIX"),
+            ("1720174272123", "UNIX"),
+        ],
+    )
+    def test_normalize_is_equal_to_time_parser(self, timestamp, source_format):
+        source_timezone = ZoneInfo("Europe/Berlin")
+        target_timezone = ZoneInfo("America/New_York")
+        parser = TimestampParser([source_format], source_timezone, target_timezone)
+        expected = TimeParser.parse_datetime(timestamp, source_format, source_timezone)
+        expected = expected.astimezone(target_timezone).isoformat()
+        assert parser.normalize(timestamp) == expected
+
+    def test_normalize_replaces_utc_offset(self):
+        parser = TimestampParser(["ISO8601"])
+        assert parser.normalize("2024-07-05T10:11:12+00:00") == "2024-07-05T10:11:12Z"
+
+    @pytest.mark.parametrize(
+        "source_format, has_fast_path",
+        [
+            ("%Y-%m-%d %H:%M:%S", True),
+            ("%Y-%m-%dT%H:%M:%S.%f", True),
+            ("%d.%m.%Y", True),
+            ("%Y-%m-%d %H:%M:%S %z", False),
+            ("%b %d %H:%M:%S", False),
+            ("%Y-%m-%d %Y", False),
+            ("ISO8601", False),
+        ],
+    )
+    def test_fast_paths_are_only_compiled_for_fixed_numeric_formats(
+        self, source_format, has_fast_path
+    ):
+        parser = TimestampParser([source_format])
+        assert (source_format in parser._fast_paths) == has_fast_path
+
+    def test_fast_path_does_not_use_strptime(self):
+        parser = TimestampParser(["%Y-%m-%d %H:%M:%S"])
+        with mock.patch("logprep.util.time.TimeParser.parse_datetime") as mock_parse_datetime:
+            parser.normalize("2024-01-05 10:11:12")
+        mock_parse_datetime.assert_not_called()
+
+    @pytest.mark.parametrize("timestamp", ["2024-13-05 10:11:12", "2024-01-05 10:11:12 foo"])
+    def test_invalid_timestamps_raise(self, timestamp):
+        parser = TimestampParser(["%Y-%m-%d %H:%M:%S"])
+        with pytest.raises(TimeParserException):
+            parser.normalize(timestamp)
+
+    def test_raises_if_no_format_matches(self):
+        parser = TimestampParser(["%Y-%m-%d", "%d.%m.%Y"])
+        with pytest.raises(TimeParserException, match="with any source format"):
+            parser.parse("2024/01/05")
+
+    def test_ambiguous_timestamps_are_parsed_with_first_matching_format(self):
+        parser = TimestampParser(["%d/%m/%Y", "%m/%d/%Y"])
+        assert parser.parse("13/01/2024").month == 1
+        assert parser.parse("01/13/2024").month == 1
+        assert parser.parse("05/01/2024").month == 1
+        assert parser._source_formats == ["%d/%m/%Y", "%m/%d/%Y"]
+
+    def test_normalized_timestamps_are_cached(self):
+        parser = TimestampParser(["ISO8601"])
+        parser.normalize("2024-01-05T10:11:12Z")
+        with mock.patch.object(TimestampParser, "parse") as mock_parse:
+            assert parser.normalize("2024-01-05T10:11:12Z") == "2024-01-05T10:11:12Z"
+        mock_parse.assert_not_called()
+
+    def test_cache_is_bounded(self):
+        parser = TimestampParser(["UNIX"], max_cached_timestamps=2)
+        for timestamp in ("1", "2", "3"):
+            parser.normalize(timestamp)
+        assert list(parser._cache) == ["2", "3"]
+
+    def test_timestamps_without_year_are_not_cached(self):
+        parser = TimestampParser(["%d.%m. %H:%M"])
+        parser.normalize("05.01. 10:11")
+        assert not parser._cache
+
+    def test_timestamps_without_year_keep_year_1900_if_missing_year_is_not_set(self):
+        parser = TimestampParser(["%d.%m. %H:%M"], set_missing_year=False)
+        assert parser.normalize("05.01. 10:11") == "1900-01-05T10:11:00Z"
+        assert parser._cache
@@ -0,0 +1,49 @@
+# pylint: disable=missing-docstring
+# pylint: disable=protected-access
+from unittest import mock
+
+import pytest
+
+from logprep.util import tld
+from logprep.util.tld import TLDExtractor, get_tld_extractor
+
+
+@pytest.fixture(name="suffix_list_url")
+def fixture_suffix_list_url(tmp_path):
+    suffix_list = tmp_path / "suffix_list.dat"
+    suffix_list.write_text("de\nuk\nco.uk\n", encoding="utf8")
+    return f"file://{suffix_list.absolute().as_posix()}"
+
+
+class TestTLDExtractor:
+    def test_extracts_subdomain_domain_and_suffix(self, suffix_list_url):
+        extractor = TLDExtractor([suffix_list_url])
+        result = extractor("http://www.sub.example.co.uk/path")
+        assert (result.subdomain, result.domain, result.suffix) == ("www.sub", "example", "co.uk")
+
+    def test_caches_extraction_results(self, suffix_list_url):
+        extractor = TLDExtractor([suffix_list_url])
+        first = extractor("www.example.de")
+        second = extractor("www.example.de")
+        assert first is second
+        assert extractor.cache_info().hits == 1
+        assert extractor.cache_info().misses == 1
+
+    def test_cache_is_bounded(self, suffix_list_url):
+        extractor = TLDExtractor([suffix_list_url], max_cached_extractions=2)
+        for hostname in ("a.de", "b.de", "c.de"):
+            extractor(hostname)
+        assert extractor.cache_info().currsize == 2
+
+    def test_suffix_list_urls_are_those_of_tldextract(self, suffix_list_url):
+        assert TLDExtractor([suffix_list_url]).suffix_list_urls == (suffix_list_url,)
+
+
+class TestGetTLDExtractor:
+    def test_returns_same_extractor_for_same_suffix_lists(self, suffix_list_url):
+        with mock.patch.dict(tld._extractors, clear=True):
+            assert get_tld_extractor([suffix_list_url]) is get_tld_extractor((suffix_list_url,))
+
+    def test_returns_different_extractors_for_different_suffix_lists(self, suffix_list_url):
+        with mock.patch.dict(tld._extractors, clear=True):
+            assert get_tld_extractor([suffix_list_url]) is not get_tld_extractor()